@@ -0,0 +1,105 @@
+"""
+Import-time benchmark of the SDK.
+
+Imports pysisense in fresh interpreters and reports the wall time of the import, the slowest
+modules (from python -X importtime) and whether any deferred heavy dependency was loaded.
+Exits with status 1 if a deferred dependency is imported eagerly or the import exceeds --max-ms,
+so it can guard startup time in CI.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 20 --max-ms 300
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Dependencies only needed by some features, which 'import pysisense' must not load
+DEFERRED_MODULES = ['pandas', 'aiohttp']
+
+TIMING_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import pysisense
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(name for name in {deferred!r} if name in sys.modules))
+"""
+
+
+def run_python(code, *options):
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')]))}
+    return subprocess.run([sys.executable, *options, '-c', code], capture_output=True, text=True, env=env, check=True)
+
+
+def measure_import(repeat):
+    """
+    Imports pysisense in fresh interpreters.
+
+    Parameters:
+        repeat (int): Number of interpreters to start.
+
+    Returns:
+        tuple: The import times in seconds, and the deferred modules that were loaded.
+    """
+    times = []
+    loaded = set()
+    for _ in range(repeat):
+        lines = run_python(TIMING_SNIPPET.format(deferred=DEFERRED_MODULES)).stdout.splitlines()
+        times.append(float(lines[0]))
+        loaded.update(name for name in lines[1].split(',') if name)
+    return times, sorted(loaded)
+
+
+def slowest_modules(limit):
+    """
+    Returns the modules with the highest cumulative import time, from python -X importtime.
+
+    Parameters:
+        limit (int): Number of modules to return.
+
+    Returns:
+        list: Tuples (cumulative microseconds, module name), slowest first.
+    """
+    stderr = run_python('import pysisense', '-X', 'importtime').stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((int(cumulative), name.rstrip()))
+    modules.sort(reverse=True)
+    return modules[:limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of pysisense.")
+    parser.add_argument('--repeat', type=int, default=10, help="Number of fresh interpreters to time.")
+    parser.add_argument('--top', type=int, default=10, help="Number of slowest modules to list.")
+    parser.add_argument('--max-ms', type=float, help="Fail if the median import time exceeds this many milliseconds.")
+    args = parser.parse_args(argv)
+
+    times, loaded = measure_import(args.repeat)
+    median_ms = statistics.median(times) * 1000
+    print(f"import pysisense: best {min(times) * 1000:.1f}ms, median {median_ms:.1f}ms ({args.repeat} runs)")
+
+    print(f"\n{'cumulative':>12}  module")
+    for cumulative, name in slowest_modules(args.top):
+        print(f"{cumulative / 1000:>10.1f}ms  {name}")
+
+    failed = False
+    if loaded:
+        print(f"\nFAIL: deferred dependencies imported eagerly: {', '.join(loaded)}")
+        failed = True
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"\nFAIL: median import time {median_ms:.1f}ms exceeds {args.max_ms:.1f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
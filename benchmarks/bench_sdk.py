@@ -0,0 +1,221 @@
+"""
+Benchmarks of the SDK's hot paths against a local MockSisense server.
+
+Each benchmark reports the number of requests issued, response bytes transferred (after compression),
+wall time (best and mean of the timed repeats) and peak Python memory (from one extra
+run under tracemalloc, so tracing overhead does not distort the timings).
+
+Usage:
+    python benchmarks/bench_sdk.py                       # all benchmarks, default data size
+    python benchmarks/bench_sdk.py -k users --users 50000
+    python benchmarks/bench_sdk.py --save baseline.json
+    python benchmarks/bench_sdk.py --compare baseline.json
+    python benchmarks/bench_sdk.py -k migrate --profile profiles/   # speedscope profile per benchmark
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pysisense import APIClient, AccessManagement, DataModel, Dashboard, Migration, convert_to_dataframe  # noqa: E402
+from pysisense.profiling import Profiler  # noqa: E402
+from pysisense.testing import MockSisense  # noqa: E402
+
+
+# Config sections applied to every benchmark client: measure the SDK, not client-side throttling
+CLIENT_CONFIG = {'rate_limit': {'enabled': False}}
+
+
+class BenchmarkContext:
+
+    def __init__(self, args, workdir):
+        """
+        Starts the source and target mock servers and the SDK objects shared by all benchmarks.
+
+        Parameters:
+            args (argparse.Namespace): Parsed command line arguments.
+            workdir (str): Directory for the generated config files.
+        """
+        sizes = dict(users=args.users, groups=args.groups, dashboards=args.dashboards, datamodels=args.datamodels,
+                     latency=args.latency, seed=args.seed, compression=not args.no_compression)
+        self.source = MockSisense(**sizes).start()
+        self.target = MockSisense(**{**sizes, 'seed': args.seed + 1}).start()
+        self.servers = [self.source, self.target]
+
+        source_yaml = self.source.write_config(os.path.join(workdir, 'source.yaml'), **CLIENT_CONFIG)
+        target_yaml = self.target.write_config(os.path.join(workdir, 'target.yaml'), **CLIENT_CONFIG)
+
+        self.client = APIClient(source_yaml)
+        self.access_mgmt = AccessManagement(self.client)
+        self.datamodel = DataModel(self.client)
+        self.dashboard = Dashboard(self.client)
+        self.migration = Migration(source_yaml, target_yaml)
+        self.clients = [self.client, self.migration.source_client, self.migration.target_client]
+
+        self.datamodel_name = self.source.datamodels[0]['title']
+        self.dashboard_name = self.source.dashboards[0]['title']
+        self.users_all = None
+
+
+    def reset(self):
+        # Every run starts cold: no cached directory lists or responses, no counted traffic
+        for client in self.clients:
+            client.directory.invalidate()
+            if client.http_cache:
+                client.http_cache.invalidate()
+        for server in self.servers:
+            server.reset_stats()
+
+
+    def close(self):
+        self.migration.close()
+        self.client.close()
+        for server in self.servers:
+            server.stop()
+
+
+def bench_convert_to_dataframe(ctx):
+    if ctx.users_all is None:
+        ctx.users_all = ctx.access_mgmt.get_users_all()
+    # Reset after the one-off fetch, so only the conversion is measured
+    for server in ctx.servers:
+        server.reset_stats()
+    return lambda: convert_to_dataframe(ctx.users_all)
+
+
+BENCHMARKS = {
+    'get_users_all': lambda ctx: ctx.access_mgmt.get_users_all,
+    'users_per_group_all': lambda ctx: ctx.access_mgmt.users_per_group_all,
+    'get_all_dashboard_shares': lambda ctx: ctx.access_mgmt.get_all_dashboard_shares,
+    'get_unused_columns': lambda ctx: lambda: ctx.access_mgmt.get_unused_columns(ctx.datamodel_name),
+    'get_dashboard_columns': lambda ctx: lambda: ctx.dashboard.get_dashboard_columns(ctx.dashboard_name),
+    'describe_datamodel': lambda ctx: lambda: ctx.datamodel.describe_datamodel(ctx.datamodel_name),
+    'get_row_count': lambda ctx: lambda: ctx.datamodel.get_row_count(ctx.datamodel_name),
+    'convert_to_dataframe': bench_convert_to_dataframe,
+    'migrate_all_dashboards': lambda ctx: ctx.migration.migrate_all_dashboards,
+    'migrate_all_datamodels': lambda ctx: ctx.migration.migrate_all_datamodels,
+}
+
+
+def run_benchmark(ctx, setup, repeat, profile_path=None):
+    """
+    Runs one benchmark and collects its metrics.
+
+    Parameters:
+        ctx (BenchmarkContext): The shared servers and SDK objects.
+        setup (callable): Takes the context and returns the zero-argument function to measure.
+        repeat (int): Number of timed runs.
+        profile_path (str, optional): If set, one extra run is profiled and written there as a speedscope profile.
+
+    Returns:
+        dict: requests, bytes, best and mean wall time (seconds), and peak memory (bytes) of one run.
+    """
+    times = []
+    for _ in range(repeat):
+        ctx.reset()
+        func = setup(ctx)
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    requests = sum(sum(server.request_counts.values()) for server in ctx.servers)
+    transferred = sum(server.bytes_sent for server in ctx.servers)
+
+    ctx.reset()
+    func = setup(ctx)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if profile_path:
+        ctx.reset()
+        func = setup(ctx)
+        with Profiler() as profiler:
+            func()
+        profiler.write_speedscope(profile_path)
+
+    return {
+        'requests': requests,
+        'bytes': transferred,
+        'best_s': min(times),
+        'mean_s': statistics.mean(times),
+        'peak_bytes': peak
+    }
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def print_results(results, baseline=None):
+    header = f"{'benchmark':<26}{'requests':>10}{'transferred':>13}{'best':>10}{'mean':>10}{'peak mem':>11}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, result in results.items():
+        line = (f"{name:<26}{result['requests']:>10}{format_bytes(result['bytes']):>13}"
+                f"{result['best_s'] * 1000:>8.1f}ms{result['mean_s'] * 1000:>8.1f}ms{format_bytes(result['peak_bytes']):>11}")
+        if baseline and name in baseline:
+            change = result['best_s'] / baseline[name]['best_s'] - 1 if baseline[name]['best_s'] else 0
+            line += f"{change:>+10.0%}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pysisense against a local MockSisense server.")
+    parser.add_argument('-k', dest='select', default='', help="Only run benchmarks whose name contains this string.")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of timed runs per benchmark.")
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--groups', type=int, default=100)
+    parser.add_argument('--dashboards', type=int, default=500)
+    parser.add_argument('--datamodels', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every mock response.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-compression', action='store_true', help="Serve uncompressed responses.")
+    parser.add_argument('--save', help="Write the results to this JSON file.")
+    parser.add_argument('--compare', help="Compare the best wall times with a JSON file written by --save.")
+    parser.add_argument('--profile', help="Directory for a speedscope profile (<benchmark>.speedscope.json) of each benchmark.")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        ctx = BenchmarkContext(args, workdir)
+        try:
+            for name, setup in BENCHMARKS.items():
+                if args.select in name:
+                    profile_path = os.path.join(args.profile, f"{name}.speedscope.json") if args.profile else None
+                    results[name] = run_benchmark(ctx, setup, args.repeat, profile_path)
+        finally:
+            ctx.close()
+
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -93,8 +93,8 @@ migration_results = migration.migrate_all_dashboards(
     republish=True,                                                             # Republishes dashboards after migration
     migrate_share=True,                                                         # Migrate shares for the dashboards
     change_ownership=True,                                                      # Change ownership of dashboards (requires migrate_share=True)
-    batch_size=10,                                                              # Process 10 dashboards at a time
-    sleep_time=10                                                               # Wait for 10 seconds between processing each batch
+    # batch_size=10,                                                            # Fixed batches of 10 dashboards; by default batches are sized by payload and import latency
+    queue_size=20                                                               # Exports pause while 20 exported dashboards await import
 )
 print(json.dumps(migration_results, indent=4))
 
@@ -183,6 +183,7 @@ dependencies = ["dataSecurity", "formulas"]
 shares = True                                                                   # Migrate shares along with the data models
 batch_size = 10                                                                 # Process 5 data models per batch
 sleep_time = 10                                                                 # Wait 10 seconds between batches
+max_workers = 4                                                                 # Migrate 4 data models of each batch in parallel
 
 
 migration_summary = migration.migrate_all_datamodels(
@@ -190,6 +191,7 @@ migration_summary = migration.migrate_all_datamodels(
     shares=shares,
     batch_size=batch_size,
     sleep_time=sleep_time,
+    max_workers=max_workers,
     action="overwrite",                                                         # Options: "overwrite", "duplicate". For "duplicate", a new model is created in the target with the same name as the source model, but with " (Duplicate)" appended to it.
 )
 print(json.dumps(migration_summary, indent=4))
\ No newline at end of file
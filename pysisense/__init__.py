@@ -6,12 +6,30 @@ from .access_management import AccessManagement
 from .datamodel import DataModel
 from .dashboard import Dashboard
 from .migration import Migration
+from .checkpoint import CheckpointJournal
+
+# Request instrumentation
+from .metrics import RequestInfo, RequestMetrics
+from .profiling import Profiler
+
+# Logging
+from .log_handler import flush_logs
+
+# Asyncio variants (require the optional 'aiohttp' dependency at instantiation time).
+# They are imported on first access, so 'import pysisense' does not pay for importing aiohttp.
+_LAZY_EXPORTS = {
+    "AsyncAPIClient": ".async_api_client",
+    "AsyncAccessManagement": ".async_sdk",
+    "AsyncDataModel": ".async_sdk",
+    "AsyncDashboard": ".async_sdk"
+}
 
 # Utilities
 from .utils import (
     convert_to_dataframe,
     export_to_csv,
-    convert_utc_to_local
+    convert_utc_to_local,
+    LogPayload
 )
 
 __all__ = [
@@ -21,7 +39,30 @@ __all__ = [
     "DataModel",
     "Dashboard",
     "Migration",
+    "CheckpointJournal",
+    "RequestInfo",
+    "RequestMetrics",
+    "Profiler",
+    "flush_logs",
+    "AsyncAPIClient",
+    "AsyncAccessManagement",
+    "AsyncDataModel",
+    "AsyncDashboard",
     "convert_to_dataframe",
     "export_to_csv",
-    "convert_utc_to_local"
+    "convert_utc_to_local",
+    "LogPayload"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
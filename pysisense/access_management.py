@@ -1,5 +1,23 @@
-from .api_client import APIClient
+from .api_client import APIClient, format_fields
+from .profiling import profile_public_methods
+from .utils import LogPayload
 
+
+# Mapping of internal role names to the names shown in the UI
+ROLE_MAPPING = {
+    'consumer': 'viewer',
+    'super': 'sysAdmin',
+    'contributor': 'dashboardDesigner'
+}
+
+# Fields of /api/v1/users needed to build a user record
+USER_FIELDS = '_id,userName,firstName,lastName,email,active,role,groups'
+
+# get_users() resolves up to this many names with one server-filtered request each; larger batches read the whole directory
+SERVER_LOOKUP_MAX_USERS = 10
+
+
+@profile_public_methods
 class AccessManagement:
 
     def __init__(self, api_client=None, debug=False):
@@ -23,18 +41,20 @@ class AccessManagement:
         """
         Retrieves user details by their email (username) and expands the response to include group and role information.
 
+        The lookup is filtered on the server by email and projected to the returned fields,
+        so only the matching user is transferred instead of the whole user list.
+
         Parameters:
             user_name (str): The email or username of the user to be retrieved.
 
         Returns:
             dict: A dictionary containing user details on success, or {'error': 'message'} on failure or if user not found.
         """
-        self.logger.debug(f"Getting user with username: {user_name}")
+        self.logger.debug("Getting user with username: %s", user_name)
 
-        # Query parameters to expand the response with group and role information
-        params = {'expand': 'groups,role'}
+        # Filter by email on the server and only return the fields used below
+        params = {'email': user_name, 'expand': 'groups,role', 'fields': USER_FIELDS}
 
-        # Fetch all users from the API with the specified query parameters
         response = self.api_client.get("/api/v1/users", params=params)
 
         # Check if the API request failed
@@ -46,35 +66,17 @@ class AccessManagement:
         # Parse the response JSON
         try:
             users = response.json()
-            self.logger.debug(f"Found {len(users)} users in the response.")
+            self.logger.debug("Found %s users in the response.", len(users))
         except Exception as e:
             self.logger.exception("Error decoding JSON response for user list.")
             return {"error": "Failed to decode API response."}
 
-        # Mapping role names
-        ROLE_MAPPING = {
-            'consumer': 'viewer',
-            'super': 'sysAdmin',
-            'contributor': 'dashboardDesigner'
-        }
-
-        # Iterate over each user in the response to find the one matching the given username
+        # The server filter is not guaranteed to be an exact match, so confirm the email
         for user in users:
             try:
-                self.logger.debug(f"Checking user: {user.get('email')}")
                 if user.get("email") == user_name:
                     self.logger.info(f"Found user: {user_name}")
-                    return {
-                        'USER_ID': user["_id"],
-                        'USER_NAME': user["userName"],
-                        'FIRST_NAME': user["firstName"],
-                        'LAST_NAME': user.get('lastName', ''),
-                        'EMAIL': user["email"],
-                        'IS_ACTIVE': user["active"],
-                        'ROLE_ID': user["role"]["_id"],
-                        'ROLE_NAME': ROLE_MAPPING.get(user["role"]["name"], user["role"]["name"]),
-                        'GROUPS': [g["name"] for g in user.get("groups", [])]
-                    }
+                    return self._format_user(user)
             except Exception as e:
                 self.logger.exception(f"Error processing user object: {user}")
 
@@ -82,7 +84,79 @@ class AccessManagement:
         return {"error": f"User '{user_name}' not found."}
 
 
-    def get_users_all(self):
+    def get_users(self, user_names):
+        """
+        Retrieves the details of several users by their email (username).
+
+        A few names (up to SERVER_LOOKUP_MAX_USERS) are resolved with one server-filtered get_user() request each,
+        unless the users list is already cached. Larger batches read the users list once through the client's
+        directory cache and index it by email, so resolving many names costs a single request instead of one per name.
+
+        Parameters:
+            user_names (list): The emails or usernames of the users to be retrieved.
+
+        Returns:
+            dict: Mapping of each requested name to its user details (same format as get_user),
+                or to {'error': 'message'} if the user was not found or retrieval failed.
+        """
+        self.logger.debug("Getting %s users by username", len(user_names))
+
+        unique_names = list(dict.fromkeys(user_names))
+        if len(unique_names) <= SERVER_LOOKUP_MAX_USERS and not self.api_client.directory.has_users(expand='groups,role', fields=USER_FIELDS):
+            # Downloading the whole directory is not worth it for a handful of principals
+            result = {user_name: self.get_user(user_name) for user_name in unique_names}
+            self.logger.info(f"Resolved {sum(1 for u in result.values() if 'error' not in u)}/{len(result)} users.")
+            return result
+
+        users = self.api_client.directory.get_users(expand='groups,role', fields=USER_FIELDS)
+        if users is None:
+            error_msg = "Failed to retrieve users from API."
+            self.logger.error(error_msg)
+            return {user_name: {"error": error_msg} for user_name in user_names}
+
+        users_by_email = {user.get("email"): user for user in users if user.get("email")}
+
+        result = {}
+        for user_name in user_names:
+            user = users_by_email.get(user_name)
+            if user is None:
+                self.logger.warning(f"User with username '{user_name}' not found.")
+                result[user_name] = {"error": f"User '{user_name}' not found."}
+                continue
+            try:
+                result[user_name] = self._format_user(user)
+            except Exception as e:
+                self.logger.exception(f"Error processing user object: {user}")
+                result[user_name] = {"error": f"Failed to process user '{user_name}'."}
+
+        self.logger.info(f"Resolved {sum(1 for u in result.values() if 'error' not in u)}/{len(result)} users.")
+        return result
+
+
+    def _format_user(self, user):
+        """
+        Converts a user object expanded with groups and role into the flat format returned by get_user.
+
+        Parameters:
+            user (dict): User object as returned by /api/v1/users?expand=groups,role.
+
+        Returns:
+            dict: Flattened user details.
+        """
+        return {
+            'USER_ID': user["_id"],
+            'USER_NAME': user["userName"],
+            'FIRST_NAME': user["firstName"],
+            'LAST_NAME': user.get('lastName', ''),
+            'EMAIL': user["email"],
+            'IS_ACTIVE': user["active"],
+            'ROLE_ID': user["role"]["_id"],
+            'ROLE_NAME': ROLE_MAPPING.get(user["role"]["name"], user["role"]["name"]),
+            'GROUPS': [g["name"] for g in user.get("groups", [])]
+        }
+
+
+    def get_users_all(self, fields=None):
         """
         Retrieves user details along with tenant, group, and role information.
 
@@ -90,7 +164,8 @@ class AccessManagement:
         but keeps the "Everyone" group if it's the only group the user belongs to.
 
         Parameters:
-            None
+            fields (str or list, optional): User fields to request from the API, e.g. ["email", "role"].
+                Defaults to the fields of the returned records. Record values whose field was not requested are None.
 
         Returns:
             list: A list of dictionaries where each dictionary contains user details and group information,
@@ -98,67 +173,62 @@ class AccessManagement:
         """
         self.logger.debug("Getting all users")
 
-        # Query parameters to expand the response with group and role information
-        params = {'expand': 'groups,role'}
+        # Fetch user data expanded with group and role information; without the directory cache
+        # the users are streamed, so only the processed records are kept in memory
+        try:
+            response_data = self.api_client.directory.iter_users(expand='groups,role',
+                                                                 fields=format_fields(fields) or USER_FIELDS)
+        except ValueError:
+            self.logger.exception("Failed to parse user response JSON.")
+            return [{"error": "Failed to parse user response"}]
 
-        # Fetch user data from the API with the specified query parameters
-        response = self.api_client.get("/api/v1/users", params=params)
-        
         # Check if the API request failed
-        if not response or not response.ok:
+        if response_data is None:
             self.logger.error("Failed to retrieve users from API")
             return [{"error": "Failed to retrieve users from API"}]
 
-        try:
-            response_data = response.json()
-        except Exception as e:
-            self.logger.exception("Failed to parse user response JSON.")
-            return [{"error": "Failed to parse user response"}]
-
         # Initialize list to store user information
         data_list = []
 
-        # Mapping role names
-        ROLE_MAPPING = {
-            'consumer': 'viewer',
-            'super': 'sysAdmin',
-            'contributor': 'dashboardDesigner'
-        }
-
-        # Process the API response to build data_list
-        for user in response_data:
-            try:
-                self.logger.debug(f"Processing user: {user['email']}")
-
-                # Base data that applies to each user
-                base_data = {
-                    'USER_ID': user["_id"],
-                    'USER_NAME': user["userName"],
-                    'FIRST_NAME': user["firstName"],
-                    'LAST_NAME': user.get('lastName', ''),
-                    'EMAIL': user["email"],
-                    'IS_ACTIVE': user["active"],
-                    'ROLE_ID': user["role"]["_id"],
-                    'ROLE_NAME': ROLE_MAPPING.get(user["role"]["name"], user["role"]["name"]),
-                    'GROUPS': []
-                }
+        # Process the API response to build data_list; a streamed response is parsed while iterating
+        try:
+            for user in response_data:
+                try:
+                    self.logger.debug("Processing user: %s", user.get('email'))
+
+                    # Base data that applies to each user; fields left out of the projection stay None
+                    role = user.get("role") or {}
+                    base_data = {
+                        'USER_ID': user.get("_id"),
+                        'USER_NAME': user.get("userName"),
+                        'FIRST_NAME': user.get("firstName"),
+                        'LAST_NAME': user.get('lastName', ''),
+                        'EMAIL': user.get("email"),
+                        'IS_ACTIVE': user.get("active"),
+                        'ROLE_ID': role.get("_id"),
+                        'ROLE_NAME': ROLE_MAPPING.get(role.get("name"), role.get("name")),
+                        'GROUPS': []
+                    }
 
-                # Add all group names to the 'GROUPS' list
-                if 'groups' in user and user["groups"]:
-                    base_data['GROUPS'] = [group["name"] for group in user["groups"]]
+                    # Add all group names to the 'GROUPS' list
+                    if 'groups' in user and user["groups"]:
+                        base_data['GROUPS'] = [group["name"] for group in user["groups"]]
 
-                # Process users with multiple groups
-                if len(base_data['GROUPS']) > 1 and 'Everyone' in base_data['GROUPS']:
-                    # Remove "Everyone" from the list if the user belongs to other groups
-                    base_data['GROUPS'].remove('Everyone')
+                    # Process users with multiple groups
+                    if len(base_data['GROUPS']) > 1 and 'Everyone' in base_data['GROUPS']:
+                        # Remove "Everyone" from the list if the user belongs to other groups
+                        base_data['GROUPS'].remove('Everyone')
 
-                # Add the processed user to the data_list
-                data_list.append(base_data)
+                    # Add the processed user to the data_list
+                    data_list.append(base_data)
 
-                self.logger.debug(f"Successfully processed user: {user['email']}")
+                    self.logger.debug("Successfully processed user: %s", user.get('email'))
 
-            except Exception as e:
-                self.logger.exception(f"Error processing user {user.get('email', 'Unknown')}")
+                except Exception as e:
+                    self.logger.exception(f"Error processing user {user.get('email', 'Unknown')}")
+        except ValueError:
+            self.logger.exception("Failed to parse user response JSON.")
+            return [{"error": "Failed to parse user response"}]
 
         # Log the result and return the final data list
         if data_list:
@@ -181,7 +251,7 @@ class AccessManagement:
             dict: A dictionary containing group details,
                 or a dictionary with an 'error' key if retrieval fails or group not found.
         """
-        self.logger.debug(f"Starting 'get_group' method for group name: {name}")
+        self.logger.debug("Starting 'get_group' method for group name: %s", name)
 
         # Make the API call to fetch groups by name
         response = self.api_client.get(f"/api/v1/groups?name={name}")
@@ -209,7 +279,7 @@ class AccessManagement:
             self.logger.error(f"Incomplete group data for name '{name}'")
             return {"error": f"Group '{name}' found but missing expected fields"}
 
-        self.logger.debug(f"Group '{name}' found. ID: {group_id}")
+        self.logger.debug("Group '%s' found. ID: %s", name, group_id)
         return {
             "GROUP_ID": group_id,
             "GROUP_NAME": group_name,
@@ -231,7 +301,7 @@ class AccessManagement:
             dict: The response from the API if successful,
                 or a dictionary with an 'error' key if the operation fails.
         """
-        self.logger.debug(f"Creating user with data: {user_data}")
+        self.logger.debug("Creating user with data: %s", LogPayload(user_data))
 
         # Custom role mapping
         role_alias_mapping = {
@@ -244,23 +314,18 @@ class AccessManagement:
         mapped_role = role_alias_mapping.get(user_role, user_role)
 
         # Step 1: Fetch roles from the API
-        role_response = self.api_client.get('/api/roles')
-        if not role_response or not role_response.ok:
+        roles_index = self.api_client.directory.get_index(users=False, groups=False, roles=True)
+        if roles_index is None:
             self.logger.error("Failed to fetch roles from API")
             return {"error": "Failed to fetch roles from API"}
 
-        roles_mapping = [{"id": role["_id"], "name": role["name"].upper()} for role in role_response.json()]
-        self.logger.debug(f"Roles mapping: {roles_mapping}")
-
         # Step 2: Resolve roleId from role name
-        for role in roles_mapping:
-            if role["name"] == mapped_role:
-                user_data["roleId"] = role["id"]
-                break
-        else:
+        role_id = roles_index.role_id(mapped_role, ignore_case=True)
+        if role_id is None:
             error_msg = f"Role '{user_data.get('role')}' not found in roles_mapping"
             self.logger.error(error_msg)
             return {"error": error_msg}
+        user_data["roleId"] = role_id
 
         user_data.pop("role", None)
 
@@ -269,24 +334,19 @@ class AccessManagement:
         if group_names:
             user_data["groups"] = [group.upper() for group in group_names]
 
-            group_response = self.api_client.get('/api/v1/groups')
-            if not group_response or not group_response.ok:
+            groups_index = self.api_client.directory.get_index(users=False)
+            if groups_index is None:
                 self.logger.error("Failed to fetch groups from API")
                 return {"error": "Failed to fetch groups from API"}
 
-            groups_mapping = [{"id": group["_id"], "name": group["name"].upper()} for group in group_response.json()]
-            self.logger.debug(f"Groups mapping: {groups_mapping}")
-
             updated_groups = []
             for group_name in user_data["groups"]:
-                for group in groups_mapping:
-                    if group["name"] == group_name:
-                        updated_groups.append(group["id"])
-                        break
-                else:
+                group_id = groups_index.group_id(group_name, ignore_case=True)
+                if group_id is None:
                     error_msg = f"Group '{group_name}' not found in groups_mapping"
                     self.logger.error(error_msg)
                     return {"error": error_msg}
+                updated_groups.append(group_id)
 
             user_data["groups"] = updated_groups
         else:
@@ -294,12 +354,13 @@ class AccessManagement:
 
         # Step 4: Send POST request to create the user
         # Step 4: Send POST request to create the user
-        self.logger.debug(f"Final user data for API call: {user_data}")
+        self.logger.debug("Final user data for API call: %s", LogPayload(user_data))
         response = self.api_client.post("/api/v1/users", data=user_data)
 
         if response and response.ok:
+            self.api_client.directory.invalidate('users')
             response_data = response.json()
-            self.logger.info(f"User created successfully: {response_data}")
+            self.logger.info(f"User created successfully: {LogPayload(response_data)}")
             return response_data
         else:
             try:
@@ -327,7 +388,7 @@ class AccessManagement:
             dict: The response from the API if successful,
                 or a dictionary with an 'error' key if the operation fails.
         """
-        self.logger.debug(f"Updating user with username: {user_name}")
+        self.logger.debug("Updating user with username: %s", user_name)
 
         # Reuse the get_user method to fetch user details
         user = self.get_user(user_name)
@@ -348,23 +409,17 @@ class AccessManagement:
             user_role = user_data["role"].upper()
             mapped_role = role_alias_mapping.get(user_role, user_role)
 
-            role_response = self.api_client.get('/api/roles')
-            if not role_response or not role_response.ok:
-                self.logger.error("Failed to fetch roles from API. "
-                                f"Status Code: {role_response.status_code if role_response else 'No response'}")
+            roles_index = self.api_client.directory.get_index(users=False, groups=False, roles=True)
+            if roles_index is None:
+                self.logger.error("Failed to fetch roles from API.")
                 return {"error": "Failed to fetch roles from API."}
 
-            roles_mapping = [{"id": role["_id"], "name": role["name"].upper()} for role in role_response.json()]
-            self.logger.debug(f"Roles mapping: {roles_mapping}")
-
-            for role in roles_mapping:
-                if role["name"] == mapped_role:
-                    user_data["roleId"] = role["id"]
-                    break
-            else:
+            role_id = roles_index.role_id(mapped_role, ignore_case=True)
+            if role_id is None:
                 error_msg = f"Role '{user_data['role']}' not found in roles_mapping"
                 self.logger.error(error_msg)
                 return {"error": error_msg}
+            user_data["roleId"] = role_id
 
             user_data.pop("role", None)
 
@@ -373,37 +428,32 @@ class AccessManagement:
         if group_names:
             user_data["groups"] = [group.upper() for group in group_names]
 
-            group_response = self.api_client.get('/api/v1/groups')
-            if not group_response or not group_response.ok:
-                self.logger.error("Failed to fetch groups from API. "
-                                f"Status Code: {group_response.status_code if group_response else 'No response'}")
+            groups_index = self.api_client.directory.get_index(users=False)
+            if groups_index is None:
+                self.logger.error("Failed to fetch groups from API.")
                 return {"error": "Failed to fetch groups from API."}
 
-            groups_mapping = [{"id": group["_id"], "name": group["name"].upper()} for group in group_response.json()]
-            self.logger.debug(f"Groups mapping: {groups_mapping}")
-
             updated_groups = []
             for group_name in user_data["groups"]:
-                for group in groups_mapping:
-                    if group["name"] == group_name:
-                        updated_groups.append(group["id"])
-                        break
-                else:
+                group_id = groups_index.group_id(group_name, ignore_case=True)
+                if group_id is None:
                     error_msg = f"Group '{group_name}' not found in groups_mapping"
                     self.logger.error(error_msg)
                     return {"error": error_msg}
+                updated_groups.append(group_id)
 
             user_data["groups"] = updated_groups
         else:
             user_data["groups"] = []
 
         # Step 3: Send the PATCH request to update the user
-        self.logger.debug(f"Final updated user data for API call: {user_data}")
+        self.logger.debug("Final updated user data for API call: %s", LogPayload(user_data))
         response = self.api_client.patch(f"/api/v1/users/{user['USER_ID']}", data=user_data)
 
         if response and response.ok:
+            self.api_client.directory.invalidate('users')
             response_data = response.json()
-            self.logger.info(f"User updated successfully: {response_data}")
+            self.logger.info(f"User updated successfully: {LogPayload(response_data)}")
             return response_data
         else:
             error_message = response.json().get("error", "Unknown error") if response else "No response received"
@@ -421,33 +471,35 @@ class AccessManagement:
         Returns:
             dict: Response from the API if successful, or an error message dict.
         """
-        self.logger.debug(f"Starting 'delete_user' method for username: {user_name}")
+        self.logger.debug("Starting 'delete_user' method for username: %s", user_name)
         
         # Reuse the get_user method to fetch user details
-        self.logger.debug(f"Fetching user details for '{user_name}' using 'get_user' method.")
+        self.logger.debug("Fetching user details for '%s' using 'get_user' method.", user_name)
         user = self.get_user(user_name)
-        self.logger.debug(f"User details fetched: {user}")
+        self.logger.debug("User details fetched: %s", user)
 
         # If user is not found, log and return error
         if not user or 'error' in user:
             error_msg = f"User '{user_name}' not found. Cannot proceed with deletion."
             self.logger.error(error_msg)
-            self.logger.debug(f"Completed 'delete_user' method for username: {user_name}")
+            self.logger.debug("Completed 'delete_user' method for username: %s", user_name)
             return {"error": error_msg}
         user_id = user.get("_id") or user.get("USER_ID")  # support both formats just in case
         if not user_id:
             self.logger.error(f"User object for '{user_name}' is missing ID field. Cannot proceed.")
             return {"error": f"User '{user_name}' found but no ID field present."}
 
-        self.logger.debug(f"User '{user_name}' found. Proceeding to delete user with ID: {user_id}")
+        self.logger.debug("User '%s' found. Proceeding to delete user with ID: %s", user_name, user_id)
 
 
         # Send the DELETE request
         response = self.api_client.delete(f"/api/v1/users/{user['USER_ID']}")
-        
+        if response and response.ok:
+            self.api_client.directory.invalidate('users')
+
         if response and response.status_code == 204:
             self.logger.info(f"User '{user_name}' (ID: {user['USER_ID']}) deleted successfully. No content returned.")
-            self.logger.debug(f"Completed 'delete_user' method for username: {user_name}")
+            self.logger.debug("Completed 'delete_user' method for username: %s", user_name)
             return {"message": "User deleted successfully."}
 
         elif response and response.ok:
@@ -456,8 +508,8 @@ class AccessManagement:
             except Exception:
                 response_data = {"message": "User deleted, but no JSON body returned."}
             self.logger.info(f"User '{user_name}' (ID: {user['USER_ID']}) deleted successfully.")
-            self.logger.debug(f"API response: {response_data}")
-            self.logger.debug(f"Completed 'delete_user' method for username: {user_name}")
+            self.logger.debug("API response: %s", LogPayload(response_data))
+            self.logger.debug("Completed 'delete_user' method for username: %s", user_name)
             return response_data
 
         else:
@@ -466,7 +518,7 @@ class AccessManagement:
             except Exception:
                 error_message = "No response body or invalid JSON"
             self.logger.error(f"Failed to delete user '{user_name}' (ID: {user['USER_ID']}). Error: {error_message}")
-            self.logger.debug(f"Completed 'delete_user' method for username: {user_name}")
+            self.logger.debug("Completed 'delete_user' method for username: %s", user_name)
             return {"error": error_message}
 
 
@@ -482,7 +534,7 @@ class AccessManagement:
             list or dict: A list of users in the group if successful, 
                         or a dictionary containing an 'error' key if the operation fails.
         """
-        self.logger.debug(f"Starting 'users_per_group' method for group: {group_name}")
+        self.logger.debug("Starting 'users_per_group' method for group: %s", group_name)
 
         # Step 1: Fetch group details
         group = self.get_group(group_name)
@@ -492,7 +544,7 @@ class AccessManagement:
             return {"error": error_msg}
 
         group_id = group.get("GROUP_ID")
-        self.logger.debug(f"Group '{group_name}' found with ID: {group_id}. Proceeding to fetch users.")
+        self.logger.debug("Group '%s' found with ID: %s. Proceeding to fetch users.", group_name, group_id)
 
         # Step 2: Fetch users for the group
         url = f'/api/v1/users?groupId={group_id}'
@@ -506,7 +558,7 @@ class AccessManagement:
 
         try:
             users = response.json()
-            self.logger.debug(f"Found {len(users)} users in group '{group_name}'")
+            self.logger.debug("Found %s users in group '%s'", len(users), group_name)
             return users
         except Exception as e:
             error_msg = f"Failed to parse user list for group '{group_name}': {e}"
@@ -530,13 +582,12 @@ class AccessManagement:
         self.logger.debug("Starting to retrieve all groups and their users.")
 
         # Step 1: Fetch all groups
-        group_response = self.api_client.get("/api/v1/groups")
-        if not group_response or not group_response.ok:
+        group_data = self.api_client.directory.get_groups()
+        if group_data is None:
             self.logger.error("Failed to retrieve groups from API.")
             return []
 
-        group_data = group_response.json()
-        self.logger.debug(f"Retrieved {len(group_data)} groups.")
+        self.logger.debug("Retrieved %s groups.", len(group_data))
 
         # Step 2: Fetch all users
         all_users = self.get_users_all()
@@ -544,27 +595,27 @@ class AccessManagement:
             self.logger.error("No users returned from 'get_users_all' method.")
             return []
 
-        self.logger.debug(f"Retrieved {len(all_users)} users.")
+        self.logger.debug("Retrieved %s users.", len(all_users))
 
         # Step 3: Build the initial group dictionary
         groups_dict = {group['name']: [] for group in group_data if group['name'] not in EXCLUDED_GROUPS}
         if "Admins" not in groups_dict:
             groups_dict["Admins"] = []  # Ensure 'Admins' group exists
 
-        self.logger.debug(f"Initialized groups dictionary with {len(groups_dict)} entries (excluding excluded groups).")
+        self.logger.debug("Initialized groups dictionary with %s entries (excluding excluded groups).", len(groups_dict))
 
         # Step 4: Populate group membership from users
         for user in all_users:
             for group in user.get("GROUPS", []):
                 if group not in EXCLUDED_GROUPS:
                     groups_dict[group].append(user["USER_NAME"])
-                    self.logger.debug(f"Added user '{user['USER_NAME']}' to group '{group}'")
+                    self.logger.debug("Added user '%s' to group '%s'", user['USER_NAME'], group)
 
         # Step 5: Add users with admin-like roles to 'Admins'
         for user in all_users:
             if user.get("ROLE_NAME") in ["sysAdmin", "dataAdmin", "admin"]:
                 groups_dict["Admins"].append(user["USER_NAME"])
-                self.logger.debug(f"Added user '{user['USER_NAME']}' to Admins group based on role.")
+                self.logger.debug("Added user '%s' to Admins group based on role.", user['USER_NAME'])
 
         # Step 6: Prepare final result
         result = [{"group": group_name, "username": usernames} for group_name, usernames in groups_dict.items()]
@@ -599,13 +650,16 @@ class AccessManagement:
         total_dashboards_changed = 0
 
         self.logger.info("Starting folder and dashboard traversal...")
-        self.logger.debug(f"Looking for folder '{folder_name}' to change ownership to '{new_owner_name}'")
+        self.logger.debug("Looking for folder '%s' to change ownership to '%s'", folder_name, new_owner_name)
 
         matching_folders = []
         oid_to_parent_map = {}
 
+        # Resolve the executing user and the new owner in one pass
+        resolved_users = self.get_users([executing_user, new_owner_name])
+
         # Check if the executing user exists and retrieve their USER_ID
-        user_info = self.get_user(executing_user)
+        user_info = resolved_users[executing_user]
         if not user_info or "USER_ID" not in user_info:
             error_msg = f"User '{executing_user}' not found or USER_ID missing."
             self.logger.error(error_msg)
@@ -613,7 +667,7 @@ class AccessManagement:
         user_id = user_info["USER_ID"]
 
         # Check if the new owner exists and retrieve their USER_ID
-        new_owner = self.get_user(new_owner_name)
+        new_owner = resolved_users[new_owner_name]
         if not new_owner or "USER_ID" not in new_owner:
             error_msg = f"New owner '{new_owner_name}' not found or USER_ID missing."
             self.logger.error(error_msg)
@@ -624,7 +678,7 @@ class AccessManagement:
         def build_folder_map_and_find_matches(folders, parent=None):
             for folder in folders:
                 oid_to_parent_map[folder['oid']] = parent
-                self.logger.debug(f"Checking folder '{folder['name']}' (ID: {folder['oid']})")
+                self.logger.debug("Checking folder '%s' (ID: %s)", folder['name'], folder['oid'])
 
                 if folder['name'] == folder_name:
                     self.logger.info(f"Found target folder: {folder['name']} (ID: {folder['oid']})")
@@ -649,7 +703,7 @@ class AccessManagement:
                     traverse_folder(subfolder)
             else:
                 if not folder.get("folders"):
-                    self.logger.debug(f"No subfolders in folder - {folder['name']}")
+                    self.logger.debug("No subfolders in folder - %s", folder['name'])
 
         # Traverse a folder’s parent and siblings
         def traverse_parents_and_siblings(folder):
@@ -697,31 +751,17 @@ class AccessManagement:
                 self.logger.info(f"Dashboard: {dash_name} (ID: {dash_id})")
         else:
             self.logger.warning("Folder not found, moving to search dashboards and grant access step...")
-            limit = 50
-            skip = 0
-            dashboards = []
-            while True: 
-                self.logger.debug(f"Fetching dashboards (limit={limit}, skip={skip})")
-                dashboard_response = self.api_client.post('/api/v1/dashboards/searches', data={
-                    "queryParams": {"ownershipType": "allRoot", "search": "", "ownerInfo": True, "asObject": True},
-                    "queryOptions": {"sort": {"title": 1}, "limit": limit, "skip": skip}
-                })
-                dashboard_response = dashboard_response.json()
-
-                if not dashboard_response or len(dashboard_response.get("items", [])) == 0:
-                    self.logger.debug("No more dashboards found.")
-                    break
-                else:
-                    dashboards.extend(dashboard_response["items"])
-                    skip += limit
+            # Only dashboards inside a folder are relevant for granting folder access
+            dashboards = [dash for dash in self.api_client.iter_dashboard_searches(fields=["oid", "title", "parentFolder", "shares"])
+                          if dash.get("parentFolder")]
 
             all_folder_ids = {dic["parentFolder"] for dic in dashboards if "parentFolder" in dic and dic["parentFolder"]}
-            self.logger.debug(f"Collected parent folder IDs from dashboards: {all_folder_ids}")
+            self.logger.debug("Collected parent folder IDs from dashboards: %s", LogPayload(all_folder_ids))
 
             folder_response = self.api_client.get('/api/v1/folders')
             folder_response = folder_response.json()
             user_folder_ids = {folder["oid"] for folder in folder_response if "oid" in folder}
-            self.logger.debug(f"Collected user-accessible folder IDs: {user_folder_ids}")
+            self.logger.debug("Collected user-accessible folder IDs: %s", user_folder_ids)
 
 
             diff = all_folder_ids - user_folder_ids
@@ -736,7 +776,7 @@ class AccessManagement:
                         "rule": "edit",
                         "subscribe": False
                     })
-                    self.logger.debug(f"Sharing dashboard {dash['title']} (ID: {dash['oid']}) with {executing_user}")
+                    self.logger.debug("Sharing dashboard %s (ID: %s) with %s", dash['title'], dash['oid'], executing_user)
                     share_response = self.api_client.post(f'/api/shares/dashboard/{dash["oid"]}?adminAccess=true', data={"sharesTo": payload})
                     share_response = share_response.json()
                     if share_response:
@@ -764,17 +804,24 @@ class AccessManagement:
             self.logger.info("Changing folder and dashboard owners...")
 
             # Change folder owners
-            self.logger.debug(f"Folders to be changed: {folder_details}")
+            self.logger.debug("Folders to be changed: %s", LogPayload(folder_details))
             self.logger.info(f"Changing ownership for {len(folder_details)} folders and {len(dashboard_details)} dashboards.")
-            for folder_id, folder_name in folder_details:
-                data = {"owner": new_owner_id}
-                self.logger.debug(f"Changing owner for folder {folder_name} (ID: {folder_id}) with data: {data}")
-                
-                response = self.api_client.patch(f'/api/v1/folders/{folder_id}', data=data)
-                response = response.json()
-                
+            data = {"owner": new_owner_id}
+            self.logger.debug("Changing owner for folders with data: %s", LogPayload(data))
+
+            # Patch all folders concurrently; responses come back in the order of folder_details
+            folder_responses = self.api_client.map_concurrent(
+                ('PATCH', f'/api/v1/folders/{folder_id}', data) for folder_id, _ in folder_details
+            )
+
+            for (folder_id, folder_name), response in zip(folder_details, folder_responses):
+                if isinstance(response, Exception):
+                    self.logger.error(f"Failed to change folder owner for '{folder_name}': {response}")
+                    continue
+                response = response.json() if response is not None else None
+
                 # Log response
-                self.logger.debug(f"API response for folder change: {response}")
+                self.logger.debug("API response for folder change: %s", LogPayload(response))
                 
                 if response and response.get("owner") == new_owner_id:
                     self.logger.info(f"Folder '{folder_name}' owner changed to {new_owner_name}")
@@ -834,16 +881,22 @@ class AccessManagement:
         self.logger.info(f"Fetching columns for DataModel: {datamodel_name}")
 
         # Step 1: Get DataModel ID
-        self.logger.debug(f"Fetching DataModel ID for '{datamodel_name}'")
+        self.logger.debug("Fetching DataModel ID for '%s'", datamodel_name)
         schema_url = "/api/v2/datamodels/schema"
-        response = self.api_client.get(schema_url)
+        # Streamed: the scan stops reading the (potentially very large) schema list at the first match
+        response_data = self.api_client.get_stream(schema_url)
 
-        if not response or response.status_code != 200:
+        if response_data is None:
             self.logger.error(f"Failed to fetch DataModel schema for '{datamodel_name}'")
             return []
 
-        response_data = response.json()
-        datamodel_id = next((x.get("oid") for x in response_data if x.get("title") == datamodel_name), None)
+        try:
+            datamodel_id = next((x.get("oid") for x in response_data if x.get("title") == datamodel_name), None)
+        except ValueError as e:
+            self.logger.error(f"Failed to parse the DataModel schema response: {e}")
+            return []
+        finally:
+            response_data.close()
 
         if not datamodel_id:
             self.logger.error(f"DataModel '{datamodel_name}' not found.")
@@ -852,7 +905,7 @@ class AccessManagement:
         self.logger.info(f"DataModel ID for '{datamodel_name}': {datamodel_id}")
 
         # Step 2: Get DataSets
-        self.logger.debug(f"Fetching DataSets for DataModel ID '{datamodel_id}'")
+        self.logger.debug("Fetching DataSets for DataModel ID '%s'", datamodel_id)
         dataset_url = f"/api/v2/datamodels/{datamodel_id}/schema/datasets"
         response = self.api_client.get(dataset_url)
 
@@ -875,7 +928,7 @@ class AccessManagement:
         total_columns = 0
 
         for dataset_index, dataset_id in enumerate(dataset_ids, start=1):
-            self.logger.debug(f"Processing DataSet {dataset_index}/{total_datasets}: Fetching tables for DataSet ID '{dataset_id}'")
+            self.logger.debug("Processing DataSet %s/%s: Fetching tables for DataSet ID '%s'", dataset_index, total_datasets, dataset_id)
 
             table_url = f"{dataset_url}/{dataset_id}/tables"
             response = self.api_client.get(table_url)
@@ -902,7 +955,7 @@ class AccessManagement:
 
                 table_column_count = len(columns)
                 total_columns += table_column_count
-                self.logger.debug(f"Table '{table_name}' contains {table_column_count} columns")
+                self.logger.debug("Table '%s' contains %s columns", table_name, table_column_count)
 
                 for column in columns:
                     column_name = column.get("name")
@@ -919,7 +972,7 @@ class AccessManagement:
 
         # Step 4: Final logging
         self.logger.info(f"DataModel '{datamodel_name}': Processed {total_datasets} datasets, {total_tables} tables, and {total_columns} columns.")
-        self.logger.debug(f"Final collected column data: {all_columns}")
+        self.logger.debug("Final collected column data: %s", LogPayload(all_columns))
 
         return all_columns
 
@@ -967,39 +1020,45 @@ class AccessManagement:
         dashboard_ids = {dash["oid"] for dash in dashboards}  # Get unique dashboard IDs
         total_dashboards = len(dashboard_ids)
         self.logger.info(f"Found {total_dashboards} dashboards linked to DataModel '{datamodel_name}'")
-        self.logger.debug(f"Dashboard IDs: {dashboard_ids}")
+        self.logger.debug("Dashboard IDs: %s", dashboard_ids)
 
         # Step 3: Extract columns from all linked dashboards
         dashboard_columns = []
         total_filters = 0
         total_widgets = 0
 
-        for dashboard_id in dashboard_ids:
-            dashboard_url = f"/api/v1/dashboards/export?dashboardIds={dashboard_id}&adminAccess=true"
-            response = self.api_client.get(dashboard_url)
+        # Export all dashboards concurrently; responses come back in the order of dashboard_ids
+        dashboard_ids = list(dashboard_ids)
+        export_responses = self.api_client.map_concurrent(
+            ('GET', f"/api/v1/dashboards/export?dashboardIds={dashboard_id}&adminAccess=true") for dashboard_id in dashboard_ids
+        )
 
+        for dashboard_id, response in zip(dashboard_ids, export_responses):
+            if isinstance(response, Exception):
+                self.logger.error(f"Failed to export dashboard with ID '{dashboard_id}': {response}")
+                continue
             if not response or not response.ok:
                 self.logger.error(f"Failed to export dashboard with ID '{dashboard_id}'")
                 continue
 
             dashboard = response.json()[0]
             dashboard_name = dashboard["title"]
-            self.logger.debug(f"Analyzing Dashboard '{dashboard_name}' (ID: {dashboard_id})")
+            self.logger.debug("Analyzing Dashboard '%s' (ID: %s)", dashboard_name, dashboard_id)
 
             # Extract columns from filters
             filter_count = 0
-            self.logger.debug(f"Extracting columns from filters for dashboard '{dashboard_name}'")
+            self.logger.debug("Extracting columns from filters for dashboard '%s'", dashboard_name)
             if "filters" in dashboard:
                 total_filters = len(dashboard["filters"])
-                self.logger.debug(f"Total filters found: {total_filters}")
+                self.logger.debug("Total filters found: %s", total_filters)
 
                 for filter_index, filter in enumerate(dashboard["filters"], start=1):
                     filter_count += 1
-                    self.logger.debug(f"Processing filter {filter_index}/{total_filters}")
+                    self.logger.debug("Processing filter %s/%s", filter_index, total_filters)
 
                     if "levels" in filter:
                         levels_count = len(filter["levels"])
-                        self.logger.debug(f"Filter {filter_index}: Extracting {levels_count} levels")
+                        self.logger.debug("Filter %s: Extracting %s levels", filter_index, levels_count)
 
                         for level in filter["levels"]:
                             dim_value = level.get("dim", "Unknown.Table")
@@ -1013,7 +1072,7 @@ class AccessManagement:
                                 "column": column
                             })
 
-                            self.logger.debug(f"Filter {filter_index}: Extracted from levels - Table: {table}, Column: {column}")
+                            self.logger.debug("Filter %s: Extracted from levels - Table: %s, Column: %s", filter_index, table, column)
 
                     elif "jaql" in filter:
                         dim_value = filter["jaql"].get("dim", "Unknown.Table")
@@ -1027,24 +1086,24 @@ class AccessManagement:
                             "column": column
                         })
 
-                        self.logger.debug(f"Filter {filter_index}: Extracted from JAQL - Table: {table}, Column: {column}")
+                        self.logger.debug("Filter %s: Extracted from JAQL - Table: %s, Column: %s", filter_index, table, column)
 
             self.logger.info(f"Processed {filter_count} filters for dashboard '{dashboard_name}'")
 
             # Extract columns from widgets
             widget_count = 0
             column_count = 0
-            self.logger.debug(f"Extracting columns from widgets for dashboard '{dashboard_name}'")
+            self.logger.debug("Extracting columns from widgets for dashboard '%s'", dashboard_name)
 
             total_widgets_in_dashboard = len(dashboard.get("widgets", []))
-            self.logger.debug(f"Total widgets found: {total_widgets_in_dashboard}")
+            self.logger.debug("Total widgets found: %s", total_widgets_in_dashboard)
 
             for widget_index, widget in enumerate(dashboard.get("widgets", []), start=1):
                 widget_count += 1
                 widget_id = widget.get("oid", "Unknown Widget")
                 widget_title = widget.get("title", "Unnamed Widget")
 
-                self.logger.debug(f"Processing widget {widget_index}/{total_widgets_in_dashboard}: '{widget_title}' (ID: {widget_id})")
+                self.logger.debug("Processing widget %s/%s: '%s' (ID: %s)", widget_index, total_widgets_in_dashboard, widget_title, widget_id)
 
                 for panel in widget.get("metadata", {}).get("panels", []):
                     for item in panel.get("items", []):
@@ -1070,7 +1129,7 @@ class AccessManagement:
                                 })
                                 column_count += 1
 
-                                self.logger.debug(f"Widget {widget_index}: Extracted from context (Formula) - Table: {table}, Column: {column}")
+                                self.logger.debug("Widget %s: Extracted from context (Formula) - Table: %s, Column: %s", widget_index, table, column)
 
                         # Extract columns from 'dim' (Regular columns)
                         else:
@@ -1090,7 +1149,7 @@ class AccessManagement:
                             })
                             column_count += 1
                             
-                            self.logger.debug(f"Widget {widget_index}: Extracted from regular source - Table: {table}, Column: {column}")
+                            self.logger.debug("Widget %s: Extracted from regular source - Table: %s, Column: %s", widget_index, table, column)
 
             total_widgets += widget_count
             self.logger.info(f"Processed {widget_count} widgets and {filter_count} filters and extracted {column_count} columns for dashboard '{dashboard_name}'")
@@ -1144,85 +1203,33 @@ class AccessManagement:
         Returns:
             list: A list of dictionaries containing the dashboard title, share type (user or group), and share name (email or group name).
         """
-        limit = 50
-        skip = 0
-        dashboards = []
-        
         self.logger.info("Starting to retrieve dashboard shares...")
-        
-        # Step 1: Fetch all dashboards with pagination
-        while True:
-            self.logger.debug(f"Fetching dashboards with limit={limit}, skip={skip}")
-            dashboard_response = self.api_client.post(
-                '/api/v1/dashboards/searches',
-                data={ 
-                    "queryParams": {
-                        "ownershipType": "allRoot",
-                        "search": "",
-                        "ownerInfo": True,
-                        "asObject": True
-                    },
-                    "queryOptions": {
-                        "sort": {"title": 1},
-                        "limit": limit,
-                        "skip": skip
-                    }
-                }
-            )
-
-            if not dashboard_response or dashboard_response.status_code != 200:
-                self.logger.error("Failed to fetch dashboards.")
-                break
-
-            response_data = dashboard_response.json()
-            items = response_data.get("items", [])
-            if not items:
-                self.logger.info("No more dashboards found.")
-                break
 
-            dashboards.extend(items)
-            skip += limit
-            self.logger.debug(f"Retrieved {len(items)} dashboards, total so far: {len(dashboards)}")
-
-        # Step 2: Fetch all users
-        self.logger.info("Fetching all users.")
-        users_response = self.api_client.get('/api/v1/users')
-        if not users_response or users_response.status_code != 200:
-            self.logger.error("Failed to fetch users.")
-            return []
-
-        users_data = users_response.json()
-        users_detail = [{"id": user["_id"], "email": user.get("email", "Unknown Email")} for user in users_data]
-
-        # Step 3: Fetch all groups
-        self.logger.info("Fetching all groups.")
-        groups_response = self.api_client.get('/api/v1/groups')
-        if not groups_response or groups_response.status_code != 200:
-            self.logger.error("Failed to fetch groups.")
+        # Step 1: Index all users and groups by ID
+        self.logger.info("Fetching all users and groups.")
+        principals = self.api_client.directory.get_index()
+        if principals is None:
+            self.logger.error("Failed to fetch users or groups.")
             return []
 
-        groups_data = groups_response.json()
-        groups_detail = [{"id": group["_id"], "name": group.get("name", "Unknown Group")} for group in groups_data]
-
         shared_list = []
+        dashboard_count = 0
 
-        # Step 4: Parse the dashboards to find shared users and groups
-        self.logger.debug(f"Parsing {len(dashboards)} dashboards for shared users and groups.")
-        for dashboard in dashboards:
+        # Step 2: Stream all dashboards and parse their shared users and groups
+        for dashboard in self.api_client.iter_dashboard_searches(fields=["oid", "title", "shares"]):
+            dashboard_count += 1
             if dashboard.get("shares"):
                 for share in dashboard["shares"]:
                     share_info = {"dashboard": dashboard["title"], "type": None, "name": None}
 
                     if share["type"] == "user":
-                        user = next((user for user in users_detail if user["id"] == share["shareId"]), None)
-                        if user:
+                        if share["shareId"] in principals.email_by_user_id:
                             share_info["type"] = "user"
-                            share_info["name"] = user["email"]
+                            share_info["name"] = principals.email_by_user_id[share["shareId"]] or "Unknown Email"
                     elif share["type"] == "group":
-                        group = next((group for group in groups_detail if group["id"] == share["shareId"]), None)
-                        if group:
+                        if share["shareId"] in principals.group_name_by_id:
                             share_info["type"] = "group"
-                            share_info["name"] = group["name"]
+                            share_info["name"] = principals.group_name_by_id[share["shareId"]] or "Unknown Group"
 
                     shared_list.append(share_info)
             else:
@@ -1233,6 +1240,7 @@ class AccessManagement:
                     "name": None
                 })
 
+        self.logger.debug("Parsed %s dashboards for shared users and groups.", dashboard_count)
         self.logger.info(f"Parsed {len(shared_list)} shared dashboards.")
 
         # Return the result as a list of dictionaries
@@ -1259,7 +1267,7 @@ class AccessManagement:
         Returns:
             dict: API response or error.
         """
-        self.logger.debug(f"Fetching DataModel ID for '{datamodel_name}'")
+        self.logger.debug("Fetching DataModel ID for '%s'", datamodel_name)
         schema_url = f"/api/v2/datamodels/schema?title={datamodel_name}"
         response = self.api_client.get(schema_url)
 
@@ -1305,7 +1313,7 @@ class AccessManagement:
                 days_string = ",".join([day_mapping[day] for day in days])
 
             cron_string = f"{minute} {hour} * * {days_string}"
-            self.logger.debug(f"Generated cron string: {cron_string}")
+            self.logger.debug("Generated cron string: %s", cron_string)
 
             schedule_payload = {
                 "cronString": cron_string,
@@ -1330,7 +1338,7 @@ class AccessManagement:
 
         try:
             response_data = response.json()
-            self.logger.info(f"Schedule build created successfully. Response: {response_data}")
+            self.logger.info(f"Schedule build created successfully. Response: {LogPayload(response_data)}")
             return response_data
         except (AttributeError, ValueError):
             self.logger.warning("Response does not contain valid JSON. Returning raw response.")
@@ -1,13 +1,101 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 import yaml
 import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
+import gzip
+import hashlib
+import json
 import logging
-import pandas as pd
-from pandas import json_normalize
 import re
 from collections import defaultdict
-import os
-from .utils import convert_to_dataframe, export_to_csv as export_csv_util
+import time
+import random
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+from .utils import LogPayload, PayloadLoggerAdapter, convert_to_dataframe, export_to_csv as export_csv_util
+from .rate_limiter import get_shared_rate_limiter
+from .directory import DirectoryCache
+from .metrics import RequestInfo, RequestMetrics, endpoint_template
+from .profiling import request_span, run_in_context
+from .log_handler import DEFAULT_LOGGING_CONFIG, configure_queued_logging
+from .json_stream import iter_json_items
+from .http_cache import HttpCache
+
+
+# Default connection pool settings, overridable through the 'connection_pool' section of the YAML config
+DEFAULT_POOL_CONFIG = {
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+    'pool_block': False,
+    'keep_alive': True
+}
+
+# Default retry policy, overridable through the 'retry' section of the YAML config
+DEFAULT_RETRY_CONFIG = {
+    'max_retries': 5,                           # Maximum number of retries for a single request
+    'backoff_factor': 0.5,                      # Base delay (seconds) for exponential backoff
+    'backoff_max': 60,                          # Upper bound (seconds) for a single backoff delay
+    'max_retry_time': 300,                      # Total time budget (seconds) spent retrying a single request
+    'status_forcelist': [429, 502, 503, 504]    # Status codes that trigger a retry
+}
+
+# Default page sizes for paginated endpoints, overridable through the 'pagination' section of the YAML config
+DEFAULT_PAGINATION_CONFIG = {
+    'page_size': 50,
+    'max_page_size': 500
+}
+
+# Default compression settings, overridable through the 'compression' section of the YAML config
+DEFAULT_COMPRESSION_CONFIG = {
+    'accept_encoding': True,            # Ask for compressed responses (gzip/deflate, plus br/zstd if their decoders are installed)
+    'request_compression': False,       # Gzip large request bodies sent to the endpoints below (server must accept it)
+    'min_request_bytes': 64 * 1024,     # Smallest request body worth compressing
+    'level': 6,                         # gzip compression level (1-9)
+    'endpoints': [                      # Path prefixes of the bulk endpoints whose request bodies may be compressed
+        '/api/v1/dashboards/import/bulk',
+        '/api/v2/datamodel-imports/schema',
+        '/api/v1/users/bulk',
+        '/api/v1/groups/bulk'
+    ]
+}
+
+# Bytes read from the socket at a time by get_stream()
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Methods that can safely be sent more than once
+IDEMPOTENT_METHODS = {'GET', 'PUT', 'DELETE'}
+
+# Status codes that mean the server rejected the request before processing it,
+# so even non-idempotent requests can be retried
+REJECTED_STATUS_CODES = {429, 503}
+
+# Instrumentation events accepted by APIClient.add_hook()
+HOOK_EVENTS = ('pre_request', 'post_request')
+
+# POST endpoints that only read data and are therefore safe to retry like a GET
+READ_ONLY_POST_ENDPOINTS = ('/api/v1/dashboards/searches', '/api/v2/ecm/')
+
+
+def format_fields(fields):
+    """
+    Normalizes a field projection to the comma-separated form expected by the 'fields' query parameter.
+
+    Parameters:
+        fields (str or list): Field names, either as a list or an already comma-separated string.
+
+    Returns:
+        str or None: The comma-separated field names, or None if no projection was requested.
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        return fields
+    return ','.join(fields)
 
 
 class APIClient:
@@ -32,11 +120,16 @@ class APIClient:
         # Determine if SSL is enabled based on the configuration, default is True (HTTPS)
         self.is_ssl = self.config.get('is_ssl', True)
         
+        # Optional explicit port, e.g. for a proxy or a local MockSisense server
+        self.port = self.config.get('port')
+
         # Dynamically construct the base URL based on whether SSL is enabled
         if self.is_ssl:
             self.base_url = f"https://{self.domain}"                # Use default HTTPS (port 443)
+            if self.port:
+                self.base_url += f":{self.port}"
         else:
-            self.base_url = f"http://{self.domain}:30845"           # Use non-SSL and specify port 30845
+            self.base_url = f"http://{self.domain}:{self.port or 30845}"   # Use non-SSL, port 30845 unless configured
         
         # Extract the API token for authorization
         self.token = self.config['token']
@@ -44,22 +137,147 @@ class APIClient:
         # Set up HTTP headers, including the Authorization Bearer token
         self.headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'}
         
-        log_dir = "logs"
-        if not os.path.exists(log_dir):  
-            os.makedirs(log_dir)
+        # Log directory, rotation and format, see log_handler.DEFAULT_LOGGING_CONFIG
+        self.logging_config = {**DEFAULT_LOGGING_CONFIG, **(self.config.get('logging') or {})}
 
         # Set log level to DEBUG if debug is True, otherwise INFO
         log_level = logging.DEBUG if debug else logging.INFO
-        log_file_path = os.path.join(log_dir, "pysisense.log")
         
         # Initialize the logger
-        self.logger = self._get_logger("APIClient", log_file_path, log_level)
+        # The adapter caps LogPayload arguments at this client's 'max_payload_chars'
+        self.logger = PayloadLoggerAdapter(self._get_logger("APIClient", self.logging_config, log_level),
+                                           self.logging_config['max_payload_chars'])
 
         # Always disable SSL certificate verification
         self.verify = False
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.logger.warning("SSL verification is disabled. Avoid using this in production.")
 
+        # Set up a persistent session so TCP/TLS connections are reused across requests
+        self.pool_config = {**DEFAULT_POOL_CONFIG, **(self.config.get('connection_pool') or {})}
+        self.session = self._create_session(self.pool_config)
+
+        # Retry policy for transient failures (throttling, gateway errors, connection resets)
+        self.retry_config = {**DEFAULT_RETRY_CONFIG, **(self.config.get('retry') or {})}
+
+        # Thread-pool settings used by map_concurrent() to fan out independent requests
+        self.concurrency_config = self.config.get('concurrency') or {}
+
+        # Response compression negotiation and request body compression
+        self.compression_config = {**DEFAULT_COMPRESSION_CONFIG, **(self.config.get('compression') or {})}
+        self.headers['Accept-Encoding'] = ACCEPT_ENCODING if self.compression_config['accept_encoding'] else 'identity'
+        # Endpoint templates that rejected a compressed body with 415; they are sent uncompressed from then on
+        self._compression_rejected = set()
+
+        # LRU cache of GET responses revalidated with conditional requests (ETag / Last-Modified)
+        http_cache_config = self.config.get('http_cache') or {}
+        self.http_cache = HttpCache(http_cache_config) if http_cache_config.get('enabled', False) else None
+
+        # Page sizes used by iter_dashboard_searches()
+        self.pagination_config = {**DEFAULT_PAGINATION_CONFIG, **(self.config.get('pagination') or {})}
+
+        # Adaptive client-side rate limiter, shared by every client talking to the same server
+        self.rate_limiter = get_shared_rate_limiter(self.base_url, self.config.get('rate_limit'))
+
+        # TTL cache of the users, groups and roles lists, shared by every SDK class using this client
+        self.directory = DirectoryCache(self, self.config.get('directory_cache'))
+
+        # Instrumentation hooks called around every request, see add_hook()
+        self.hooks = {event: [] for event in HOOK_EVENTS}
+
+        # Optional built-in per-endpoint request metrics
+        self.metrics = None
+        if (self.config.get('metrics') or {}).get('enabled', False):
+            self.metrics = RequestMetrics()
+            self.add_hook('post_request', self.metrics)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases all pooled connections.
+        """
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            self.logger.debug("HTTP session closed.")
+
+
+    def add_hook(self, event, callback):
+        """
+        Registers an instrumentation hook called around every API request.
+
+        'pre_request' hooks are called before the first attempt, 'post_request' hooks after the
+        final outcome (success, error status, or exhausted retries). Both receive a RequestInfo with
+        the method, endpoint and endpoint template; post hooks also get the status, latency,
+        request/response sizes, retry count and error. Exceptions raised by hooks are logged and ignored.
+
+        Parameters:
+            event (str): 'pre_request' or 'post_request'.
+            callback (callable): Function taking a single RequestInfo argument.
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unsupported hook event: {event}. Expected one of {HOOK_EVENTS}")
+        self.hooks[event].append(callback)
+
+
+    def remove_hook(self, event, callback):
+        """
+        Unregisters an instrumentation hook added with add_hook().
+
+        Parameters:
+            event (str): 'pre_request' or 'post_request'.
+            callback (callable): The registered function.
+        """
+        if callback in self.hooks.get(event, []):
+            self.hooks[event].remove(callback)
+
+
+    def _run_hooks(self, event, info):
+        for callback in self.hooks[event]:
+            try:
+                callback(info)
+            except Exception as e:
+                self.logger.warning(f"{event} hook {callback!r} raised an exception: {e}")
+
+
+    def _finish_request_info(self, info, start_time, retry_count, response=None, error=None, request_bytes=None,
+                             response_bytes=None):
+        """
+        Completes a RequestInfo with the outcome of a request and runs the post-request hooks.
+
+        Parameters:
+            info (RequestInfo): The record created before the first attempt.
+            start_time (float): time.monotonic() of the first attempt.
+            retry_count (int): Number of retries made.
+            response (requests.Response, optional): The final response, if any.
+            error (Exception, optional): The exception of the final attempt, if it failed without a response.
+            request_bytes (int, optional): Uncompressed size of the request body, if it was compressed.
+            response_bytes (int, optional): Decoded size of a streamed response body, counted while it was read.
+        """
+        info.latency = time.monotonic() - start_time
+        info.retries = retry_count
+        info.error = error
+        if response is not None:
+            info.status = response.status_code
+            info.request_wire_bytes = len(response.request.body or b'') if response.request is not None else 0
+            info.request_bytes = request_bytes if request_bytes is not None else info.request_wire_bytes
+            info.request_encoding = response.request.headers.get('Content-Encoding') if response.request is not None else None
+            info.response_encoding = response.headers.get('Content-Encoding')
+            info.response_bytes = response_bytes if response_bytes is not None else len(response.content or b'')
+            # Bytes read from the socket, before content decoding
+            wire_bytes = response.raw.tell() if hasattr(response.raw, 'tell') else None
+            info.response_wire_bytes = wire_bytes if isinstance(wire_bytes, int) else info.response_bytes
+        self._run_hooks('post_request', info)
+
 
     def _load_config(self, config_file):
         """
@@ -76,31 +294,52 @@ class APIClient:
             return yaml.load(stream, Loader=yaml.FullLoader)
 
 
-    def _get_logger(self, name, log_filename, log_level):
+    def _create_session(self, pool_config):
+        """
+        Creates a requests Session backed by a pooled HTTPAdapter.
+
+        Parameters:
+            pool_config (dict): Pool settings with the keys 'pool_connections', 'pool_maxsize',
+                                'pool_block' and 'keep_alive'.
+
+        Returns:
+            requests.Session: Configured session instance.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=int(pool_config['pool_connections']),
+            pool_maxsize=int(pool_config['pool_maxsize']),
+            pool_block=bool(pool_config['pool_block'])
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.verify
+
+        # Ask the server to close the connection after each request when keep-alive is disabled
+        if not pool_config['keep_alive']:
+            session.headers['Connection'] = 'close'
+
+        self.logger.debug("HTTP session created with pool settings: %s", pool_config)
+        return session
+
+
+    def _get_logger(self, name, logging_config, log_level):
         """
         Sets up and configures a logger for the APIClient.
+
+        Records are written to a size-rotated file by a background thread, so logging never
+        blocks on disk I/O. The handler is attached once per logger name; later clients reuse it.
         
         Parameters:
             name (str): Name of the logger.
-            log_filename (str): File path where logs will be saved.
+            logging_config (dict): The 'logging' config section (log_dir, file_name, max_bytes, backup_count, format).
             log_level (int): Logging level (DEBUG, INFO, etc.)
         
         Returns:
             logging.Logger: Configured logger instance.
         """
         logger = logging.getLogger(name)
-        
-        # Check if the logger already has handlers to avoid duplicates
-        if not logger.handlers:
-            # Create a file handler for the logger
-            handler = logging.FileHandler(log_filename, mode='a')
-            
-            # Define the format for log messages
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            
-            # Add the file handler to the logger
-            logger.addHandler(handler)
+        configure_queued_logging(logger, logging_config)
         
         # Set the log level (DEBUG, INFO, etc.)
         logger.setLevel(log_level)
@@ -182,7 +421,7 @@ class APIClient:
         return self._make_request('DELETE', endpoint)
 
 
-    def _make_request(self, method, endpoint, params=None, data=None):
+    def _make_request(self, method, endpoint, params=None, data=None, stream=False):
         """
         Makes an HTTP request to the API based on the specified method.
         
@@ -191,53 +430,646 @@ class APIClient:
             endpoint (str): The API endpoint (relative to the base URL).
             params (dict): Optional query parameters (for GET requests).
             data (dict): Optional JSON data payload (for POST, PUT, PATCH requests).
+            stream (bool): If True, the body of a successful response is not downloaded until it is read.
         
         Returns:
             requests.Response or None: The full response object if the request succeeds, otherwise None if it fails.
         """
+        # Profiled as one span per request, retries included
+        with request_span(method, endpoint):
+            return self._send_request(method, endpoint, params=params, data=data, stream=stream)
+
+
+    def _send_request(self, method, endpoint, params=None, data=None, stream=False):
+        # Implementation of _make_request(): retries, rate limiting and instrumentation hooks
         # Construct the full URL for the API request
         url = f"{self.base_url}{endpoint}"
         
         # Log the request details (method, URL, params, and data)
-        self.logger.debug(f"Making {method} request to {url} with data: {data} and params: {params}")
-        
-        try:
-            # Perform the appropriate HTTP request based on the method
-            if method == 'GET':
-                response = requests.get(url, headers=self.headers, params=params, verify=self.verify)
-            elif method == 'POST':
-                response = requests.post(url, headers=self.headers, json=data, verify=self.verify)
-            elif method == 'PUT':
-                response = requests.put(url, headers=self.headers, json=data, verify=self.verify)
-            elif method == 'PATCH':
-                response = requests.patch(url, headers=self.headers, json=data, verify=self.verify)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=self.headers, verify=self.verify)
+        self.logger.debug("Making %s request to %s with data: %s and params: %s", method, url, LogPayload(data), params)
+
+        if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            # Raise an error for unsupported HTTP methods
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        retry_count = 0
+        start_time = time.monotonic()
+
+        # Large bulk bodies may be sent gzip-compressed, see the 'compression' config section
+        body, body_encoding, body_size = self._encode_body(method, endpoint, data)
+
+        # Cached GET responses are revalidated instead of downloaded again, see the 'http_cache' config section
+        cache_key = self._http_cache_key(method, endpoint, url, params, stream)
+        cache_entry = self.http_cache.get(cache_key) if cache_key else None
+
+        # Only build the instrumentation record if someone is listening
+        info = RequestInfo(method, endpoint) if self.hooks['pre_request'] or self.hooks['post_request'] else None
+        if info:
+            self._run_hooks('pre_request', info)
+
+        while True:
+            try:
+                if self.session is None:
+                    # Reopen the session if the client was used after being closed
+                    self.session = self._create_session(self.pool_config)
+
+                # Wait for the endpoint's rate budget before sending
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(endpoint)
+
+                # Perform the request on the pooled session so the connection is reused
+                headers = self.headers
+                if body_encoding or cache_entry:
+                    headers = {**self.headers, **(cache_entry.validators() if cache_entry else {})}
+                    if body_encoding:
+                        headers['Content-Encoding'] = body_encoding
+
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params if method == 'GET' else None,
+                    json=data if method in ('POST', 'PUT', 'PATCH') and body is None else None,
+                    data=body,
+                    verify=self.verify,
+                    stream=stream
+                )
+
+            except requests.exceptions.RequestException as e:
+                if self.rate_limiter:
+                    self.rate_limiter.record(endpoint)
+
+                delay = self._get_retry_delay(method, endpoint, retry_count, start_time, error=e)
+                if delay is None:
+                    # Log and print the error for end-users
+                    error_message = f"{method} request to {url} failed: {e}"
+                    self.logger.error(error_message)
+                    if info:
+                        self._finish_request_info(info, start_time, retry_count, error=e)
+                    return None
+
+                retry_count += 1
+                self.logger.warning(f"{method} request to {url} failed: {e}. "
+                                    f"Retrying in {delay:.2f}s (retry {retry_count}/{self.retry_config['max_retries']}).")
+                time.sleep(delay)
+                continue
+
+            if self.rate_limiter:
+                self.rate_limiter.record(endpoint, response.status_code)
+
+            if body_encoding and response.status_code == 415:
+                # The server does not accept compressed bodies on this endpoint: resend as plain JSON
+                self.logger.warning(f"{method} request to {url} rejected the {body_encoding} request body. "
+                                    f"Sending uncompressed bodies to this endpoint from now on.")
+                self._compression_rejected.add(endpoint_template(endpoint))
+                body, body_encoding, body_size = self._encode_body(method, endpoint, data)
+                response.close()
+                continue
+
+            delay = self._get_retry_delay(method, endpoint, retry_count, start_time, response=response)
+            if delay is None:
+                break
+
+            retry_count += 1
+            self.logger.warning(f"{method} request to {url} returned status code {response.status_code}. "
+                                f"Retrying in {delay:.2f}s (retry {retry_count}/{self.retry_config['max_retries']}).")
+            # Release the connection back to the pool before sleeping
+            response.close()
+            time.sleep(delay)
+
+        wire_response = response
+        if cache_key:
+            response = self._apply_http_cache(cache_key, cache_entry, response)
+
+        # Handle known response codes
+        if response.status_code in [200, 201, 204]:
+            self.logger.debug("%s request to %s succeeded with status code %s", method, url, response.status_code)
+        elif response.status_code in [400, 404, 500]:
+            # Log the error response body, capped so a large error page does not flood the log
+            self.logger.error(f"{method} request to {url} failed with status code {response.status_code}: "
+                              f"{LogPayload(response)}")
+        else:
+            self.logger.warning(f"{method} request to {url} returned unexpected status code {response.status_code}")
+
+        if info:
+            # The record describes what was transferred: a 304 for responses served from the HTTP cache
+            info.cached = response is not wire_response
+            finish = functools.partial(self._finish_request_info, info, start_time, retry_count, response=wire_response,
+                                       request_bytes=body_size if body_encoding else None)
+            if stream:
+                # Reading the body here would defeat streaming; the reader completes the record instead
+                response.finish_request_info = finish
             else:
-                # Raise an error for unsupported HTTP methods
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Handle known response codes
-            if response.status_code in [200, 201, 204]:
-                self.logger.debug(f"{method} request to {url} succeeded with status code {response.status_code}")
-            elif response.status_code in [400, 404, 500]:
-                # Log the error response text if available
+                finish()
+
+        # Always return the full response object
+        return response
+
+
+    def get_stream(self, endpoint, item_path=None, params=None, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Performs a GET request and parses the items of a JSON array in the response incrementally,
+        as the body arrives. Only the item being parsed is held in memory, so very large list
+        responses (all users, all dashboards, all datamodel schemas) can be processed in bounded memory.
+
+        The request is sent (and retried) immediately; the body is read as the returned iterator is consumed.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+            item_path (str, optional): Dot-separated keys leading to the array in the response,
+                e.g. 'items' for {"items": [...]}. Default: the response body is the array.
+            params (dict, optional): Query parameters.
+            chunk_size (int, optional): Number of bytes read from the socket at a time. Default: 64 KB.
+
+        Returns:
+            iterator or None: An iterator over the array items, or None if the request fails.
+                The iterator raises ValueError if the body is not valid JSON, or if the connection fails while
+                the body is read. A read that fails before the first item is handed out is retried with a new GET.
+        """
+        response = self._make_request('GET', endpoint, params=params, stream=True)
+        if response is None:
+            return None
+        if response.status_code != 200:
+            self.logger.error(f"Streaming GET request to {endpoint} failed with status code {response.status_code}")
+            self._finish_stream(response)
+            return None
+        return self._iter_stream(response, endpoint, params, item_path, chunk_size)
+
+
+    def _iter_stream(self, response, endpoint, params, item_path, chunk_size):
+        # Generator behind get_stream(); the connection is released once the items are consumed or abandoned
+        count = 0
+        retry_count = 0
+        while True:
+            received = [0]
+
+            def chunks(current=response):
+                for chunk in current.iter_content(chunk_size=chunk_size):
+                    received[0] += len(chunk)
+                    yield chunk
+
+            try:
+                for item in iter_json_items(chunks(), item_path):
+                    count += 1
+                    yield item
+                break
+            except requests.exceptions.RequestException as e:
+                # Once items were handed out the stream cannot be restarted without repeating them
+                if count or retry_count >= self.retry_config['max_retries']:
+                    self.logger.error(f"Streaming GET request to {endpoint} failed while reading the response: {e}")
+                    raise ValueError(f"Failed to read the response of {endpoint}: {e}") from e
+                retry_count += 1
+                delay = random.uniform(0, min(self.retry_config['backoff_max'],
+                                              self.retry_config['backoff_factor'] * (2 ** retry_count)))
+                self.logger.warning(f"Streaming GET request to {endpoint} failed while reading the response: {e}. "
+                                    f"Retrying in {delay:.2f}s (retry {retry_count}/{self.retry_config['max_retries']}).")
+            finally:
+                self._finish_stream(response, received[0])
+                self.logger.debug("Streamed %s items from %s", count, endpoint)
+
+            time.sleep(delay)
+            response = self._make_request('GET', endpoint, params=params, stream=True)
+            if response is None or response.status_code != 200:
+                error_message = (f"Streaming GET request to {endpoint} failed with status code "
+                                 f"{response.status_code if response is not None else 'No response'}")
+                self.logger.error(error_message)
+                if response is not None:
+                    self._finish_stream(response)
+                raise ValueError(error_message)
+
+
+    def _finish_stream(self, response, response_bytes=None):
+        # Releases a streamed response and runs the post-request hooks deferred by _send_request()
+        finish = getattr(response, 'finish_request_info', None)
+        if finish:
+            finish(response_bytes=response_bytes)
+        response.close()
+
+
+    def map_concurrent(self, requests_list, max_workers=None):
+        """
+        Sends independent requests concurrently on a bounded thread pool.
+
+        Each request is either a tuple ``(method, endpoint)`` / ``(method, endpoint, data)``
+        or a dict with the keys 'method', 'endpoint' and optionally 'params' and 'data'.
+        All requests share the pooled session, the retry policy and the rate limiter.
+
+        Parameters:
+            requests_list (iterable): The requests to send.
+            max_workers (int, optional): Maximum number of requests in flight at the same time.
+                                         Defaults to the 'max_workers' setting of the 'concurrency' config section,
+                                         or to the connection pool size.
+
+        Returns:
+            list: One result per request, in input order. Each result is the requests.Response, None if the
+                  request failed without a response (the error is logged), or the exception the request raised,
+                  so callers can report why an item failed.
+        """
+        requests_list = list(requests_list)
+        if not requests_list:
+            return []
+
+        max_workers = max(1, min(self._concurrent_workers(max_workers), len(requests_list)))
+
+        self.logger.debug("Sending %s requests concurrently with max_workers=%s", len(requests_list), max_workers)
+        results = [None] * len(requests_list)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {run_in_context(executor, self._send_concurrent_request, request): index
+                       for index, request in enumerate(requests_list)}
+            for future in as_completed(futures):
+                index = futures[future]
                 try:
-                    error_message = response.json()
-                except ValueError:
-                    error_message = response.text  # If the response is not JSON, use raw text
-                self.logger.error(f"{method} request to {url} failed with status code {response.status_code}: {error_message}")
-            else:
-                self.logger.warning(f"{method} request to {url} returned unexpected status code {response.status_code}")
-            
-            # Always return the full response object
-            return response
-
-        except requests.exceptions.RequestException as e:
-            # Log and print the error for end-users
-            error_message = f"{method} request to {url} failed: {e}"
-            self.logger.error(error_message)
+                    results[index] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Concurrent request {index} ({requests_list[index]}) raised an exception: {e}")
+                    results[index] = e
+
+        return results
+
+
+    def iter_concurrent(self, requests_iterable, max_workers=None, max_pending=None):
+        """
+        Lazily sends independent requests concurrently, yielding the responses as they complete.
+
+        Unlike map_concurrent(), requests are drawn from the iterable only as fast as the caller consumes
+        the responses: at most max_workers requests are in flight, and at most max_pending completed
+        responses wait to be consumed. While the caller is busy, e.g. importing the previous results into
+        another environment, the pool keeps working until that window is full and then pauses.
+
+        Parameters:
+            requests_iterable (iterable): The requests to send, in the formats accepted by map_concurrent().
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to the
+                                         'max_workers' setting of the 'concurrency' config section, or to the connection pool size.
+            max_pending (int, optional): Maximum number of completed responses waiting to be consumed. Default: max_workers.
+
+        Yields:
+            tuple: (index of the request in the iterable, result), in completion order. The result is the requests.Response,
+                   None or the raised exception, as in map_concurrent().
+        """
+        max_workers = max(1, self._concurrent_workers(max_workers))
+        window = max_workers + (max_workers if max_pending is None else max(0, int(max_pending)))
+        requests_iter = enumerate(requests_iterable)
+        pending = {}
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit_next():
+            item = next(requests_iter, None)
+            if item is not None:
+                index, request = item
+                pending[run_in_context(executor, self._send_concurrent_request, request)] = (index, request)
+
+        try:
+            for _ in range(window):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, request = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Concurrent request {index} ({request}) raised an exception: {e}")
+                        response = e
+                    # Refill the window before handing the response over, so the pool stays busy meanwhile
+                    submit_next()
+                    yield index, response
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+    def _concurrent_workers(self, max_workers=None):
+        # Worker count of map_concurrent() and iter_concurrent()
+        return int(max_workers or self.concurrency_config.get('max_workers') or self.pool_config['pool_maxsize'])
+
+
+    def _send_concurrent_request(self, request):
+        # Sends one request of map_concurrent() or iter_concurrent()
+        if isinstance(request, dict):
+            return self._make_request(
+                request['method'].upper(),
+                request['endpoint'],
+                params=request.get('params'),
+                data=request.get('data')
+            )
+        method, endpoint, *rest = request
+        return self._make_request(method.upper(), endpoint, data=rest[0] if rest else None)
+
+
+    def iter_dashboard_searches(self, query_params=None, sort=None, page_size=None, prefetch=True, fields=None):
+        """
+        Lazily iterates over all dashboards returned by the /api/v1/dashboards/searches endpoint.
+
+        Pages are requested with limit/skip. While the caller processes one page, the next page
+        is already being fetched in the background, and items are yielded one at a time, so
+        scanning tens of thousands of dashboards uses constant memory.
+
+        Parameters:
+            query_params (dict, optional): The 'queryParams' of the search. Defaults to all root dashboards
+                                           with owner info, as object (same as the rest of the SDK).
+            sort (dict, optional): Sort order of the search. Default: {"title": 1}.
+            page_size (int, optional): Number of dashboards per page. Defaults to the 'page_size' setting of the
+                                       'pagination' config section (50). Capped at 'max_page_size' (500).
+            prefetch (bool, optional): Whether to fetch the next page while the current one is consumed. Default: True.
+            fields (str or list, optional): Dashboard fields to return, e.g. ["oid", "title"]. Default: all fields.
+
+        Yields:
+            dict: One dashboard object at a time.
+        """
+        if query_params is None:
+            query_params = {"ownershipType": "allRoot", "search": "", "ownerInfo": True, "asObject": True}
+        if sort is None:
+            sort = {"title": 1}
+
+        page_size = int(page_size or self.pagination_config['page_size'])
+        if page_size > self.pagination_config['max_page_size']:
+            self.logger.warning(f"Requested page size {page_size} exceeds the maximum; "
+                                f"using {self.pagination_config['max_page_size']}.")
+            page_size = self.pagination_config['max_page_size']
+
+        endpoint = '/api/v1/dashboards/searches'
+        fields = format_fields(fields)
+        if fields:
+            endpoint = f"{endpoint}?fields={fields}"
+
+        def fetch_page(skip):
+            self.logger.debug("Fetching dashboards (limit=%s, skip=%s)", page_size, skip)
+            response = self.post(endpoint, data={
+                "queryParams": query_params,
+                "queryOptions": {"sort": sort, "limit": page_size, "skip": skip}
+            })
+            if not response or response.status_code != 200:
+                self.logger.error(f"Failed to fetch dashboards page (limit={page_size}, skip={skip}).")
+                return []
+            return response.json().get("items", [])
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        skip = 0
+        total = 0
+        try:
+            items = fetch_page(skip)
+            while items:
+                # Advance by what the server actually returned, in case it caps the page size
+                skip += len(items)
+                next_page = run_in_context(executor, fetch_page, skip) if executor else None
+
+                for item in items:
+                    yield item
+                total += len(items)
+
+                items = next_page.result() if next_page else fetch_page(skip)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self.logger.debug("Dashboard search iteration finished after %s dashboards.", total)
+
+
+    def get_rate_limits(self):
+        """
+        Returns the current client-side request rate of each endpoint class.
+
+        Returns:
+            dict: Mapping of endpoint class to its current rate in requests per second,
+                  or an empty dict if rate limiting is disabled.
+        """
+        return self.rate_limiter.get_rates() if self.rate_limiter else {}
+
+
+    def _http_cache_key(self, method, endpoint, url, params, stream):
+        """
+        Returns the HTTP cache key of a request, or None if its response is not cached.
+
+        Parameters:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint (relative to the base URL).
+            url (str): The full request URL.
+            params (dict): The query parameters.
+            stream (bool): Whether the response is streamed; streamed responses are not cached.
+
+        Returns:
+            str or None: A digest of the credentials followed by the full URL including the query parameters,
+                         so clients with different tokens never share entries (e.g. in a shared cache directory).
+        """
+        if method != 'GET' or stream or not self.http_cache or not self.http_cache.is_cacheable(endpoint):
+            return None
+        # Only a digest of the Authorization header is kept; the key is written to disk with persisted entries
+        identity = hashlib.sha256(self.headers.get('Authorization', '').encode('utf-8')).hexdigest()[:16]
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()), doseq=True)}"
+        return f"{identity} {url}"
+
+
+    def _apply_http_cache(self, key, entry, response):
+        """
+        Serves a 304 Not Modified response from the HTTP cache, or stores a fresh 200 response in it.
+
+        Parameters:
+            key (str): The HTTP cache key of the request.
+            entry (CacheEntry or None): The entry that was revalidated, if any.
+            response (requests.Response): The response received from the server.
+
+        Returns:
+            requests.Response: The response to return to the caller; a 200 response with the cached body on a 304.
+        """
+        if response.status_code == 304 and entry is not None:
+            self.http_cache.record(hit=True)
+            self.logger.debug("%s not modified, served from the HTTP cache", key)
+            cached = requests.Response()
+            cached.status_code = 200
+            cached.reason = 'OK'
+            cached._content = entry.content
+            cached.headers = CaseInsensitiveDict(entry.headers)
+            cached.encoding = requests.utils.get_encoding_from_headers(cached.headers)
+            cached.url = response.url
+            cached.request = response.request
+            cached.elapsed = response.elapsed
+            return cached
+
+        if response.status_code == 200:
+            if entry is not None:
+                self.http_cache.record(hit=False)
+            self.http_cache.put(key, response.content, response.headers)
+        return response
+
+
+    def _encode_body(self, method, endpoint, data):
+        """
+        Serializes and gzip-compresses the JSON body of a large request to one of the compression endpoints.
+
+        Parameters:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint (relative to the base URL).
+            data (dict or list): The JSON payload.
+
+        Returns:
+            tuple: (body bytes, content encoding, uncompressed size). The body is None if the payload
+                   should be sent as plain JSON; the encoding is None if the body is not compressed.
+        """
+        config = self.compression_config
+        if data is None or method not in ('POST', 'PUT', 'PATCH') or not config['request_compression']:
+            return None, None, None
+
+        path = endpoint.split('?', 1)[0]
+        if not any(path.startswith(prefix) for prefix in config['endpoints']):
+            return None, None, None
+        if endpoint_template(endpoint) in self._compression_rejected:
+            return None, None, None
+
+        # Serialized once here, so it is not serialized again by requests if it stays uncompressed
+        raw = json.dumps(data, allow_nan=False).encode('utf-8')
+        if len(raw) < config['min_request_bytes']:
+            return raw, None, len(raw)
+
+        compressed = gzip.compress(raw, compresslevel=int(config['level']))
+        self.logger.debug("Compressed %s request body to %s from %s to %s bytes", method, endpoint, len(raw), len(compressed))
+        return compressed, 'gzip', len(raw)
+
+
+    def _is_idempotent(self, method, endpoint):
+        """
+        Determines whether a request can safely be sent more than once.
+
+        Parameters:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint (relative to the base URL).
+
+        Returns:
+            bool: True if the request is idempotent, False otherwise.
+        """
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == 'POST' and endpoint.split('?')[0] in READ_ONLY_POST_ENDPOINTS
+
+
+    def _get_retry_delay(self, method, endpoint, retry_count, start_time, response=None, error=None):
+        """
+        Decides whether a failed request should be retried and how long to wait before retrying.
+
+        Idempotent requests are retried on any connection error and on every status code in
+        'status_forcelist'. Non-idempotent requests (POST, PATCH) are only retried when the
+        request never reached the server (connection could not be established) or when the
+        server explicitly rejected it (429, 503).
+
+        Parameters:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint (relative to the base URL).
+            retry_count (int): Number of retries already performed.
+            start_time (float): Monotonic timestamp of the first attempt.
+            response (requests.Response, optional): The response received, if any.
+            error (Exception, optional): The exception raised, if any.
+
+        Returns:
+            float or None: Delay in seconds before the next attempt, or None if the request should not be retried.
+        """
+        if retry_count >= self.retry_config['max_retries']:
+            return None
+
+        idempotent = self._is_idempotent(method, endpoint)
+
+        if error is not None:
+            if not self._is_retryable_error(error, idempotent):
+                return None
+        elif response is not None:
+            if response.status_code not in self.retry_config['status_forcelist']:
+                return None
+            if not idempotent and response.status_code not in REJECTED_STATUS_CODES:
+                return None
+        else:
+            return None
+
+        # Exponential backoff with full jitter
+        backoff = min(self.retry_config['backoff_max'], self.retry_config['backoff_factor'] * (2 ** retry_count))
+        delay = random.uniform(0, backoff)
+
+        # Honor the server's Retry-After header when present
+        retry_after = self._parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        # Stop retrying once the time budget for this request would be exceeded
+        elapsed = time.monotonic() - start_time
+        if elapsed + delay > self.retry_config['max_retry_time']:
+            self.logger.warning(f"Retry budget of {self.retry_config['max_retry_time']}s exhausted for {method} {endpoint}.")
+            return None
+
+        return delay
+
+
+    def _is_retryable_error(self, error, idempotent):
+        """
+        Determines whether a request that raised an exception can be retried.
+
+        Parameters:
+            error (Exception): The exception raised by the HTTP library.
+            idempotent (bool): Whether the request can safely be sent more than once.
+
+        Returns:
+            bool: True if the request should be retried, False otherwise.
+        """
+        if not isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return False
+        # A failed connection attempt means the request was never sent
+        connect_failed = (isinstance(error, requests.exceptions.ConnectTimeout)
+                          or self._caused_by(error, urllib3.exceptions.NewConnectionError))
+        return idempotent or connect_failed
+
+
+    def _caused_by(self, error, exception_types):
+        """
+        Checks whether an exception was caused by an exception of the given types.
+
+        requests wraps urllib3 errors, e.g. a ConnectionError whose first argument is a MaxRetryError
+        whose reason is a NewConnectionError, so the chain is followed through args, reason, __cause__ and __context__.
+
+        Parameters:
+            error (Exception): The exception raised by the HTTP library.
+            exception_types (type or tuple): The exception types to look for.
+
+        Returns:
+            bool: True if the exception or one of its causes is an instance of exception_types.
+        """
+        pending = [error]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if not isinstance(current, BaseException) or id(current) in seen:
+                continue
+            seen.add(id(current))
+            if isinstance(current, exception_types):
+                return True
+            pending.extend(current.args)
+            pending.extend((getattr(current, 'reason', None), current.__cause__, current.__context__))
+        return False
+
+
+    def _parse_retry_after(self, response):
+        """
+        Parses the Retry-After header of a response.
+
+        Parameters:
+            response (requests.Response): The HTTP response.
+
+        Returns:
+            float or None: Number of seconds to wait, or None if the header is missing or invalid.
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        # Retry-After can either be a number of seconds or an HTTP date
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
             return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
     def to_dataframe(self, data):
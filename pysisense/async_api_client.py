@@ -0,0 +1,458 @@
+import asyncio
+import json
+import time
+from requests.structures import CaseInsensitiveDict
+from .api_client import APIClient
+from .metrics import RequestInfo, endpoint_template
+from .profiling import request_span
+from .utils import LogPayload
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency: pip install pysisense[async]
+    aiohttp = None
+
+
+class AsyncResponse:
+
+    def __init__(self, status_code, headers, content, url, reason=None):
+        """
+        Initializes a fully read HTTP response returned by AsyncAPIClient.
+
+        The body is read before the underlying connection is released, so the attributes
+        mirror those of requests.Response and SDK code can consume both the same way.
+
+        Parameters:
+            status_code (int): HTTP status code.
+            headers (Mapping): Case-insensitive response headers.
+            content (bytes): Raw response body.
+            url (str): Final URL of the request.
+            reason (str, optional): HTTP reason phrase.
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.reason = reason
+
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+
+    def __bool__(self):
+        # Same truthiness as requests.Response, so 'if not response' keeps working
+        return self.ok
+
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+
+    def json(self):
+        """
+        Decodes the response body as JSON.
+
+        Returns:
+            dict or list: The decoded JSON body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(self.content)
+
+
+    def close(self):
+        # The body is already read, nothing to release
+        pass
+
+
+class AsyncAPIClient(APIClient):
+
+    def __init__(self, config_file="config.yaml", debug=False, max_concurrency=20):
+        """
+        Initializes the asyncio-based API client.
+
+        Configuration, logging, retry policy and the shared rate limiter are the same as APIClient;
+        only the transport differs. get/post/put/patch/delete are coroutines that return an
+        AsyncResponse (same attributes as requests.Response) or None if the request fails.
+
+        Parameters:
+            config_file (str): Path to the YAML configuration file.
+            debug (bool): Flag to enable debug-level logging.
+            max_concurrency (int): Maximum number of requests in flight at the same time.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncAPIClient requires the 'aiohttp' package. "
+                              "Install it with: pip install pysisense[async]")
+
+        self.max_concurrency = int(max_concurrency)
+        self._semaphore = None
+        super().__init__(config_file=config_file, debug=debug)
+
+        # aiohttp advertises the encodings it can decode itself
+        if self.compression_config['accept_encoding']:
+            self.headers.pop('Accept-Encoding', None)
+
+        # The directory cache issues blocking requests, so it is not available on the async client
+        self.directory = None
+
+
+    def __enter__(self):
+        raise TypeError("AsyncAPIClient must be used with 'async with'.")
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+
+    async def close(self):
+        """
+        Closes the underlying aiohttp session and releases all pooled connections.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self.logger.debug("Async HTTP session closed.")
+
+
+    def _create_session(self, pool_config):
+        # The aiohttp session must be created inside the running event loop, see _get_session()
+        return None
+
+
+    def _get_session(self):
+        """
+        Returns the aiohttp session, creating it on first use inside the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: Configured session instance.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=self.verify,
+                force_close=not self.pool_config['keep_alive']
+            )
+            self.session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.logger.debug("Async HTTP session created with max_concurrency=%s", self.max_concurrency)
+        return self.session
+
+
+    async def get(self, endpoint, params=None):
+        """
+        Performs a GET request to the specified API endpoint.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+            params (dict): Optional query parameters.
+
+        Returns:
+            AsyncResponse or None: The HTTP response object, or None if the request fails.
+        """
+        return await self._make_request('GET', endpoint, params=params)
+
+
+    async def post(self, endpoint, data=None):
+        """
+        Performs a POST request to the specified API endpoint.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+            data (dict): Optional JSON data payload for the POST request.
+
+        Returns:
+            AsyncResponse or None: The HTTP response object, or None if the request fails.
+        """
+        return await self._make_request('POST', endpoint, data=data)
+
+
+    async def put(self, endpoint, data=None):
+        """
+        Performs a PUT request to the specified API endpoint.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+            data (dict): Optional JSON data payload for the PUT request.
+
+        Returns:
+            AsyncResponse or None: The HTTP response object, or None if the request fails.
+        """
+        return await self._make_request('PUT', endpoint, data=data)
+
+
+    async def patch(self, endpoint, data=None):
+        """
+        Performs a PATCH request to the specified API endpoint.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+            data (dict): Optional JSON data payload for the PATCH request.
+
+        Returns:
+            AsyncResponse or None: The HTTP response object, or None if the request fails.
+        """
+        return await self._make_request('PATCH', endpoint, data=data)
+
+
+    async def delete(self, endpoint):
+        """
+        Performs a DELETE request to the specified API endpoint.
+
+        Parameters:
+            endpoint (str): API endpoint (relative to the base URL).
+
+        Returns:
+            AsyncResponse or None: The HTTP response object, or None if the request fails.
+        """
+        return await self._make_request('DELETE', endpoint)
+
+
+    async def gather(self, *aws):
+        """
+        Runs several request coroutines concurrently and returns their results in input order.
+
+        Concurrency is bounded by max_concurrency. A coroutine that raises is logged and
+        its result is None, so one failure does not cancel the rest of the batch.
+
+        Parameters:
+            *aws: Awaitables, typically calls such as client.get(endpoint).
+
+        Returns:
+            list: Results in the same order as the given awaitables.
+        """
+        results = await asyncio.gather(*aws, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Concurrent request {index} raised an exception: {result}")
+                results[index] = None
+        return results
+
+
+    # The helpers below are synchronous on APIClient and call get/post without awaiting them,
+    # which cannot work on this client; they point to the asynchronous way of doing the same.
+
+    def map_concurrent(self, requests_list, max_workers=None):
+        raise NotImplementedError("AsyncAPIClient.map_concurrent is not supported. "
+                                  "Use 'await client.gather(*(client.get(endpoint) for endpoint in endpoints))' instead.")
+
+
+    def iter_concurrent(self, requests_iterable, max_workers=None, max_pending=None):
+        raise NotImplementedError("AsyncAPIClient.iter_concurrent is not supported. "
+                                  "Use 'await client.gather(...)', or asyncio.as_completed() on client.get() coroutines, instead.")
+
+
+    def iter_dashboard_searches(self, query_params=None, sort=None, page_size=None, prefetch=True, fields=None):
+        raise NotImplementedError("AsyncAPIClient.iter_dashboard_searches is not supported. "
+                                  "Page through 'await client.post(\"/api/v1/dashboards/searches\", data=...)' with skip/limit, "
+                                  "or use APIClient.iter_dashboard_searches.")
+
+
+    def get_stream(self, endpoint, item_path=None, params=None, chunk_size=None):
+        raise NotImplementedError("AsyncAPIClient.get_stream is not supported. "
+                                  "Use '(await client.get(endpoint)).json()', or APIClient.get_stream for incremental parsing.")
+
+
+    async def _make_request(self, method, endpoint, params=None, data=None):
+        """
+        Makes an HTTP request to the API based on the specified method.
+
+        Parameters:
+            method (str): The HTTP method ('GET', 'POST', 'PUT', 'PATCH', 'DELETE').
+            endpoint (str): The API endpoint (relative to the base URL).
+            params (dict): Optional query parameters (for GET requests).
+            data (dict): Optional JSON data payload (for POST, PUT, PATCH requests).
+
+        Returns:
+            AsyncResponse or None: The full response object if the request succeeds, otherwise None if it fails.
+        """
+        # Each task runs in its own context copy, so concurrent requests nest under the caller's span
+        with request_span(method, endpoint):
+            return await self._send_request(method, endpoint, params=params, data=data)
+
+
+    async def _send_request(self, method, endpoint, params=None, data=None):
+        # Implementation of _make_request(): retries, rate limiting and instrumentation hooks
+        url = f"{self.base_url}{endpoint}"
+        self.logger.debug("Making %s request to %s with data: %s and params: %s", method, url, LogPayload(data), params)
+
+        if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        session = self._get_session()
+        retry_count = 0
+        start_time = time.monotonic()
+        body, body_encoding, body_size = self._encode_body(method, endpoint, data)
+        cache_key = self._http_cache_key(method, endpoint, url, params, False)
+        cache_entry = self.http_cache.get(cache_key) if cache_key else None
+
+        info = RequestInfo(method, endpoint) if self.hooks['pre_request'] or self.hooks['post_request'] else None
+        if info:
+            self._run_hooks('pre_request', info)
+
+        while True:
+            try:
+                # Wait for the endpoint's rate budget on the event loop instead of blocking it
+                if self.rate_limiter:
+                    wait = self.rate_limiter.reserve(endpoint)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                # The session sends the default headers; only per-request additions are passed here
+                headers = dict(cache_entry.validators()) if cache_entry else {}
+                if body_encoding:
+                    headers['Content-Encoding'] = body_encoding
+
+                async with self._semaphore:
+                    async with session.request(
+                        method,
+                        url,
+                        headers=headers or None,
+                        params=params if method == 'GET' else None,
+                        json=data if method in ('POST', 'PUT', 'PATCH') and body is None else None,
+                        data=body
+                    ) as raw_response:
+                        content = await raw_response.read()
+                        response = AsyncResponse(raw_response.status, raw_response.headers, content,
+                                                 str(raw_response.url), raw_response.reason)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self.rate_limiter:
+                    self.rate_limiter.record(endpoint)
+
+                delay = self._get_retry_delay(method, endpoint, retry_count, start_time, error=e)
+                if delay is None:
+                    self.logger.error(f"{method} request to {url} failed: {e}")
+                    if info:
+                        self._finish_request_info(info, start_time, retry_count, error=e)
+                    return None
+
+                retry_count += 1
+                self.logger.warning(f"{method} request to {url} failed: {e}. "
+                                    f"Retrying in {delay:.2f}s (retry {retry_count}/{self.retry_config['max_retries']}).")
+                await asyncio.sleep(delay)
+                continue
+
+            if self.rate_limiter:
+                self.rate_limiter.record(endpoint, response.status_code)
+
+            if body_encoding and response.status_code == 415:
+                self.logger.warning(f"{method} request to {url} rejected the {body_encoding} request body. "
+                                    f"Sending uncompressed bodies to this endpoint from now on.")
+                self._compression_rejected.add(endpoint_template(endpoint))
+                body, body_encoding, body_size = self._encode_body(method, endpoint, data)
+                continue
+
+            delay = self._get_retry_delay(method, endpoint, retry_count, start_time, response=response)
+            if delay is None:
+                break
+
+            retry_count += 1
+            self.logger.warning(f"{method} request to {url} returned status code {response.status_code}. "
+                                f"Retrying in {delay:.2f}s (retry {retry_count}/{self.retry_config['max_retries']}).")
+            await asyncio.sleep(delay)
+
+        wire_response = response
+        if cache_key:
+            response = self._apply_http_cache(cache_key, cache_entry, response)
+
+        if response.status_code in [200, 201, 204]:
+            self.logger.debug("%s request to %s succeeded with status code %s", method, url, response.status_code)
+        elif response.status_code in [400, 404, 500]:
+            self.logger.error(f"{method} request to {url} failed with status code {response.status_code}: "
+                              f"{LogPayload(response)}")
+        else:
+            self.logger.warning(f"{method} request to {url} returned unexpected status code {response.status_code}")
+
+        if info:
+            if body is not None:
+                request_bytes, request_wire_bytes = body_size, len(body)
+            else:
+                request_bytes = request_wire_bytes = len(json.dumps(data).encode()) if data is not None else 0
+            info.cached = response is not wire_response
+            self._finish_request_info(info, start_time, retry_count, response=wire_response, request_bytes=request_bytes,
+                                      request_wire_bytes=request_wire_bytes, request_encoding=body_encoding)
+
+        return response
+
+
+    def _finish_request_info(self, info, start_time, retry_count, response=None, error=None, request_bytes=0,
+                             request_wire_bytes=0, request_encoding=None):
+        """
+        Completes a RequestInfo with the outcome of a request and runs the post-request hooks.
+
+        Parameters:
+            info (RequestInfo): The record created before the first attempt.
+            start_time (float): time.monotonic() of the first attempt.
+            retry_count (int): Number of retries made.
+            response (AsyncResponse, optional): The final response, if any.
+            error (Exception, optional): The exception of the final attempt, if it failed without a response.
+            request_bytes (int, optional): Size of the JSON request body, before compression.
+            request_wire_bytes (int, optional): Size of the request body as sent.
+            request_encoding (str, optional): Content-Encoding of the request body, if compressed.
+        """
+        info.latency = time.monotonic() - start_time
+        info.retries = retry_count
+        info.error = error
+        info.request_bytes = request_bytes
+        info.request_wire_bytes = request_wire_bytes
+        info.request_encoding = request_encoding
+        if response is not None:
+            info.status = response.status_code
+            info.response_bytes = len(response.content)
+            # aiohttp decompresses transparently; the announced length is the size on the wire
+            info.response_encoding = response.headers.get('Content-Encoding')
+            info.response_wire_bytes = int(response.headers.get('Content-Length') or info.response_bytes)
+        self._run_hooks('post_request', info)
+
+
+    def _apply_http_cache(self, key, entry, response):
+        """
+        Serves a 304 Not Modified response from the HTTP cache, or stores a fresh 200 response in it.
+
+        Parameters:
+            key (str): The HTTP cache key of the request.
+            entry (CacheEntry or None): The entry that was revalidated, if any.
+            response (AsyncResponse): The response received from the server.
+
+        Returns:
+            AsyncResponse: The response to return to the caller; a 200 response with the cached body on a 304.
+        """
+        if response.status_code == 304 and entry is not None:
+            self.http_cache.record(hit=True)
+            self.logger.debug("%s not modified, served from the HTTP cache", key)
+            return AsyncResponse(200, CaseInsensitiveDict(entry.headers), entry.content, response.url, 'OK')
+
+        if response.status_code == 200:
+            if entry is not None:
+                self.http_cache.record(hit=False)
+            self.http_cache.put(key, response.content, response.headers)
+        return response
+
+
+    def _is_retryable_error(self, error, idempotent):
+        """
+        Determines whether a request that raised an aiohttp exception can be retried.
+
+        Parameters:
+            error (Exception): The exception raised by aiohttp.
+            idempotent (bool): Whether the request can safely be sent more than once.
+
+        Returns:
+            bool: True if the request should be retried, False otherwise.
+        """
+        # A failed connection attempt means the request was never sent
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return True
+        if isinstance(error, (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError,
+                              aiohttp.ClientPayloadError, asyncio.TimeoutError)):
+            return idempotent
+        return False
@@ -0,0 +1,345 @@
+from .api_client import format_fields
+from .async_api_client import AsyncAPIClient
+
+
+class AsyncAccessManagement:
+
+    def __init__(self, api_client=None, debug=False):
+        """
+        Initializes the asyncio variant of AccessManagement.
+
+        If no API client is provided, a new AsyncAPIClient is created.
+
+        Parameters:
+            api_client (AsyncAPIClient, optional): An existing AsyncAPIClient instance. If None, a new AsyncAPIClient is created.
+            debug (bool, optional): Enables debug logging if True. Default is False.
+        """
+        self.api_client = api_client if api_client else AsyncAPIClient(debug=debug)
+        self.logger = self.api_client.logger
+        self.logger.debug("AsyncAccessManagement class initialized.")
+
+
+    async def get_datamodel_columns(self, datamodel_name):
+        """
+        Retrieves columns from a DataModel by collecting them from its datasets and tables.
+        The tables of all datasets are fetched concurrently.
+
+        Parameters:
+            datamodel_name (str): The name of the DataModel from which to extract columns.
+
+        Returns:
+            list: A list of dictionaries where each dictionary contains DataModel ID, DataModel name, table name, and column name.
+        """
+        self.logger.info(f"Fetching columns for DataModel: {datamodel_name}")
+
+        # Step 1: Get DataModel ID
+        response = await self.api_client.get("/api/v2/datamodels/schema")
+        if not response or response.status_code != 200:
+            self.logger.error(f"Failed to fetch DataModel schema for '{datamodel_name}'")
+            return []
+
+        datamodel_id = next((x.get("oid") for x in response.json() if x.get("title") == datamodel_name), None)
+        if not datamodel_id:
+            self.logger.error(f"DataModel '{datamodel_name}' not found.")
+            return []
+
+        # Step 2: Get DataSets
+        dataset_url = f"/api/v2/datamodels/{datamodel_id}/schema/datasets"
+        response = await self.api_client.get(dataset_url)
+        if not response or response.status_code != 200:
+            self.logger.error(f"Failed to fetch DataSet schema for DataModel ID '{datamodel_id}'")
+            return []
+
+        dataset_ids = [x.get("oid") for x in response.json() if "oid" in x]
+        if not dataset_ids:
+            self.logger.warning(f"No datasets found for DataModel '{datamodel_name}' (ID: {datamodel_id}).")
+            return []
+
+        # Step 3: Fetch the tables of every dataset concurrently
+        responses = await self.api_client.gather(
+            *(self.api_client.get(f"{dataset_url}/{dataset_id}/tables") for dataset_id in dataset_ids)
+        )
+
+        all_columns = []
+        total_tables = 0
+        for dataset_id, response in zip(dataset_ids, responses):
+            if not response or response.status_code != 200:
+                self.logger.error(f"Failed to fetch tables for DataSet ID '{dataset_id}'")
+                continue
+
+            tables = response.json()
+            total_tables += len(tables)
+            for table in tables:
+                table_name = table.get("name")
+                columns = table.get("columns")
+                if not table_name or not isinstance(columns, list):
+                    self.logger.warning(f"Skipping table '{table_name}' in DataSet ID '{dataset_id}': missing name or columns.")
+                    continue
+
+                all_columns.extend(
+                    {
+                        "datamodel_id": datamodel_id,
+                        "datamodel_name": datamodel_name,
+                        "table": table_name,
+                        "column": column["name"]
+                    }
+                    for column in columns if column.get("name")
+                )
+
+        self.logger.info(f"DataModel '{datamodel_name}': Processed {len(dataset_ids)} datasets, "
+                         f"{total_tables} tables, and {len(all_columns)} columns.")
+        return all_columns
+
+
+class AsyncDataModel:
+
+    def __init__(self, api_client=None, debug=False):
+        """
+        Initializes the asyncio variant of DataModel.
+
+        If no API client is provided, a new AsyncAPIClient is created.
+
+        Parameters:
+            api_client (AsyncAPIClient, optional): An existing AsyncAPIClient instance. If None, a new AsyncAPIClient is created.
+            debug (bool, optional): Enables debug logging if True. Default is False.
+        """
+        self.api_client = api_client if api_client else AsyncAPIClient(debug=debug)
+        self.logger = self.api_client.logger
+        self.logger.debug("AsyncDataModel class initialized.")
+
+
+    async def get_datamodel(self, datamodel_name, fields=None):
+        """
+        Retrieves a DataModel by its name.
+
+        Parameters:
+            datamodel_name (str): Name of the DataModel to retrieve.
+            fields (str or list, optional): DataModel fields to return, e.g. ["oid", "type"]. Default: all fields.
+
+        Returns:
+            dict: DataModel details if found, or a dictionary with an error message.
+        """
+        endpoint = f"/api/v2/datamodels/schema?title={datamodel_name}"
+        fields = format_fields(fields)
+        if fields:
+            endpoint += f"&fields={fields}"
+
+        response = await self.api_client.get(endpoint)
+
+        if response is None:
+            self.logger.error(f"No response received from API while retrieving DataModel '{datamodel_name}'")
+            return {"error": "No response from API while retrieving DataModel"}
+
+        if not response.ok:
+            self.logger.error(f"Failed to retrieve DataModel '{datamodel_name}'. "
+                              f"Status Code: {response.status_code}, Error: {response.text}")
+            return {"error": f"Failed to retrieve DataModel. Status Code: {response.status_code}"}
+
+        datamodels = response.json()
+        if not datamodels:
+            self.logger.warning(f"No DataModel found with name '{datamodel_name}'")
+            return {"error": f"DataModel '{datamodel_name}' not found"}
+
+        return datamodels
+
+
+    async def get_data(self, datamodel_name, table_name, query=None):
+        """
+        Retrieves data from a specific table in a DataModel as a list of row dicts.
+
+        Parameters:
+            datamodel_name (str): Name of the DataModel.
+            table_name (str): Name of the table to retrieve data from.
+            query (str): Optional SQL query to filter the data.
+
+        Returns:
+            list: List of dictionaries where each dict represents a row.
+        """
+        if not datamodel_name or not table_name:
+            self.logger.error("DataModel name and table name are required.")
+            return []
+
+        q = query if query else f"SELECT * FROM {table_name}"
+        response = await self.api_client.get(f"/api/datasources/{datamodel_name}/sql?query={q}")
+
+        if not response or response.status_code != 200:
+            error_text = response.text if response is not None else "No response from API."
+            self.logger.error(f"Failed to retrieve data from DataModel '{datamodel_name}', Table '{table_name}'. Error: {error_text}")
+            return []
+
+        raw = response.json()
+        headers = raw.get("headers", [])
+        values = raw.get("values", [])
+        if not headers or not values:
+            self.logger.warning("Empty data received.")
+            return []
+
+        return [dict(zip(headers, row)) for row in values]
+
+
+    async def get_row_count(self, datamodel_name):
+        """
+        Retrieves the row count for each table in a specific DataModel.
+        The COUNT queries of all tables are sent concurrently.
+
+        Parameters:
+            datamodel_name (str): Name of the DataModel.
+
+        Returns:
+            list: List of dictionaries, each with 'table_name' and 'row_count'.
+                Includes an additional row for total row count.
+        """
+        if not datamodel_name:
+            self.logger.error("DataModel name is required.")
+            return []
+
+        datamodel = await self.get_datamodel(datamodel_name)
+        if "error" in datamodel:
+            self.logger.error(f"DataModel '{datamodel_name}' not found.")
+            return []
+
+        table_names = [
+            table.get("name")
+            for dataset in datamodel.get("datasets", [])
+            for table in dataset.get("schema", {}).get("tables", [])
+        ]
+
+        results = await self.api_client.gather(
+            *(self.get_data(datamodel_name, table_name, query=f"SELECT COUNT(*) FROM {table_name}")
+              for table_name in table_names)
+        )
+
+        total_row_count = 0
+        row_info = []
+        for table_name, rows in zip(table_names, results):
+            if not rows:
+                self.logger.warning(f"No data retrieved for table '{table_name}'. Skipping.")
+                continue
+
+            if len(rows) == 1 and isinstance(rows[0], dict):
+                row_count = rows[0].get("Column", 0)
+                row_info.append({"table_name": table_name, "row_count": row_count})
+                total_row_count += row_count
+            else:
+                self.logger.warning(f"Unexpected format for row count data in table '{table_name}'")
+
+        row_info.append({"table_name": "total_row_count", "row_count": total_row_count})
+        self.logger.info(f"Completed row count collection for DataModel '{datamodel_name}'. Total rows: {total_row_count}")
+        return row_info
+
+
+class AsyncDashboard:
+
+    def __init__(self, api_client=None, debug=False):
+        """
+        Initializes the asyncio variant of Dashboard.
+
+        If no API client is provided, a new AsyncAPIClient is created.
+
+        Parameters:
+            api_client (AsyncAPIClient, optional): An existing AsyncAPIClient instance. If None, a new AsyncAPIClient is created.
+            debug (bool, optional): Enables debug logging if True. Default is False.
+        """
+        self.api_client = api_client if api_client else AsyncAPIClient(debug=debug)
+        self.logger = self.api_client.logger
+        self.logger.debug("AsyncDashboard class initialized.")
+
+
+    async def get_all_dashboards(self, fields=None):
+        """
+        Retrieves all dashboards from the Sisense server.
+
+        Parameters:
+            fields (str or list, optional): Dashboard fields to return, e.g. ["oid", "title", "owner"]. Default: all fields.
+
+        Returns:
+            list or dict: A list of dashboards if successful, or a dict containing an error message.
+        """
+        endpoint = "/api/v1/dashboards/admin?dashboardType=owner"
+        fields = format_fields(fields)
+        if fields:
+            endpoint += f"&fields={fields}"
+
+        response = await self.api_client.get(endpoint)
+
+        if response is None:
+            self.logger.error("GET request to retrieve dashboards failed: No response received.")
+            return {"error": "No response received from the server."}
+
+        if response.status_code != 200:
+            self.logger.error(f"Failed to retrieve dashboards. Error: {response.text}")
+            return {"error": f"Failed to retrieve dashboards. {response.text}"}
+
+        dashboards = response.json()
+        self.logger.info(f"Successfully retrieved {len(dashboards)} dashboards.")
+        return dashboards
+
+
+    async def get_dashboard_by_id(self, dashboard_id):
+        """
+        Retrieves a specific dashboard by its ID.
+
+        Parameters:
+            dashboard_id (str): The ID of the dashboard to retrieve.
+
+        Returns:
+            dict: Dashboard details if found, or a dict with an error message if the request fails.
+        """
+        response = await self.api_client.get(f"/api/v1/dashboards/admin?dashboardType=owner&id={dashboard_id}")
+
+        if response is None:
+            self.logger.error(f"GET request to retrieve dashboard {dashboard_id} failed: No response received.")
+            return {"error": f"No response received while retrieving dashboard ID '{dashboard_id}'"}
+
+        if response.status_code != 200:
+            self.logger.error(f"Failed to retrieve dashboard {dashboard_id}. Error: {response.text}")
+            return {"error": f"Failed to retrieve dashboard '{dashboard_id}'. {response.text}"}
+
+        dashboard_data = response.json()
+        if not dashboard_data:
+            self.logger.warning(f"No dashboard found with ID {dashboard_id}.")
+            return {"error": f"No dashboard found with ID '{dashboard_id}'"}
+
+        return dashboard_data
+
+
+    async def get_dashboards_by_id(self, dashboard_ids):
+        """
+        Retrieves several dashboards concurrently.
+
+        Parameters:
+            dashboard_ids (list): IDs of the dashboards to retrieve.
+
+        Returns:
+            dict: Mapping of dashboard ID to its details, or to a dict with an error message.
+        """
+        results = await self.api_client.gather(*(self.get_dashboard_by_id(dashboard_id) for dashboard_id in dashboard_ids))
+        return {
+            dashboard_id: result if result is not None else {"error": f"Failed to retrieve dashboard '{dashboard_id}'"}
+            for dashboard_id, result in zip(dashboard_ids, results)
+        }
+
+
+    async def export_dashboards(self, dashboard_ids):
+        """
+        Exports several dashboards (full .dash definitions) concurrently.
+
+        Parameters:
+            dashboard_ids (list): IDs of the dashboards to export.
+
+        Returns:
+            dict: Mapping of dashboard ID to the exported definition, or None if the export failed.
+        """
+        responses = await self.api_client.gather(
+            *(self.api_client.get(f"/api/dashboards/{dashboard_id}/export?adminAccess=true") for dashboard_id in dashboard_ids)
+        )
+
+        exported = {}
+        for dashboard_id, response in zip(dashboard_ids, responses):
+            if response and response.status_code == 200:
+                exported[dashboard_id] = response.json()
+            else:
+                self.logger.error(f"Failed to export dashboard {dashboard_id}.")
+                exported[dashboard_id] = None
+        self.logger.info(f"Exported {sum(1 for v in exported.values() if v is not None)}/{len(dashboard_ids)} dashboards.")
+        return exported
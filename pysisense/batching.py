@@ -0,0 +1,116 @@
+# Default adaptive batching settings, overridable through the 'bulk_import' section of the target YAML config
+DEFAULT_BULK_IMPORT_CONFIG = {
+    'adaptive': True,                       # Size batches by payload and latency; False falls back to a fixed batch_size
+    'target_latency': 5.0,                  # Seconds a bulk import should take; slower imports shrink the batches
+    'initial_bytes': 2 * 1024 * 1024,       # Payload budget of the first batch
+    'min_bytes': 256 * 1024,                # The budget never shrinks below this (a single larger item is still sent alone)
+    'max_bytes': 32 * 1024 * 1024,          # The budget never grows beyond this
+    'initial_widgets': 200,                 # Widget budget of the first batch
+    'min_widgets': 10,
+    'max_widgets': 2000,
+    'max_items': 50,                        # Most items in one batch, however small they are
+    'growth_factor': 1.5,                   # Budget multiplier after a fast, successful import of a full batch
+    'probe_factor': 1.1,                    # Slower multiplier once the budget reaches the size at which imports last failed
+    'decrease_factor': 0.5                  # Budget multiplier after a failed import
+}
+
+
+class AdaptiveBatcher:
+
+    def __init__(self, config=None, max_items=None):
+        """
+        Initializes a batcher that groups items for bulk requests by cumulative payload size and widget count.
+
+        The budgets adapt to the server: after a full batch is imported faster than the target latency they grow,
+        a slower import shrinks them in proportion to the overshoot, and a failed import halves them. Once a batch
+        has failed or been slow, growth past the reduced budget continues with the smaller probe_factor, so the
+        budget settles just below what the server handles instead of oscillating around it.
+        With 'adaptive' set to False, batches simply hold max_items items.
+
+        Parameters:
+            config (dict, optional): Batching settings. Missing keys fall back to DEFAULT_BULK_IMPORT_CONFIG.
+            max_items (int, optional): Most items in one batch. Defaults to the 'max_items' setting.
+        """
+        self.config = {**DEFAULT_BULK_IMPORT_CONFIG, **(config or {})}
+        self.adaptive = bool(self.config['adaptive'])
+        self.max_bytes = float(self.config['initial_bytes']) if self.adaptive else float('inf')
+        self.max_widgets = float(self.config['initial_widgets']) if self.adaptive else float('inf')
+        self.max_items = int(max_items or self.config['max_items'])
+        # Budgets at the last failed or slow import, beyond which growth slows down
+        self._threshold_bytes = float('inf')
+        self._threshold_widgets = float('inf')
+
+        self._items = []
+        self._bytes = 0
+        self._widgets = 0
+
+
+    def add(self, item, size_bytes, widgets=0):
+        """
+        Adds an item to the current batch.
+
+        Parameters:
+            item: The item, e.g. an exported dashboard.
+            size_bytes (int): Serialized size of the item.
+            widgets (int, optional): Number of widgets of the item. Default: 0.
+
+        Returns:
+            list: The batches that are complete and should be sent now, oldest first (usually none or one).
+        """
+        ready = []
+        if self._items and (self._bytes + size_bytes > self.max_bytes or self._widgets + widgets > self.max_widgets):
+            ready.append(self.flush())
+
+        self._items.append(item)
+        self._bytes += size_bytes
+        self._widgets += widgets
+        if len(self._items) >= self.max_items:
+            ready.append(self.flush())
+        return ready
+
+
+    def flush(self):
+        """
+        Returns the current batch and starts a new one.
+
+        Returns:
+            list: The items of the batch, possibly empty.
+        """
+        items = self._items
+        self._items = []
+        self._bytes = 0
+        self._widgets = 0
+        return items
+
+
+    def record(self, size_bytes, widgets, latency, ok):
+        """
+        Adapts the budgets to the outcome of a bulk request.
+
+        Parameters:
+            size_bytes (int): Total payload size of the batch.
+            widgets (int): Total widget count of the batch.
+            latency (float): Seconds the request took.
+            ok (bool): Whether the request succeeded.
+        """
+        if not self.adaptive:
+            return
+        config = self.config
+        if not ok or latency > config['target_latency']:
+            # A failure halves the budget; a slow import shrinks it towards the batch that would have met the target
+            factor = config['decrease_factor'] if not ok else max(config['decrease_factor'], config['target_latency'] / latency)
+            self.max_bytes = max(config['min_bytes'], min(self.max_bytes, size_bytes) * factor)
+            self.max_widgets = max(config['min_widgets'], min(self.max_widgets, widgets) * factor)
+            self._threshold_bytes = self.max_bytes
+            self._threshold_widgets = self.max_widgets
+        elif size_bytes >= self.max_bytes / 2 or widgets >= self.max_widgets / 2:
+            # Only a batch that used its budget shows that a larger one would be handled as well
+            self.max_bytes = self._grow(self.max_bytes, self._threshold_bytes, config['max_bytes'])
+            self.max_widgets = self._grow(self.max_widgets, self._threshold_widgets, config['max_widgets'])
+
+
+    def _grow(self, budget, threshold, limit):
+        # Fast growth up to the threshold, slow probing beyond it
+        if budget < threshold:
+            return min(limit, threshold, budget * self.config['growth_factor'])
+        return min(limit, budget * self.config['probe_factor'])
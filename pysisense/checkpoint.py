@@ -0,0 +1,231 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+# Phases of a dashboard migration, in the order they run
+PHASES = ('export', 'import', 'shares', 'ownership')
+
+# Phase statuses. 'skipped' means the phase does not apply (e.g. the target already had the dashboard)
+# and, like 'done', counts as completed when resuming.
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+COMPLETED_STATUSES = (DONE, SKIPPED)
+
+# Top-level keys of an exported dashboard that change without the dashboard itself changing
+VOLATILE_DASHBOARD_KEYS = ('lastOpened', 'lastUsed', 'lastUpdated')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dashboards (
+    source_oid TEXT PRIMARY KEY,
+    title TEXT,
+    target_oid TEXT,
+    export TEXT NOT NULL DEFAULT 'pending',
+    import TEXT NOT NULL DEFAULT 'pending',
+    shares TEXT NOT NULL DEFAULT 'pending',
+    ownership TEXT NOT NULL DEFAULT 'pending',
+    error TEXT,
+    source_updated TEXT,
+    content_hash TEXT,
+    updated_at REAL
+)
+"""
+
+
+def dashboard_content_hash(dashboard):
+    """
+    Hashes the content of an exported dashboard, ignoring VOLATILE_DASHBOARD_KEYS.
+
+    Parameters:
+        dashboard (dict): The dashboard as returned by /api/dashboards/{id}/export.
+
+    Returns:
+        str: The SHA-256 hex digest of the canonical JSON of the dashboard.
+    """
+    content = {key: value for key, value in dashboard.items() if key not in VOLATILE_DASHBOARD_KEYS}
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CheckpointJournal:
+
+    def __init__(self, path):
+        """
+        Opens (or creates) a durable journal of dashboard migration progress, keyed by source OID.
+
+        Every phase of every dashboard (export, import, shares, ownership) is recorded as pending,
+        done, failed or skipped in a SQLite database, and each update is committed immediately, so an
+        interrupted migration can be resumed without redoing completed work.
+
+        Parameters:
+            path (str): Path of the SQLite database file, created if missing.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            # WAL keeps commits cheap while still surviving a crash of the process
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(SCHEMA)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+    def reset(self):
+        """
+        Discards every recorded dashboard, e.g. before a migration that does not resume.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM dashboards")
+
+
+    def add(self, source_oids):
+        """
+        Registers dashboards with all phases pending. Dashboards already in the journal keep their status.
+
+        Parameters:
+            source_oids (iterable): Source dashboard OIDs.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO dashboards (source_oid, updated_at) VALUES (?, ?)",
+                ((oid, now) for oid in source_oids)
+            )
+
+
+    def reopen(self, watermarks):
+        """
+        Sets all phases of dashboards back to pending, e.g. because they changed in the source since the last run,
+        and stores their new watermark. Dashboards not yet in the journal are added.
+
+        The target OID and the content hash of the last import are kept, so a dashboard whose exported content
+        turns out to be unchanged is not imported again.
+
+        Parameters:
+            watermarks (dict): Source OID to the 'lastUpdated' value of the dashboard in the source listing.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO dashboards (source_oid, source_updated, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(source_oid) DO UPDATE SET export = 'pending', import = 'pending', shares = 'pending', "
+                "ownership = 'pending', error = NULL, source_updated = excluded.source_updated, updated_at = excluded.updated_at",
+                ((oid, watermark, now) for oid, watermark in watermarks.items())
+            )
+
+
+    def mark(self, source_oids, phase, status, error=None, title=None, target_oid=None, content_hash=None):
+        """
+        Records the status of a phase for one or more dashboards.
+
+        Parameters:
+            source_oids (str or iterable): One source dashboard OID, or several.
+            phase (str): One of PHASES.
+            status (str): 'pending', 'done', 'failed' or 'skipped'.
+            error (str, optional): Reason of a failure; replaces the previously recorded error.
+            title (str, optional): Dashboard title, stored if given.
+            target_oid (str, optional): OID of the dashboard in the target environment, stored if given.
+            content_hash (str, optional): dashboard_content_hash() of the imported export, stored if given.
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown checkpoint phase '{phase}'. Expected one of {PHASES}.")
+        if isinstance(source_oids, str):
+            source_oids = [source_oids]
+
+        # The phase name comes from PHASES, so it is safe to format into the statement
+        statement = (
+            f"INSERT INTO dashboards (source_oid, title, target_oid, content_hash, {phase}, error, updated_at) "
+            f"VALUES (?, ?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT(source_oid) DO UPDATE SET {phase} = excluded.{phase}, "
+            f"title = COALESCE(excluded.title, title), "
+            f"target_oid = COALESCE(excluded.target_oid, target_oid), "
+            f"content_hash = COALESCE(excluded.content_hash, content_hash), "
+            f"error = excluded.error, updated_at = excluded.updated_at"
+        )
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                statement, ((oid, title, target_oid, content_hash, status, error, now) for oid in source_oids)
+            )
+
+
+    def get(self, source_oid):
+        """
+        Returns the recorded state of a dashboard.
+
+        Parameters:
+            source_oid (str): The source dashboard OID.
+
+        Returns:
+            dict or None: The keys source_oid, title, target_oid, error, source_updated, content_hash, updated_at
+                and one per phase, or None if the dashboard is not in the journal.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM dashboards WHERE source_oid = ?", (source_oid,)
+            ).fetchone()
+        return dict(row) if row else None
+
+
+    def entries(self):
+        """
+        Returns the recorded state of every dashboard.
+
+        Returns:
+            dict: Source OID to the dict returned by get().
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT * FROM dashboards").fetchall()
+        return {row['source_oid']: dict(row) for row in rows}
+
+
+    def remaining_phases(self, entry, phases=PHASES):
+        """
+        Lists the phases of a dashboard that still have to run.
+
+        Parameters:
+            entry (dict or None): The state returned by get() or entries().
+            phases (iterable, optional): The phases the migration performs. Default: all of them.
+
+        Returns:
+            list: The phases that are pending or failed, in PHASES order.
+        """
+        if entry is None:
+            return list(phases)
+        return [phase for phase in PHASES if phase in phases and entry[phase] not in COMPLETED_STATUSES]
+
+
+    def summary(self):
+        """
+        Counts the dashboards per phase and status.
+
+        Returns:
+            dict: Phase to a dict of status to count, e.g. {'import': {'done': 40, 'failed': 2}, ...}.
+        """
+        counts = {phase: {} for phase in PHASES}
+        for entry in self.entries().values():
+            for phase in PHASES:
+                counts[phase][entry[phase]] = counts[phase].get(entry[phase], 0) + 1
+        return counts
@@ -1,7 +1,10 @@
-from .api_client import APIClient
+from .api_client import APIClient, format_fields
 from .access_management import AccessManagement
+from .profiling import profile_public_methods
+from .utils import LogPayload
 import json
 
+@profile_public_methods
 class Dashboard:
 
     def __init__(self, api_client=None, debug=False):
@@ -25,29 +28,36 @@ class Dashboard:
         self.logger.debug("Dashboard class initialized.")
 
 
-    def get_all_dashboards(self):
+    def get_all_dashboards(self, fields=None):
         """
         Retrieves all dashboards from the Sisense server.
 
+        Parameters:
+            fields (str or list, optional): Dashboard fields to return, e.g. ["oid", "title", "owner"]. Default: all fields.
+
         Returns:
             list or dict: A list of dashboards if successful,
                         or a dict containing an error message.
         """
         endpoint = "/api/v1/dashboards/admin?dashboardType=owner"
-        self.logger.debug(f"Fetching all dashboards from: {endpoint}")
+        fields = format_fields(fields)
+        if fields:
+            endpoint += f"&fields={fields}"
+        self.logger.debug("Fetching all dashboards from: %s", endpoint)
 
-        response = self.api_client.get(endpoint)
+        # Parsed while downloading, so the raw body and the list are never in memory together
+        dashboard_items = self.api_client.get_stream(endpoint)
 
-        if response is None:
-            self.logger.error("GET request to retrieve dashboards failed: No response received.")
-            return {"error": "No response received from the server."}
+        if dashboard_items is None:
+            self.logger.error("GET request to retrieve dashboards failed.")
+            return {"error": "Failed to retrieve dashboards. Please check the logs for more details."}
 
-        if response.status_code != 200:
-            error_message = response.json() if response else "No response text available."
-            self.logger.error(f"Failed to retrieve dashboards. Error: {error_message}")
-            return {"error": f"Failed to retrieve dashboards. {error_message}"}
+        try:
+            dashboards = list(dashboard_items)
+        except ValueError as e:
+            self.logger.error(f"Failed to parse the dashboards response: {e}")
+            return {"error": f"Failed to parse the dashboards response. {e}"}
 
-        dashboards = response.json()
         self.logger.info(f"Successfully retrieved {len(dashboards)} dashboards.")
         return dashboards
 
@@ -64,7 +74,7 @@ class Dashboard:
                 or a dict with an error message if the request fails.
         """
         endpoint = f"/api/v1/dashboards/admin?dashboardType=owner&id={dashboard_id}"
-        self.logger.debug(f"Fetching dashboard with ID {dashboard_id} from: {endpoint}")
+        self.logger.debug("Fetching dashboard with ID %s from: %s", dashboard_id, endpoint)
 
         response = self.api_client.get(endpoint)
 
@@ -98,7 +108,7 @@ class Dashboard:
                         or {'error': 'message'} if not found or failed.
         """
         endpoint = f"/api/v1/dashboards/admin?dashboardType=owner&name={dashboard_name}"
-        self.logger.debug(f"Fetching dashboard with name {dashboard_name} from: {endpoint}")
+        self.logger.debug("Fetching dashboard with name %s from: %s", dashboard_name, endpoint)
 
         response = self.api_client.get(endpoint)
 
@@ -143,7 +153,7 @@ class Dashboard:
 
         # If executing_user is provided, temporarily change dashboard ownership
         if executing_user:
-            self.logger.debug(f"API username '{executing_user}' provided. Fetching original owner of dashboard {dashboard_id}.")
+            self.logger.debug("API username '%s' provided. Fetching original owner of dashboard %s.", executing_user, dashboard_id)
             
             dashboard_response = self.api_client.get(f"/api/v1/dashboards/admin?dashboardType=owner&id={dashboard_id}&asObject=false")
             if dashboard_response is None or dashboard_response.status_code != 200:
@@ -154,7 +164,7 @@ class Dashboard:
             original_owner_id = dashboard_data[0].get("owner")
             
             # Fetch existing dashboard shares before changing ownership
-            self.logger.debug(f"Retrieving existing shares of dashboard {dashboard_id} to restore later.")
+            self.logger.debug("Retrieving existing shares of dashboard %s to restore later.", dashboard_id)
             shares_response = self.api_client.get(f"/api/shares/dashboard/{dashboard_id}?adminAccess=true")
             
             if shares_response is None or shares_response.status_code != 200:
@@ -185,7 +195,7 @@ class Dashboard:
 
             self.logger.info(f"Ownership of dashboard {dashboard_id} successfully changed to '{executing_user}'.")
         else:
-            self.logger.debug(f"No API username provided. Assuming the dashboard owner is the same as the API user.")
+            self.logger.debug("No API username provided. Assuming the dashboard owner is the same as the API user.")
 
         # Convert script to JSON format if needed
         try:
@@ -194,7 +204,7 @@ class Dashboard:
                 script = json.dumps({"script": script}, ensure_ascii=False)
 
             script_dict = json.loads(script) if isinstance(script, str) else script
-            self.logger.debug(f"Final dashboard script payload prepared: {script_dict}")
+            self.logger.debug("Final dashboard script payload prepared: %s", LogPayload(script_dict))
         except json.JSONDecodeError:
             self.logger.error("Invalid JSON format for dashboard script.")
             return "Error: Dashboard Script must be a valid JSON string."
@@ -278,7 +288,7 @@ class Dashboard:
 
         # If executing_user is provided, temporarily change dashboard ownership
         if executing_user:
-            self.logger.debug(f"API username '{executing_user}' provided. Fetching original owner of dashboard {dashboard_id}.")
+            self.logger.debug("API username '%s' provided. Fetching original owner of dashboard %s.", executing_user, dashboard_id)
             
             dashboard_response = self.api_client.get(f"/api/v1/dashboards/admin?dashboardType=owner&id={dashboard_id}&asObject=false")
             if dashboard_response is None or dashboard_response.status_code != 200:
@@ -289,7 +299,7 @@ class Dashboard:
             original_owner_id = dashboard_data[0].get("owner")
             
             # Fetch existing dashboard shares before changing ownership
-            self.logger.debug(f"Retrieving existing shares of dashboard {dashboard_id} to restore later.")
+            self.logger.debug("Retrieving existing shares of dashboard %s to restore later.", dashboard_id)
             shares_response = self.api_client.get(f"/api/shares/dashboard/{dashboard_id}?adminAccess=true")
             
             if shares_response is None or shares_response.status_code != 200:
@@ -320,7 +330,7 @@ class Dashboard:
 
             self.logger.info(f"Ownership of dashboard {dashboard_id} successfully changed to '{executing_user}'.")
         else:
-            self.logger.debug(f"No API username provided. Assuming the dashboard owner is the same as the API user.")
+            self.logger.debug("No API username provided. Assuming the dashboard owner is the same as the API user.")
 
         # Convert script to JSON format if needed
         try:
@@ -329,7 +339,7 @@ class Dashboard:
                 script = json.dumps({"script": script}, ensure_ascii=False)
 
             script_dict = json.loads(script) if isinstance(script, str) else script
-            self.logger.debug(f"Final widget script payload prepared: {script_dict}")
+            self.logger.debug("Final widget script payload prepared: %s", LogPayload(script_dict))
         except json.JSONDecodeError:
             self.logger.error("Invalid JSON format for widget script.")
             return "Error: Widget Script must be a valid JSON string."
@@ -416,16 +426,17 @@ class Dashboard:
         endpoint = f"/api/shares/dashboard/{dashboard_id}?adminAccess=true"
 
         self.logger.info(f"Starting to add/update shares for dashboard {dashboard_id}.")
-        self.logger.debug(f"Received shares payload: {shares}")
+        self.logger.debug("Received shares payload: %s", LogPayload(shares))
 
         # Get users and groups from shares
         users = [share for share in shares if share["type"] == "user"]
         groups = [share for share in shares if share["type"] == "group"]
 
-        # Resolve user IDs
+        # Resolve user IDs in one pass
+        resolved_users = self.access_mgmt.get_users([user["name"] for user in users]) if users else {}
         for user in users:
-            user_info = self.access_mgmt.get_user(user["name"])
-            if user_info is None:
+            user_info = resolved_users[user["name"]]
+            if "error" in user_info:
                 self.logger.error(f"User '{user['name']}' not found. Skipping.")
                 continue  # Skip this user
             user["shareId"] = user_info["USER_ID"]
@@ -461,7 +472,7 @@ class Dashboard:
 
 
         self.logger.info(f"Existing shares for dashboard {dashboard_id}: {len(existing_shares)} found.")
-        self.logger.debug(f"Existing shares details: {existing_shares}")
+        self.logger.debug("Existing shares details: %s", existing_shares)
 
         # Determine new shares & updates
         new_users = []
@@ -499,7 +510,7 @@ class Dashboard:
         ]
         # Prepare final payload (keeping existing shares + new shares + updated shares)
         payload = {"sharesTo": existing_shares + new_users + new_groups + updated_users + updated_groups}
-        self.logger.debug(f"Final payload for adding/updating shares: {payload}")
+        self.logger.debug("Final payload for adding/updating shares: %s", LogPayload(payload))
 
         # Make the POST request to update shares
         try:
@@ -590,23 +601,23 @@ class Dashboard:
             return []
 
         dashboard = dashboard_data[0]
-        self.logger.debug(f"Analyzing dashboard '{dashboard['title']}' (ID: {dashboard_id})")
+        self.logger.debug("Analyzing dashboard '%s' (ID: %s)", dashboard['title'], dashboard_id)
 
         # Step 3: Extract columns from filters
         filter_count = 0
-        self.logger.debug(f"Extracting columns from filters for dashboard '{dashboard_name}'")
+        self.logger.debug("Extracting columns from filters for dashboard '%s'", dashboard_name)
 
         if "filters" in dashboard:
             total_filters = len(dashboard["filters"])
-            self.logger.debug(f"Total filters found: {total_filters}")
+            self.logger.debug("Total filters found: %s", total_filters)
 
             for filter_index, filter in enumerate(dashboard["filters"], start=1):
                 filter_count += 1
-                self.logger.debug(f"Processing filter {filter_index}/{total_filters}")
+                self.logger.debug("Processing filter %s/%s", filter_index, total_filters)
 
                 if "levels" in filter:
                     levels_count = len(filter["levels"])
-                    self.logger.debug(f"Filter {filter_index}: Extracting {levels_count} levels")
+                    self.logger.debug("Filter %s: Extracting %s levels", filter_index, levels_count)
 
                     for level in filter["levels"]:
                         dim_value = level.get("dim", "Unknown.Table")
@@ -620,7 +631,7 @@ class Dashboard:
                             "column": column
                         })
 
-                        self.logger.debug(f"Filter {filter_index}: Extracted from levels - Table: {table}, Column: {column}")
+                        self.logger.debug("Filter %s: Extracted from levels - Table: %s, Column: %s", filter_index, table, column)
 
                 elif "jaql" in filter:
                     dim_value = filter["jaql"].get("dim", "Unknown.Table")
@@ -634,7 +645,7 @@ class Dashboard:
                         "column": column
                     })
 
-                    self.logger.debug(f"Filter {filter_index}: Extracted from JAQL - Table: {table}, Column: {column}")
+                    self.logger.debug("Filter %s: Extracted from JAQL - Table: %s, Column: %s", filter_index, table, column)
 
         self.logger.info(f"Processed {filter_count} filters for dashboard '{dashboard_name}'")
 
@@ -643,7 +654,7 @@ class Dashboard:
         total_widgets = len(dashboard.get("widgets", []))
         column_count = 0
 
-        self.logger.debug(f"Extracting columns from {total_widgets} widgets in dashboard '{dashboard_name}'")
+        self.logger.debug("Extracting columns from %s widgets in dashboard '%s'", total_widgets, dashboard_name)
 
         for widget_index, widget in enumerate(dashboard.get("widgets", []), start=1):
             # Safely access widget ID and handle potential issues
@@ -670,7 +681,7 @@ class Dashboard:
 
             widget_title = widget.get("title", "Unnamed Widget")
 
-            self.logger.debug(f"Processing widget {widget_index}/{total_widgets} - ID: {widget_id}, Title: {widget_title}")
+            self.logger.debug("Processing widget %s/%s - ID: %s, Title: %s", widget_index, total_widgets, widget_id, widget_title)
 
             for panel in widget.get("metadata", {}).get("panels", []):
                 for item in panel.get("items", []):
@@ -691,7 +702,7 @@ class Dashboard:
                             })
                             column_count += 1
 
-                            self.logger.debug(f"Widget {widget_index}: Extracted from context (Formula) - Key: {context_key}, Table: {table}, Column: {column}")
+                            self.logger.debug("Widget %s: Extracted from context (Formula) - Key: %s, Table: %s, Column: %s", widget_index, context_key, table, column)
 
                     # Case 2: Extract from 'dim' (Regular columns)
                     else:
@@ -707,7 +718,7 @@ class Dashboard:
                         })
                         column_count += 1
 
-                        self.logger.debug(f"Widget {widget_index}: Extracted from regular source - Table: {table}, Column: {column}")
+                        self.logger.debug("Widget %s: Extracted from regular source - Table: %s, Column: %s", widget_index, table, column)
 
         self.logger.info(f"Processed {total_widgets} widgets and extracted {column_count} columns for dashboard '{dashboard_name}'")
 
@@ -765,25 +776,16 @@ class Dashboard:
             self.logger.info(f"Dashboard '{dashboard_name}' has no shares.")
             return []
 
-        # Step 2: Fetch all users
-        users_response = self.api_client.get('/api/v1/users')
-        if not users_response or users_response.status_code != 200:
-            self.logger.error("Failed to fetch users.")
-            return []
-
-        users_data = users_response.json()
-        users_detail = {user["_id"]: user.get("email", "Unknown Email") for user in users_data}
-
-        # Step 3: Fetch all groups
-        groups_response = self.api_client.get('/api/v1/groups')
-        if not groups_response or groups_response.status_code != 200:
-            self.logger.error("Failed to fetch groups.")
+        # Step 2: Index all users and groups by ID
+        principals = self.api_client.directory.get_index()
+        if principals is None:
+            self.logger.error("Failed to fetch users or groups.")
             return []
 
-        groups_data = groups_response.json()
-        groups_detail = {group["_id"]: group.get("name", "Unknown Group") for group in groups_data}
+        users_detail = principals.email_by_user_id
+        groups_detail = principals.group_name_by_id
 
-        # Step 4: Resolve shares
+        # Step 3: Resolve shares
         shared_list = []
         for share in shares:
             share_type = share.get("type")
@@ -792,12 +794,12 @@ class Dashboard:
             if share_type == "user" and share_id in users_detail:
                 shared_list.append({
                     "type": "user",
-                    "name": users_detail[share_id]
+                    "name": users_detail[share_id] or "Unknown Email"
                 })
             elif share_type == "group" and share_id in groups_detail:
                 shared_list.append({
                     "type": "group",
-                    "name": groups_detail[share_id]
+                    "name": groups_detail[share_id] or "Unknown Group"
                 })
 
         self.logger.info(f"Found {len(shared_list)} shares for dashboard '{dashboard_name}'.")
@@ -1,6 +1,10 @@
-from .api_client import APIClient
+from .api_client import APIClient, format_fields
+from .directory import PrincipalIndex
+from .profiling import profile_public_methods
+from .utils import LogPayload
 
 
+@profile_public_methods
 class DataModel:
 
     def __init__(self, api_client=None, debug=False):
@@ -21,19 +25,24 @@ class DataModel:
         self.logger.debug("DataModel class initialized.")
 
 
-    def get_datamodel(self, datamodel_name):
+    def get_datamodel(self, datamodel_name, fields=None):
         """
         Retrieves a DataModel by its name.
 
         Parameters:
             datamodel_name (str): Name of the DataModel to retrieve.
+            fields (str or list, optional): DataModel fields to return, e.g. ["oid", "type"].
+                Default: all fields, including the full datasets and tables.
 
         Returns:
             dict: DataModel details if found, or a dictionary with an error message.
         """
-        self.logger.debug(f"Fetching DataModel with title: '{datamodel_name}'")
+        self.logger.debug("Fetching DataModel with title: '%s'", datamodel_name)
 
         endpoint = f"/api/v2/datamodels/schema?title={datamodel_name}"
+        fields = format_fields(fields)
+        if fields:
+            endpoint += f"&fields={fields}"
         response = self.api_client.get(endpoint)
 
         if response is None:
@@ -51,33 +60,36 @@ class DataModel:
             return {"error": f"DataModel '{datamodel_name}' not found"}
 
         self.logger.info(f"Successfully retrieved DataModel '{datamodel_name}'")
-        self.logger.debug(f"DataModel details: {datamodels}")
+        self.logger.debug("DataModel details: %s", LogPayload(datamodels))
         return datamodels
     
 
-    def get_all_datamodel(self):
+    def get_all_datamodel(self, fields=None):
         """
         Retrieves metadata details of all DataModels using an undocumented internal API.
         This includes additional fields like build status, size, and timestamps that may
         not be available through the standard public endpoints.
 
+        Parameters:
+            fields (str or list, optional): Metadata fields to return.
+                Default: ["oid", "title", "type", "status", "sizeInMb"].
+
         Returns:
             dict: Parsed metadata details of all DataModels, or a dictionary with an error message.
         """
         self.logger.debug("Fetching all DataModel metadata using undocumented API.")
 
+        # The GraphQL selection set is the projection
+        selection = (format_fields(fields) or "oid,title,type,status,sizeInMb").replace(",", "\n                    ")
+
         endpoint = "/api/v2/ecm/"
         payload = {
-            "query": """
-                query elasticubesMetadata($tenantFilter: String, $isViewMode: Boolean) {
-                elasticubesMetadata(tenantFilter: $tenantFilter, isViewMode: $isViewMode) {
-                    oid
-                    title
-                    type
-                    status
-                    sizeInMb
-                }
-                }
+            "query": f"""
+                query elasticubesMetadata($tenantFilter: String, $isViewMode: Boolean) {{
+                elasticubesMetadata(tenantFilter: $tenantFilter, isViewMode: $isViewMode) {{
+                    {selection}
+                }}
+                }}
             """
         }
 
@@ -95,18 +107,20 @@ class DataModel:
 
         new_data = []
         for dm in data["data"]["elasticubesMetadata"]:
-            if "building" in dm.get("status", []):
-                dm["status"] = "building"
-            else:
-                status_list = dm.get("status", [])
-                dm["status"] = status_list[0] if isinstance(status_list, list) and status_list else "unknown"
+            # status is only present if it was part of the projection
+            if "status" in dm:
+                status_list = dm["status"]
+                if "building" in status_list:
+                    dm["status"] = "building"
+                else:
+                    dm["status"] = status_list[0] if isinstance(status_list, list) and status_list else "unknown"
 
             if isinstance(dm.get("sizeInMb"), (int, float)):
                 dm["sizeInMb"] = round(dm["sizeInMb"], 2)
             new_data.append(dm)
         
         self.logger.info("Successfully retrieved all datamodel metadata.")
-        self.logger.debug(f"Datamodel metadata details: {data}")
+        self.logger.debug("Datamodel metadata details: %s", LogPayload(data))
         self.logger.info(f"Total number of datamodels: {len(new_data)}")
         return new_data
     
@@ -121,7 +135,7 @@ class DataModel:
         Returns:
             List: Connection details if found, or a dictionary with an error message.
         """
-        self.logger.debug(f"Attempting to retrieve connections with name: '{connection_name}'")
+        self.logger.debug("Attempting to retrieve connections with name: '%s'", connection_name)
 
         endpoint = f"/api/v2/connections?name={connection_name}"
         response = self.api_client.get(endpoint)
@@ -140,7 +154,7 @@ class DataModel:
             return {"error": f"No connections found with name '{connection_name}'"}
 
         self.logger.info(f"Successfully retrieved connections with name '{connection_name}'")
-        self.logger.debug(f"Connection details: {connections}")
+        self.logger.debug("Connection details: %s", connections)
         return connections
 
 
@@ -160,7 +174,7 @@ class DataModel:
         Returns:
             dict: Table schema details if found, or a dictionary with an error message.
         """
-        self.logger.debug(f"Fetching schema for table '{table_name}' in connection '{connection_name}'")
+        self.logger.debug("Fetching schema for table '%s' in connection '%s'", table_name, connection_name)
 
         # Step 1: Retrieve connection ID and provider
         connection = self.get_connection(connection_name)
@@ -170,7 +184,7 @@ class DataModel:
 
         connection_id = connection[0].get("oid")
         connection_provider = connection[0].get("provider")
-        self.logger.debug(f"Resolved connection ID: {connection_id}, Provider: {connection_provider}")
+        self.logger.debug("Resolved connection ID: %s, Provider: %s", connection_id, connection_provider)
 
         # Step 2: Prepare payload and send request
         endpoint = f"/api/v1/connection/{connection_id}/table_schema_details"
@@ -203,7 +217,7 @@ class DataModel:
             return {"error": f"No schema found for table '{table_name}'"}
 
         self.logger.info(f"Successfully retrieved schema for table '{table_name}'")
-        self.logger.debug(f"Table schema details: {schema}")
+        self.logger.debug("Table schema details: %s", schema)
         return schema
 
 
@@ -218,7 +232,7 @@ class DataModel:
         Returns:
             dict: Dictionary with the DataModel ID if created successfully, or an error message.
         """
-        self.logger.debug(f"Attempting to create DataModel '{datamodel_name}' with type '{datamodel_type}'")
+        self.logger.debug("Attempting to create DataModel '%s' with type '%s'", datamodel_name, datamodel_type)
 
         # Normalize and validate type
         datamodel_type = datamodel_type.lower()
@@ -232,7 +246,7 @@ class DataModel:
         }
 
         endpoint = "/api/v2/datamodels"
-        self.logger.debug(f"Sending request to create DataModel with payload: {payload}")
+        self.logger.debug("Sending request to create DataModel with payload: %s", LogPayload(payload))
         response = self.api_client.post(endpoint, data=payload)
 
         if response is None:
@@ -260,7 +274,7 @@ class DataModel:
             dict: Connections payload.
         """
         datasource_type = datasource_type.upper()
-        self.logger.debug(f"Generating connection payload for datasource type: {datasource_type}")
+        self.logger.debug("Generating connection payload for datasource type: %s", datasource_type)
 
         # Athena connection payload
         if datasource_type == "ATHENA":
@@ -285,7 +299,7 @@ class DataModel:
                     },
                     "supportedModelTypes": ["LIVE", "EXTRACT"]
                 }
-                self.logger.debug(f"Generated Athena connection payload: {payload}")
+                self.logger.debug("Generated Athena connection payload: %s", LogPayload(payload))
                 return payload
 
             except KeyError as e:
@@ -312,7 +326,7 @@ class DataModel:
                     "EXTRACT"
                 ]
             }
-                self.logger.debug(f"Generated Databricks connection payload: {payload}")
+                self.logger.debug("Generated Databricks connection payload: %s", LogPayload(payload))
                 return payload
 
             except KeyError as e:
@@ -346,7 +360,7 @@ class DataModel:
                         "EXTRACT"
                     ]
                 }
-                self.logger.debug(f"Generated BigQuery connection payload: {payload}")
+                self.logger.debug("Generated BigQuery connection payload: %s", LogPayload(payload))
                 return payload
             
             except KeyError as e:
@@ -373,7 +387,7 @@ class DataModel:
                     },
                     "supportedModelTypes": ["LIVE", "EXTRACT"]
                 }
-                self.logger.debug(f"Generated Redshift connection payload: {payload}")
+                self.logger.debug("Generated Redshift connection payload: %s", LogPayload(payload))
                 return payload
             except KeyError as e:
                 self.logger.error(f"Missing required Redshift connection parameter: {e}")
@@ -395,14 +409,14 @@ class DataModel:
             dict or None: JSON response with connection details if successful, otherwise None.
         """
         endpoint = "/api/v2/connections"
-        self.logger.debug(f"Creating connection with payload: {connection_payload}")
+        self.logger.debug("Creating connection with payload: %s", connection_payload)
 
         response = self.api_client.post(endpoint, data=connection_payload)
 
         if response and response.status_code == 201:
             connection_detail = response.json()
             self.logger.info(f"Connection created successfully: {connection_detail.get('name', 'Unknown')}")
-            self.logger.debug(f"Full connection response: {connection_detail}")
+            self.logger.debug("Full connection response: %s", connection_detail)
             return connection_detail
 
         error_msg = response.text if response else "No response received from API."
@@ -424,39 +438,39 @@ class DataModel:
         Returns:
             dict: A dictionary containing the full dataset object on success, or an error message on failure.
         """
-        self.logger.debug(f"Creating dataset in DataModel '{datamodel_name}' with connection '{connection_name}', database '{database_name}', and schema '{schema_name}'")
+        self.logger.debug("Creating dataset in DataModel '%s' with connection '%s', database '%s', and schema '%s'", datamodel_name, connection_name, database_name, schema_name)
 
         # Step 1: Get DataModel ID
-        self.logger.debug(f"Retrieving DataModel ID for '{datamodel_name}'")
-        datamodel = self.get_datamodel(datamodel_name)
+        self.logger.debug("Retrieving DataModel ID for '%s'", datamodel_name)
+        datamodel = self.get_datamodel(datamodel_name, fields=["oid", "type"])
         if "error" in datamodel:
             self.logger.error(f"DataModel '{datamodel_name}' not found. Aborting dataset creation.")
             return {"error": f"DataModel '{datamodel_name}' not found."}
         datamodel_id = datamodel.get("oid")
-        self.logger.debug(f"DataModel ID for '{datamodel_name}': {datamodel_id}")
+        self.logger.debug("DataModel ID for '%s': %s", datamodel_name, datamodel_id)
 
         # Step 2: Get DataModel Type
         datamodel_type = datamodel.get("type")
         if not datamodel_type:
             self.logger.error(f"DataModel '{datamodel_name}' does not have a valid type. Aborting dataset creation.")
             return {"error": f"DataModel '{datamodel_name}' does not have a valid type."}
-        self.logger.debug(f"DataModel Type for '{datamodel_name}': {datamodel_type}")
+        self.logger.debug("DataModel Type for '%s': %s", datamodel_name, datamodel_type)
 
         # Step 2: Get Connection ID
-        self.logger.debug(f"Retrieving Connection ID for '{connection_name}'")
+        self.logger.debug("Retrieving Connection ID for '%s'", connection_name)
         connection = self.get_connection(connection_name)
         if "error" in connection or not connection:
             self.logger.error(f"Connection '{connection_name}' not found. Aborting dataset creation.")
             return {"error": f"Connection '{connection_name}' not found."}
         connection_id = connection[0].get("oid")
-        self.logger.debug(f"Connection ID for '{connection_name}': {connection_id}")
+        self.logger.debug("Connection ID for '%s': %s", connection_name, connection_id)
 
         # Step 3: Use schema as dataset name if not provided
         if not dataset_name:
             dataset_name = schema_name
-            self.logger.debug(f"No dataset name provided. Defaulting to schema name '{schema_name}'")
+            self.logger.debug("No dataset name provided. Defaulting to schema name '%s'", schema_name)
         else:
-            self.logger.debug(f"Using provided dataset name: '{dataset_name}'")
+            self.logger.debug("Using provided dataset name: '%s'", dataset_name)
 
         # Step 4: Build request payload
         payload = {
@@ -466,7 +480,7 @@ class DataModel:
             "database": database_name,
             "schemaName": schema_name
         }
-        self.logger.debug(f"Dataset creation payload: {payload}")
+        self.logger.debug("Dataset creation payload: %s", LogPayload(payload))
 
         # Step 5: Send request
         endpoint = f"/api/v2/datamodels/{datamodel_id}/schema/datasets"
@@ -509,21 +523,21 @@ class DataModel:
         Returns:
             dict: Table object if created successfully or an error message.
         """
-        self.logger.debug(f"[START] Creating table '{table_name}' in DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Creating table '%s' in DataModel '%s'", table_name, datamodel_name)
 
         # Step 1: Get DataModel Info
-        self.logger.debug(f"Retrieving DataModel ID for '{datamodel_name}'")
+        self.logger.debug("Retrieving DataModel ID for '%s'", datamodel_name)
         datamodel = self.get_datamodel(datamodel_name)
         if "error" in datamodel:
             self.logger.error(f"DataModel '{datamodel_name}' not found. Aborting table creation.")
             return {"error": f"DataModel '{datamodel_name}' not found."}
         datamodel_id = datamodel.get("oid")
         datamodel_type = datamodel.get("type")
-        self.logger.debug(f"DataModel ID for '{datamodel_name}': {datamodel_id}")
+        self.logger.debug("DataModel ID for '%s': %s", datamodel_name, datamodel_id)
 
         # Step 2: Get Dataset ID and metadata if not provided
         if not dataset_id:
-            self.logger.debug(f"Retrieving Dataset ID from DataModel '{datamodel_name}'")
+            self.logger.debug("Retrieving Dataset ID from DataModel '%s'", datamodel_name)
             datasets = datamodel.get("datasets")
             if datasets and len(datasets) > 1:
                 self.logger.warning(f"Multiple datasets found in DataModel '{datamodel_name}'. Provide a dataset_id to specify which one to use.")
@@ -533,17 +547,17 @@ class DataModel:
             dataset_id = dataset_info.get("oid")
             if not database_name:
                 database_name = dataset_info.get("database")
-                self.logger.debug(f"Using inferred database name from dataset: {database_name}")
+                self.logger.debug("Using inferred database name from dataset: %s", database_name)
             else:
-                self.logger.debug(f"Using provided database name: {database_name}")
+                self.logger.debug("Using provided database name: %s", database_name)
             if not schema_name:
                 schema_name = dataset_info.get("schemaName")
-                self.logger.debug(f"Using inferred schema name from dataset: {schema_name}")
+                self.logger.debug("Using inferred schema name from dataset: %s", schema_name)
             else:
-                self.logger.debug(f"Using provided schema name: {schema_name}")
+                self.logger.debug("Using provided schema name: %s", schema_name)
             connection_name = dataset_info.get("connection", {}).get("name")
 
-            self.logger.debug(f"Resolved Dataset ID: {dataset_id}, Database Name: {database_name}, Schema Name: {schema_name}, Connection Name: {connection_name}")
+            self.logger.debug("Resolved Dataset ID: %s, Database Name: %s, Schema Name: %s, Connection Name: %s", dataset_id, database_name, schema_name, connection_name)
 
             if not dataset_id:
                 self.logger.error(f"No dataset ID found in DataModel '{datamodel_name}'. Aborting table creation.")
@@ -559,22 +573,22 @@ class DataModel:
                 return {"error": f"No connection name found in DataModel '{datamodel_name}'."}
         else:
             # If dataset_id is provided, fetch metadata
-            self.logger.debug(f"Using provided Dataset ID: {dataset_id}")
+            self.logger.debug("Using provided Dataset ID: %s", dataset_id)
             dataset = self.api_client.get(f"/api/v2/datamodels/{datamodel_id}/schema/datasets/{dataset_id}")
             if dataset and dataset.status_code == 200:
                 dataset_details = dataset.json()
                 if not database_name:
                     database_name = dataset_info.get("database")
-                    self.logger.debug(f"Using inferred database name from dataset: {database_name}")
+                    self.logger.debug("Using inferred database name from dataset: %s", database_name)
                 else:
-                    self.logger.debug(f"Using provided database name: {database_name}")
+                    self.logger.debug("Using provided database name: %s", database_name)
                 if not schema_name:
                     schema_name = dataset_info.get("schemaName")
-                    self.logger.debug(f"Using inferred schema name from dataset: {schema_name}")
+                    self.logger.debug("Using inferred schema name from dataset: %s", schema_name)
                 else:
-                    self.logger.debug(f"Using provided schema name: {schema_name}")
+                    self.logger.debug("Using provided schema name: %s", schema_name)
                 connection_name = dataset_details.get("connection", {}).get("name")
-                self.logger.debug(f"Resolved Dataset ID: {dataset_id}, Database Name: {database_name}, Schema Name: {schema_name}, Connection Name: {connection_name}")
+                self.logger.debug("Resolved Dataset ID: %s, Database Name: %s, Schema Name: %s, Connection Name: %s", dataset_id, database_name, schema_name, connection_name)
             else:
                 self.logger.error(f"Failed to retrieve dataset details for Dataset ID '{dataset_id}'. Status Code: {dataset.status_code}, Error: {dataset.text}")
                 return {"error": f"Failed to retrieve dataset details for Dataset ID '{dataset_id}'"}
@@ -588,14 +602,14 @@ class DataModel:
             self.logger.error(f"Missing database or schema name for table '{table_name}'.")
             return {"error": f"Missing database or schema name for table '{table_name}'."}
 
-        self.logger.debug(f"Fetching schema for table '{table_name}' in database '{db_name_to_use}' and schema '{schema_name_to_use}' under connection '{connection_name}'")
+        self.logger.debug("Fetching schema for table '%s' in database '%s' and schema '%s' under connection '%s'", table_name, db_name_to_use, schema_name_to_use, connection_name)
         table_schema = self.get_table_schema(connection_name, db_name_to_use, schema_name_to_use, table_name)
 
         if "error" in table_schema:
             self.logger.error(f"Failed to retrieve schema for table '{table_name}'. Aborting table creation.")
             return {"error": f"Failed to retrieve schema for table '{table_name}'."}
 
-        self.logger.debug(f"Table schema for '{table_name}': {table_schema}")
+        self.logger.debug("Table schema for '%s': %s", table_name, table_schema)
 
 
         # Step 4: Create Table Payload
@@ -635,7 +649,7 @@ class DataModel:
             "type": "base"
         }
 
-        self.logger.debug(f"Table creation payload: {payload}")
+        self.logger.debug("Table creation payload: %s", LogPayload(payload))
 
         # Step 5: Send POST request to create the table
         endpoint = f"/api/v2/datamodels/{datamodel_id}/schema/datasets/{dataset_id}/tables"
@@ -647,7 +661,7 @@ class DataModel:
 
             # Step 7: Update build behavior if applicable
             if datamodel_type.upper() == "EXTRACT" and build_behavior_config:
-                self.logger.debug(f"Updating build behavior for table '{table_name}' in DataModel '{datamodel_name}'")
+                self.logger.debug("Updating build behavior for table '%s' in DataModel '%s'", table_name, datamodel_name)
                 mode = build_behavior_config.get("mode", "replace")
                 build_behavior = {}
 
@@ -721,19 +735,19 @@ class DataModel:
         Returns:
             dict: A dictionary containing the full DataModel object on success or an error message on failure.
         """
-        self.logger.debug(f"[START] Setup DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Setup DataModel '%s'", datamodel_name)
 
         # Step 1: Create DataModel
-        self.logger.debug(f"Creating DataModel '{datamodel_name}'")
+        self.logger.debug("Creating DataModel '%s'", datamodel_name)
         datamodel_response = self.create_datamodel(datamodel_name=datamodel_name, datamodel_type=datamodel_type)
         if "error" in datamodel_response:
             self.logger.error(f"Failed to create DataModel '{datamodel_name}'. Aborting setup.")
             return {"error": f"Failed to create DataModel '{datamodel_name}'."}
         datamodel_id = datamodel_response.get("datamodel_id")
-        self.logger.debug(f"DataModel '{datamodel_name}' created with ID: {datamodel_id}")
+        self.logger.debug("DataModel '%s' created with ID: %s", datamodel_name, datamodel_id)
 
         # Step 2: Create Dataset
-        self.logger.debug(f"Creating dataset in DataModel '{datamodel_name}'")
+        self.logger.debug("Creating dataset in DataModel '%s'", datamodel_name)
         dataset_response = self.create_dataset(
             datamodel_name=datamodel_name,
             connection_name=connection_name,
@@ -745,14 +759,14 @@ class DataModel:
             self.logger.error(f"Failed to create dataset in DataModel '{datamodel_name}'. Aborting setup.")
             return {"error": f"Failed to create dataset in DataModel '{datamodel_name}'."}
         dataset_id = dataset_response.get("oid")
-        self.logger.debug(f"Dataset created with ID: {dataset_id}")
+        self.logger.debug("Dataset created with ID: %s", dataset_id)
 
         # Step 3: Create Tables
         if not tables:
             self.logger.error("No table definitions provided. Aborting setup.")
             return {"error": "No table definitions provided."}
 
-        self.logger.debug(f"Creating {len(tables)} tables in DataModel '{datamodel_name}'...")
+        self.logger.debug("Creating %s tables in DataModel '%s'...", len(tables), datamodel_name)
 
         created_tables = []
 
@@ -760,7 +774,7 @@ class DataModel:
             table_name = table.get("table_name")
             table_schema_name = table.get("schema_name", schema_name)
             table_database_name = table.get("database_name", database_name)
-            self.logger.debug(f"Creating table '{table_name}' in DataModel '{datamodel_name}'")
+            self.logger.debug("Creating table '%s' in DataModel '%s'", table_name, datamodel_name)
             table_response = self.create_table(
                 datamodel_name=datamodel_name,
                 table_name=table_name,
@@ -777,11 +791,11 @@ class DataModel:
                 self.logger.error(f"Failed to create table '{table_name}' in DataModel '{datamodel_name}'. Aborting setup.")
                 return {"error": f"Failed to create table '{table_name}' in DataModel '{datamodel_name}'."}
 
-            self.logger.debug(f"Table '{table_name}' created successfully.")
+            self.logger.debug("Table '%s' created successfully.", table_name)
             created_tables.append(table_name)
 
         self.logger.info(f"DataModel '{datamodel_name}' setup successfully with tables: {created_tables}")
-        self.logger.debug(f"[END] Setup DataModel '{datamodel_name}'")
+        self.logger.debug("[END] Setup DataModel '%s'", datamodel_name)
         return {
             "datamodel_id": datamodel_id,
             "dataset_id": dataset_id,
@@ -818,21 +832,21 @@ class DataModel:
         Returns:
             dict: Deployment result including status, or error details.
         """
-        self.logger.debug(f"[START] Deploying DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Deploying DataModel '%s'", datamodel_name)
 
         # Step 1: Get DataModel by name
-        datamodel = self.get_datamodel(datamodel_name)
+        datamodel = self.get_datamodel(datamodel_name, fields=["oid", "type"])
         if "error" in datamodel:
             self.logger.error(f"DataModel '{datamodel_name}' not found. Aborting deployment.")
             return {"error": f"DataModel '{datamodel_name}' not found."}
 
         datamodel_id = datamodel.get("oid")
         datamodel_type = datamodel.get("type")
-        self.logger.debug(f"Resolved DataModel ID: {datamodel_id}, Type: {datamodel_type}")
+        self.logger.debug("Resolved DataModel ID: %s, Type: %s", datamodel_id, datamodel_type)
 
         # Step 2: Prepare deployment payload based on model type
         if datamodel_type.upper() == "EXTRACT":
-            self.logger.debug(f"Preparing Elasticube build for '{datamodel_name}'")
+            self.logger.debug("Preparing Elasticube build for '%s'", datamodel_name)
             payload = {
                 "datamodelId": datamodel_id,
                 "buildType": build_type,
@@ -840,7 +854,7 @@ class DataModel:
                 "schemaOrigin": schema_origin
             }
         elif datamodel_type.upper() == "LIVE":
-            self.logger.debug(f"Preparing Live model publish for '{datamodel_name}'")
+            self.logger.debug("Preparing Live model publish for '%s'", datamodel_name)
             payload = {
                 "datamodelId": datamodel_id,
                 "buildType": "publish"
@@ -851,7 +865,7 @@ class DataModel:
 
         # Step 3: Send deployment request
         endpoint = "/api/v2/builds"
-        self.logger.debug(f"Sending POST request to '{endpoint}' with payload: {payload}")
+        self.logger.debug("Sending POST request to '%s' with payload: %s", endpoint, LogPayload(payload))
         response = self.api_client.post(endpoint, data=payload)
 
         if response and response.status_code == 201:
@@ -873,7 +887,7 @@ class DataModel:
         Returns:
             dict: Detailed information about the DataModel, or an error message if not found.
         """
-        self.logger.debug(f"[START] Describing DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Describing DataModel '%s'", datamodel_name)
 
         # Step 1: Get DataModel by name
         datamodel = self.get_datamodel(datamodel_name)
@@ -911,7 +925,7 @@ class DataModel:
             tables = dataset.get("schema", {}).get("tables", [])
             table_info = []
 
-            self.logger.debug(f"Resolving tables for dataset '{dataset_name}'")
+            self.logger.debug("Resolving tables for dataset '%s'", dataset_name)
             for table in tables:
                 self.logger.debug(table)
                 table_name = table.get("name", "Unknown Table")
@@ -929,7 +943,7 @@ class DataModel:
                 "tables": table_info
             })
 
-        self.logger.debug(f"Resolved datasets: {dataset_info}")
+        self.logger.debug("Resolved datasets: %s", dataset_info)
         self.logger.info(f"Total datasets resolved: {len(dataset_info)}")
 
         
@@ -957,7 +971,7 @@ class DataModel:
         Returns:
             list: List of dictionaries, each representing a single table row with context (datamodel, dataset, table).
         """
-        self.logger.debug(f"[START] Generating flat structure for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Generating flat structure for DataModel '%s'", datamodel_name)
 
         # Step 1: Get DataModel by name
         datamodel = self.get_datamodel(datamodel_name)
@@ -1020,7 +1034,7 @@ class DataModel:
         Returns:
             list: List of dicts with datamodel name, party name, type, and permission.
         """
-        self.logger.debug(f"[START] Resolving share info for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Resolving share info for DataModel '%s'", datamodel_name)
 
         # Step 1: Get datamodel object
         datamodel = self.get_datamodel(datamodel_name)
@@ -1030,25 +1044,19 @@ class DataModel:
 
         datamodel_id = datamodel.get("oid")
 
-        # Step 2: Fetch all users
+        # Step 2: Index all users
         self.logger.debug("Fetching all users for share resolution.")
-        users_response = self.api_client.get('/api/v1/users')
-        users_detail = []
-        if users_response and users_response.status_code == 200:
-            users_data = users_response.json()
-            users_detail = [{"id": user["_id"], "email": user.get("email", "Unknown Email")} for user in users_data]
-        else:
+        users_index = self.api_client.directory.get_index(groups=False)
+        if users_index is None:
             self.logger.warning("Could not fetch users for share resolution.")
+            users_index = PrincipalIndex()
 
-        # Step 3: Fetch all groups
+        # Step 3: Index all groups
         self.logger.debug("Fetching all groups for share resolution.")
-        groups_response = self.api_client.get('/api/v1/groups')
-        groups_detail = []
-        if groups_response and groups_response.status_code == 200:
-            groups_data = groups_response.json()
-            groups_detail = [{"id": group["_id"], "name": group.get("name", "Unknown Group")} for group in groups_data]
-        else:
+        groups_index = self.api_client.directory.get_index(users=False)
+        if groups_index is None:
             self.logger.warning("Could not fetch groups for share resolution.")
+            groups_index = PrincipalIndex()
 
         # Step 4: Parse shares
         permission_map = {"w": "EDIT", "a": "READ", "r": "USE"}
@@ -1063,11 +1071,15 @@ class DataModel:
 
             name = None
             if party_type == "user":
-                user = next((u for u in users_detail if u["id"] == party_id), None)
-                name = user["email"] if user else f"[Unknown user: {party_id}]"
+                if party_id in users_index.email_by_user_id:
+                    name = users_index.email_by_user_id[party_id] or "Unknown Email"
+                else:
+                    name = f"[Unknown user: {party_id}]"
             elif party_type == "group":
-                group = next((g for g in groups_detail if g["id"] == party_id), None)
-                name = group["name"] if group else f"[Unknown group: {party_id}]"
+                if party_id in groups_index.group_name_by_id:
+                    name = groups_index.group_name_by_id[party_id] or "Unknown Group"
+                else:
+                    name = f"[Unknown group: {party_id}]"
 
             resolved_shares.append({
                 "datamodel_name": datamodel_name,
@@ -1092,7 +1104,7 @@ class DataModel:
             list: List of dicts with datamodel name, table name, column name, and security type.
                 If no rules exist, a single row is returned with empty values and the datamodel name.
         """
-        self.logger.debug(f"[START] Resolving datasecurity info for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Resolving datasecurity info for DataModel '%s'", datamodel_name)
 
         # Step 1: Get datamodel object
         datamodel = self.get_datamodel(datamodel_name)
@@ -1111,7 +1123,7 @@ class DataModel:
             url = f"/api/v1/elasticubes/live/{datamodel_name}/datasecurity"
 
         # Step 3: Fetch datasecurity
-        self.logger.debug(f"Fetching datasecurity from '{url}'")
+        self.logger.debug("Fetching datasecurity from '%s'", url)
         datasecurity_response = self.api_client.get(url)
         if not datasecurity_response or datasecurity_response.status_code != 200:
             self.logger.warning(f"Could not fetch datasecurity for DataModel '{datamodel_name}'.")
@@ -1123,7 +1135,7 @@ class DataModel:
             }]
 
         datasecurity_data = datasecurity_response.json()
-        self.logger.debug(f"Datasecurity data: {datasecurity_data}")
+        self.logger.debug("Datasecurity data: %s", LogPayload(datasecurity_data))
 
         # Step 4: Parse datasecurity
         datasecurity_info = []
@@ -1173,7 +1185,7 @@ class DataModel:
         Returns:
             list: A list of dictionaries representing datasecurity rules in flat, share-resolved format.
         """
-        self.logger.debug(f"[START] Resolving datasecurity info for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Resolving datasecurity info for DataModel '%s'", datamodel_name)
 
         # Step 1: Get datamodel object
         datamodel = self.get_datamodel(datamodel_name)
@@ -1192,7 +1204,7 @@ class DataModel:
             url = f"/api/v1/elasticubes/live/{datamodel_name}/datasecurity"
 
         # Step 3: Fetch datasecurity
-        self.logger.debug(f"Fetching datasecurity from '{url}'")
+        self.logger.debug("Fetching datasecurity from '%s'", url)
         datasecurity_response = self.api_client.get(url)
         if not datasecurity_response or datasecurity_response.status_code != 200:
             self.logger.warning(f"Could not fetch datasecurity for DataModel '{datamodel_name}'.")
@@ -1209,7 +1221,7 @@ class DataModel:
             }]
 
         datasecurity_data = datasecurity_response.json()
-        self.logger.debug(f"Datasecurity data: {datasecurity_data}")
+        self.logger.debug("Datasecurity data: %s", LogPayload(datasecurity_data))
 
         # Step 4: Parse datasecurity rules
         detailed_rows = []
@@ -1310,7 +1322,7 @@ class DataModel:
             list: A list of dictionaries containing schema information (one per column),
                 or an error message if not found.
         """
-        self.logger.debug(f"[START] Resolving schema for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Resolving schema for DataModel '%s'", datamodel_name)
 
         # Step 1: Get DataModel by name
         datamodel = self.get_datamodel(datamodel_name)
@@ -1358,7 +1370,7 @@ class DataModel:
                     schema_info.append(info)
                     column_count += 1
 
-                self.logger.debug(f"Processed table '{table_name}' with {column_count} columns.")
+                self.logger.debug("Processed table '%s' with %s columns.", table_name, column_count)
                 table_count += 1
 
         self.logger.info(f"Resolved schema for {table_count} tables in DataModel '{datamodel_name}'")
@@ -1380,7 +1392,7 @@ class DataModel:
         Returns:
             dict: Result of the share addition operation.
         """
-        self.logger.debug(f"[START] Adding shares to DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Adding shares to DataModel '%s'", datamodel_name)
 
         # Step 1: Get DataModel by name
         datamodel = self.get_datamodel(datamodel_name)
@@ -1394,25 +1406,19 @@ class DataModel:
         # Step 2: Get existing shares
         existing_shares = datamodel.get("shares", [])
 
-        # Step 3: Fetch users
+        # Step 3: Index users
         self.logger.debug("Fetching all users for share resolution.")
-        users_response = self.api_client.get('/api/v1/users')
-        users_detail = []
-        if users_response and users_response.status_code == 200:
-            users_data = users_response.json()
-            users_detail = [{"id": user["_id"], "email": user.get("email", "Unknown Email")} for user in users_data]
-        else:
+        users_index = self.api_client.directory.get_index(groups=False)
+        if users_index is None:
             self.logger.warning("Could not fetch users for share resolution.")
+            users_index = PrincipalIndex()
 
-        # Step 4: Fetch groups
+        # Step 4: Index groups
         self.logger.debug("Fetching all groups for share resolution.")
-        groups_response = self.api_client.get('/api/v1/groups')
-        groups_detail = []
-        if groups_response and groups_response.status_code == 200:
-            groups_data = groups_response.json()
-            groups_detail = [{"id": group["_id"], "name": group.get("name", "Unknown Group")} for group in groups_data]
-        else:
+        groups_index = self.api_client.directory.get_index(users=False)
+        if groups_index is None:
             self.logger.warning("Could not fetch groups for share resolution.")
+            groups_index = PrincipalIndex()
 
         # Step 5: Prepare new shares with normalized permission
         reverse_permission_map = {"edit": "w", "read": "a", "use": "r"}
@@ -1425,20 +1431,20 @@ class DataModel:
             permission_short = reverse_permission_map.get(permission_raw, permission_raw)
 
             if share_type == "user":
-                user = next((u for u in users_detail if u["email"] == name), None)
-                if user:
+                user_id = users_index.user_id_by_email.get(name)
+                if user_id:
                     new_shares.append({
-                        "partyId": user["id"],
+                        "partyId": user_id,
                         "type": "user",
                         "permission": permission_short
                     })
                 else:
                     self.logger.warning(f"User '{name}' not found. Skipping share addition.")
             elif share_type == "group":
-                group = next((g for g in groups_detail if g["name"] == name), None)
-                if group:
+                group_id = groups_index.group_id(name)
+                if group_id:
                     new_shares.append({
-                        "partyId": group["id"],
+                        "partyId": group_id,
                         "type": "group",
                         "permission": permission_short
                     })
@@ -1448,8 +1454,8 @@ class DataModel:
                 self.logger.warning(f"Invalid share type '{share_type}' for '{name}'. Skipping share addition.")
 
         # Step 6: Combine existing and new shares
-        self.logger.debug(f"Existing shares: {existing_shares}")
-        self.logger.debug(f"New shares: {new_shares}")
+        self.logger.debug("Existing shares: %s", existing_shares)
+        self.logger.debug("New shares: %s", new_shares)
         payload = existing_shares + new_shares
 
         # Step 7: Determine API endpoint
@@ -1463,7 +1469,7 @@ class DataModel:
             return {"error": f"Unsupported DataModel type '{datamodel_type}' for '{datamodel_name}'."}
 
         # Step 8: Send POST request with payload
-        self.logger.debug(f"Payload for adding shares to DataModel '{datamodel_name}': {payload}")
+        self.logger.debug("Payload for adding shares to DataModel '%s': %s", datamodel_name, LogPayload(payload))
         response = self.api_client.patch(endpoint, data=payload)
         if response and response.status_code == 200:
             self.logger.info(f"Shares added successfully to DataModel '{datamodel_name}'")
@@ -1487,17 +1493,17 @@ class DataModel:
         Returns:
             list: List of dictionaries where each dict represents a row.
         """
-        self.logger.debug(f"[START] Retrieving data from DataModel '{datamodel_name}', Table '{table_name}'")
+        self.logger.debug("[START] Retrieving data from DataModel '%s', Table '%s'", datamodel_name, table_name)
 
         if not datamodel_name or not table_name:
             self.logger.error("DataModel name and table name are required.")
             return []
 
         q = query if query else f"SELECT * FROM {table_name}"
-        self.logger.debug(f"SQL Query: {q}")
+        self.logger.debug("SQL Query: %s", q)
 
         url = f"/api/datasources/{datamodel_name}/sql?query={q}"
-        self.logger.debug(f"Resolved URL: {url}")
+        self.logger.debug("Resolved URL: %s", url)
 
         response = self.api_client.get(url)
 
@@ -1534,7 +1540,7 @@ class DataModel:
             list: List of dictionaries, each with 'table_name' and 'row_count'.
                 Includes an additional row for total row count.
         """
-        self.logger.debug(f"[START] Retrieving row count for DataModel '{datamodel_name}'")
+        self.logger.debug("[START] Retrieving row count for DataModel '%s'", datamodel_name)
 
         if not datamodel_name:
             self.logger.error("DataModel name is required.")
@@ -1551,7 +1557,7 @@ class DataModel:
             tables = dataset.get("schema", {}).get("tables", [])
             for table in tables:
                 table_names.append(table.get("name"))
-        self.logger.debug(f"Resolved table names: {table_names}")
+        self.logger.debug("Resolved table names: %s", table_names)
 
         # Step 2: Get row count per table
         total_row_count = 0
@@ -1559,7 +1565,7 @@ class DataModel:
 
         for table_name in table_names:
             query = f"SELECT COUNT(*) FROM {table_name}"
-            self.logger.debug(f"SQL Query for table '{table_name}': {query}")
+            self.logger.debug("SQL Query for table '%s': %s", table_name, query)
             rows = self.get_data(datamodel_name, table_name, query=query)
 
             if not rows:
@@ -1568,7 +1574,7 @@ class DataModel:
 
             if len(rows) == 1 and isinstance(rows[0], dict):
                 row_count = rows[0].get("Column", 0)
-                self.logger.debug(f"Row count for table '{table_name}': {row_count}")
+                self.logger.debug("Row count for table '%s': %s", table_name, row_count)
                 row_info.append({"table_name": table_name, "row_count": row_count})
                 total_row_count += row_count
             else:
@@ -0,0 +1,299 @@
+import threading
+import time
+
+
+# Default directory cache settings, overridable through the 'directory_cache' section of the YAML config
+DEFAULT_DIRECTORY_CACHE_CONFIG = {
+    'enabled': True,
+    'ttl': 300      # Seconds a fetched users/groups/roles list stays valid
+}
+
+# Endpoints of the cached directory resources
+DIRECTORY_ENDPOINTS = {
+    'users': '/api/v1/users',
+    'groups': '/api/v1/groups',
+    'roles': '/api/roles'
+}
+
+
+class DirectoryCache:
+
+    def __init__(self, api_client, config=None):
+        """
+        Initializes a TTL-bounded cache of the users, groups and roles lists of one Sisense server.
+
+        Every SDK class sharing the same APIClient reads the directory through this cache, so the
+        full lists are downloaded at most once per TTL instead of once per method call.
+        Cached lists are shared between callers and must be treated as read-only.
+
+        Parameters:
+            api_client (APIClient): The client used to fetch the directory.
+            config (dict, optional): Cache settings. Missing keys fall back to DEFAULT_DIRECTORY_CACHE_CONFIG.
+        """
+        self.api_client = api_client
+        self.config = {**DEFAULT_DIRECTORY_CACHE_CONFIG, **(config or {})}
+        self._entries = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._indexes = {}
+
+
+    def get_users(self, expand=None, fields=None):
+        """
+        Returns all users of the server.
+
+        Parameters:
+            expand (str, optional): Value of the 'expand' query parameter, e.g. 'groups,role'.
+            fields (str, optional): Value of the 'fields' query parameter, e.g. '_id,email'.
+
+        Returns:
+            list or None: The list of user objects, or None if the request fails.
+        """
+        params = {key: value for key, value in (('expand', expand), ('fields', fields)) if value}
+        return self._get('users', params or None)
+
+
+    def has_users(self, expand=None, fields=None):
+        """
+        Checks whether a fresh users list is cached, i.e. get_users() would not send a request.
+
+        Parameters:
+            expand (str, optional): Value of the 'expand' query parameter, as passed to get_users().
+            fields (str, optional): Value of the 'fields' query parameter, as passed to get_users().
+
+        Returns:
+            bool: True if the list is cached and not expired.
+        """
+        if not self.config['enabled']:
+            return False
+        params = {key: value for key, value in (('expand', expand), ('fields', fields)) if value}
+        entry = self._entries.get(('users', tuple(sorted(params.items()))))
+        return bool(entry) and time.monotonic() - entry[0] < self.config['ttl']
+
+
+    def iter_users(self, expand=None, fields=None):
+        """
+        Returns an iterator over all users of the server.
+
+        A fresh cached list is reused. When the cache is disabled, users are parsed one at a time
+        from the response as it arrives, so the full list is never held in memory.
+
+        Parameters:
+            expand (str, optional): Value of the 'expand' query parameter, e.g. 'groups,role'.
+            fields (str, optional): Value of the 'fields' query parameter, e.g. '_id,email'.
+
+        Returns:
+            iterator or None: The user objects, or None if the request fails.
+        """
+        params = {key: value for key, value in (('expand', expand), ('fields', fields)) if value}
+        if self.config['enabled']:
+            users = self._get('users', params or None)
+            return iter(users) if users is not None else None
+        return self._fetch_stream('users', params or None)
+
+
+    def get_groups(self):
+        """
+        Returns all groups of the server.
+
+        Returns:
+            list or None: The list of group objects, or None if the request fails.
+        """
+        return self._get('groups')
+
+
+    def get_roles(self):
+        """
+        Returns all roles of the server.
+
+        Returns:
+            list or None: The list of role objects, or None if the request fails.
+        """
+        return self._get('roles')
+
+
+    def get_index(self, users=True, groups=True, roles=False):
+        """
+        Returns a PrincipalIndex over the cached directory lists.
+
+        The index is rebuilt only when one of the underlying lists has been refetched,
+        so repeated calls within the TTL cost a dictionary lookup.
+
+        Parameters:
+            users (bool, optional): Whether to index users. Default: True.
+            groups (bool, optional): Whether to index groups. Default: True.
+            roles (bool, optional): Whether to index roles. Default: False.
+
+        Returns:
+            PrincipalIndex or None: The index, or None if one of the requested lists could not be fetched.
+        """
+        sources = (
+            self.get_users() if users else (),
+            self.get_groups() if groups else (),
+            self.get_roles() if roles else ()
+        )
+        if any(source is None for source in sources):
+            return None
+
+        key = (users, groups, roles)
+        with self._lock:
+            # Compare by identity: a refetched list is a new object, an unchanged one is reused as is
+            cached = self._indexes.get(key)
+            if cached is None or any(a is not b for a, b in zip(cached[0], sources)):
+                cached = (sources, PrincipalIndex(*sources))
+                self._indexes[key] = cached
+            return cached[1]
+
+
+    def invalidate(self, resource=None):
+        """
+        Drops cached entries so the next read fetches fresh data. Call after writes to the directory.
+
+        Parameters:
+            resource (str, optional): 'users', 'groups' or 'roles'. If None, the whole cache is cleared.
+        """
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == resource]:
+                    del self._entries[key]
+        self.api_client.logger.debug("Directory cache invalidated: %s", resource or 'all')
+
+
+    def _get(self, resource, params=None):
+        """
+        Returns a cached directory list, fetching it when missing or expired.
+
+        Parameters:
+            resource (str): 'users', 'groups' or 'roles'.
+            params (dict, optional): Query parameters of the request; each combination is cached separately.
+
+        Returns:
+            list or None: The parsed response body, or None if the request fails.
+        """
+        if not self.config['enabled']:
+            return self._fetch(resource, params)
+
+        key = (resource, tuple(sorted((params or {}).items())))
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One fetch per key at a time, so concurrent callers wait for the first one instead of refetching
+        with key_lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < self.config['ttl']:
+                self.api_client.logger.debug("Directory cache hit: %s %s", resource, params or '')
+                return entry[1]
+
+            data = self._fetch(resource, params)
+            if data is not None:
+                with self._lock:
+                    self._entries[key] = (time.monotonic(), data)
+            return data
+
+
+    def _fetch(self, resource, params=None):
+        items = self._fetch_stream(resource, params)
+        if items is None:
+            return None
+        # Parsed while downloading, so the raw body and the list are never in memory together
+        try:
+            return list(items)
+        except ValueError as e:
+            # Raised by get_stream() for an invalid body or a connection lost while reading it
+            self.api_client.logger.error(f"Failed to read {resource} for the directory cache: {e}")
+            return None
+
+
+    def _fetch_stream(self, resource, params=None):
+        items = self.api_client.get_stream(DIRECTORY_ENDPOINTS[resource], params=params)
+        if items is None:
+            self.api_client.logger.error(f"Failed to fetch {resource} for the directory cache.")
+        return items
+
+
+class PrincipalIndex:
+
+    def __init__(self, users=None, groups=None, roles=None):
+        """
+        Initializes hash maps for resolving users, groups and roles in constant time.
+
+        Parameters:
+            users (list, optional): User objects as returned by /api/v1/users.
+            groups (list, optional): Group objects as returned by /api/v1/groups.
+            roles (list, optional): Role objects as returned by /api/roles.
+        """
+        self.email_by_user_id = {}
+        self.user_id_by_email = {}
+        for user in users or []:
+            email = user.get("email")
+            self.email_by_user_id[user["_id"]] = email
+            if email:
+                self.user_id_by_email[email] = user["_id"]
+
+        self.group_name_by_id = {group["_id"]: group.get("name") for group in groups or []}
+        self.group_id_by_name = {name: group_id for group_id, name in self.group_name_by_id.items() if name}
+
+        self.role_id_by_name = {role["name"]: role["_id"] for role in roles or [] if role.get("name")}
+
+        # Upper-cased keys for case-insensitive lookups
+        self._group_id_by_upper_name = {name.upper(): group_id for name, group_id in self.group_id_by_name.items()}
+        self._role_id_by_upper_name = {name.upper(): role_id for name, role_id in self.role_id_by_name.items()}
+
+
+    def group_id(self, name, ignore_case=False):
+        """
+        Resolves a group name to its ID.
+
+        Parameters:
+            name (str): The group name.
+            ignore_case (bool, optional): Whether to match the name case-insensitively. Default: False.
+
+        Returns:
+            str or None: The group ID, or None if no group has that name.
+        """
+        if ignore_case:
+            return self._group_id_by_upper_name.get(name.upper())
+        return self.group_id_by_name.get(name)
+
+
+    def role_id(self, name, ignore_case=False):
+        """
+        Resolves a role name to its ID.
+
+        Parameters:
+            name (str): The role name.
+            ignore_case (bool, optional): Whether to match the name case-insensitively. Default: False.
+
+        Returns:
+            str or None: The role ID, or None if no role has that name.
+        """
+        if ignore_case:
+            return self._role_id_by_upper_name.get(name.upper())
+        return self.role_id_by_name.get(name)
+
+
+    def map_to(self, other, excluded_groups=()):
+        """
+        Maps the user and group IDs of this directory to the IDs of the same principals in another one.
+        Users are matched by email and groups by name.
+
+        Parameters:
+            other (PrincipalIndex): The index of the other (typically target) environment.
+            excluded_groups (iterable, optional): Group names left out of the group mapping.
+
+        Returns:
+            tuple: (user_mapping, group_mapping), each a dict of this directory's ID to the other's ID, or None if unmatched.
+        """
+        user_mapping = {
+            user_id: other.user_id_by_email.get(email)
+            for user_id, email in self.email_by_user_id.items()
+        }
+        group_mapping = {
+            group_id: other.group_id_by_name.get(name)
+            for group_id, name in self.group_name_by_id.items()
+            if name not in excluded_groups
+        }
+        return user_mapping, group_mapping
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatch
+
+
+# Default HTTP cache settings, overridable through the 'http_cache' section of the YAML config
+DEFAULT_HTTP_CACHE_CONFIG = {
+    'enabled': False,                   # Opt-in: without an http_cache section responses are not cached
+    'max_entries': 256,                 # Responses kept in memory
+    'max_bytes': 64 * 1024 * 1024,      # Total size of the response bodies kept in memory
+    'max_entry_bytes': 16 * 1024 * 1024,  # Larger responses are not cached
+    'directory': None,                  # Optional directory persisting the cache across runs
+    'max_disk_bytes': 512 * 1024 * 1024,  # Total size of the on-disk cache
+    'endpoints': [                      # GET endpoints (path prefix or glob pattern) whose responses are cached
+        '/api/v2/datamodels/schema',
+        '/api/v2/datamodel-exports/schema',
+        '/api/v1/navver',
+        '/api/roles',
+        '/api/v1/dashboards/export',
+        '/api/dashboards/*/export'
+    ]
+}
+
+# Response headers stored with a cached body
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class CacheEntry:
+
+    def __init__(self, content, headers):
+        """
+        Initializes a cached response body with its validators.
+
+        Parameters:
+            content (bytes): The decoded response body.
+            headers (dict): The response headers listed in CACHED_HEADERS.
+        """
+        self.content = content
+        self.headers = headers
+
+
+    @property
+    def etag(self):
+        return self.headers.get('ETag')
+
+
+    @property
+    def last_modified(self):
+        return self.headers.get('Last-Modified')
+
+
+    def validators(self):
+        """
+        Returns the conditional request headers that revalidate this entry.
+
+        Returns:
+            dict: If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+
+    def __init__(self, config=None):
+        """
+        Initializes an LRU cache of GET responses that carry ETag or Last-Modified validators.
+
+        Cached responses are always revalidated with a conditional request; a 304 Not Modified
+        answer is served from the cache instead of downloading the body again. Entries are kept
+        in memory and, if a directory is configured, on disk so they survive between runs.
+
+        Parameters:
+            config (dict, optional): Cache settings. Missing keys fall back to DEFAULT_HTTP_CACHE_CONFIG.
+        """
+        self.config = {**DEFAULT_HTTP_CACHE_CONFIG, **(config or {})}
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.directory = self.config['directory']
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+
+    def is_cacheable(self, endpoint):
+        """
+        Checks whether responses of an endpoint are cached.
+
+        Parameters:
+            endpoint (str): The API endpoint (relative to the base URL).
+
+        Returns:
+            bool: True if the endpoint matches one of the configured endpoint patterns.
+        """
+        path = endpoint.split('?', 1)[0]
+        return any(fnmatch(path, pattern) if '*' in pattern else path.startswith(pattern)
+                   for pattern in self.config['endpoints'])
+
+
+    def get(self, key):
+        """
+        Returns the cached entry of a request, from memory or disk.
+
+        Parameters:
+            key (str): The full request URL including the query string.
+
+        Returns:
+            CacheEntry or None: The entry, or None if the request is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+
+    def put(self, key, content, headers):
+        """
+        Stores a response if it carries validators and is not too large.
+
+        Parameters:
+            key (str): The full request URL including the query string.
+            content (bytes): The decoded response body.
+            headers (Mapping): The response headers.
+
+        Returns:
+            bool: True if the response was stored.
+        """
+        kept = {name: headers[name] for name in CACHED_HEADERS if headers.get(name)}
+        if not ('ETag' in kept or 'Last-Modified' in kept) or len(content) > self.config['max_entry_bytes']:
+            return False
+
+        entry = CacheEntry(content, kept)
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        return True
+
+
+    def record(self, hit):
+        """
+        Counts a revalidation outcome.
+
+        Parameters:
+            hit (bool): True if the server answered 304 Not Modified.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+    def invalidate(self):
+        """
+        Drops all entries from memory and disk.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.cache'):
+                    os.remove(os.path.join(self.directory, name))
+
+
+    def _remember(self, key, entry):
+        # Inserts into the in-memory LRU and evicts the least recently used entries beyond the limits
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._entries and (len(self._entries) > self.config['max_entries']
+                                     or self._size > self.config['max_bytes']):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.cache")
+
+
+    def _read_disk(self, key):
+        # File layout: one line of JSON metadata, then the body
+        if not self.directory:
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as file:
+                meta = json.loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('key') != key:
+            return None
+        return CacheEntry(content, meta['headers'])
+
+
+    def _write_disk(self, key, entry):
+        if not self.directory:
+            return
+        path = self._disk_path(key)
+        try:
+            # Written to a temporary file and renamed, so readers never see a partial entry
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as file:
+                file.write(json.dumps({'key': key, 'headers': entry.headers}).encode('utf-8') + b'\n')
+                file.write(entry.content)
+            os.replace(temp_path, path)
+            self._prune_disk()
+        except OSError:
+            pass
+
+
+    def _prune_disk(self):
+        # Removes the least recently written entries once the directory exceeds max_disk_bytes
+        files = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if name.endswith('.cache'):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, path, stat.st_size))
+                total += stat.st_size
+        for _, path, size in sorted(files):
+            if total <= self.config['max_disk_bytes']:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,140 @@
+import codecs
+import json
+
+
+# Whitespace allowed between JSON tokens
+JSON_WHITESPACE = ' \t\n\r'
+
+
+class _JsonStreamReader:
+
+    def __init__(self, chunks):
+        """
+        Initializes a reader that decodes JSON values from an iterable of byte chunks,
+        keeping only the undecoded part of the stream in memory.
+
+        Parameters:
+            chunks (iterable): Byte chunks of a UTF-8 encoded JSON document, e.g. response.iter_content().
+        """
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+
+    def _fill(self, min_length=0):
+        """
+        Appends chunks to the buffer until it holds at least min_length unread characters.
+
+        Returns:
+            bool: False if the stream ended before anything could be added.
+        """
+        added = False
+        while not self._eof and (not added or len(self._buffer) - self._pos < min_length):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                text = self._text_decoder.decode(b'', final=True)
+                self._eof = True
+            else:
+                text = self._text_decoder.decode(chunk)
+            if text:
+                # Drop the consumed part so the buffer never holds more than the current value
+                self._buffer = self._buffer[self._pos:] + text
+                self._pos = 0
+                added = True
+        return added
+
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        Returns:
+            str: The next character, or an empty string at the end of the stream.
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+
+    def expect(self, char):
+        """
+        Consumes the next non-whitespace character, which must be char.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found {found or 'end of stream'!r}")
+        self._pos += 1
+
+
+    def value(self):
+        """
+        Decodes and consumes the next complete JSON value.
+
+        Returns:
+            The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Incomplete value: at least double the unread text before retrying, so large values
+            # are decoded a logarithmic number of times rather than once per chunk
+            self._fill(2 * (len(self._buffer) - self._pos))
+
+
+def iter_json_items(chunks, item_path=None):
+    """
+    Incrementally parses a JSON document and yields the items of one of its arrays.
+
+    Only the item being decoded is held in memory, so arbitrarily large list responses can be
+    processed in bounded memory.
+
+    Parameters:
+        chunks (iterable): Byte chunks of a UTF-8 encoded JSON document, e.g. response.iter_content().
+        item_path (str, optional): Dot-separated keys leading to the array inside nested objects,
+            e.g. 'items' for {"items": [...]}. Default: the document itself is the array.
+
+    Yields:
+        The decoded array items, one at a time.
+
+    Raises:
+        ValueError: If the document is malformed or the array is not found.
+    """
+    reader = _JsonStreamReader(chunks)
+
+    for key in (item_path.split('.') if item_path else []):
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                raise ValueError(f"Key '{key}' not found in JSON stream")
+            name = reader.value()
+            reader.expect(':')
+            if name == key:
+                break
+            # Skip the value of any other key
+            reader.value()
+            if reader.peek() == ',':
+                reader.expect(',')
+
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ']':
+            return
+        reader.expect(',')
@@ -0,0 +1,115 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Defaults of the 'logging' section of the YAML config
+DEFAULT_LOGGING_CONFIG = {
+    'log_dir': "logs",                  # Directory of the log file, created if missing
+    'file_name': "pysisense.log",       # Name of the log file
+    'max_bytes': 10 * 1024 * 1024,      # Size at which the log file is rotated (0 disables rotation)
+    'backup_count': 5,                  # Number of rotated files kept (pysisense.log.1 ... .5)
+    'format': "text",                   # "text" or "json" (one JSON object per line)
+    'max_payload_chars': 2000           # Longest rendering of a payload in a log message, see utils.LogPayload
+}
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Background listeners writing the queued records, keyed by logger name
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+
+    def format(self, record):
+        """
+        Formats a log record as a single-line JSON object.
+
+        Parameters:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: JSON with the keys time, level, logger, thread and message (and exception, if any).
+        """
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_queued_logging(logger, logging_config=None):
+    """
+    Attaches a non-blocking file handler to a logger, unless it already has one.
+
+    Records are put on an in-memory queue by the logging thread and written to a size-rotated
+    file by a background QueueListener thread, so request threads never wait on disk I/O.
+    The listener is flushed and stopped at interpreter exit.
+
+    Parameters:
+        logger (logging.Logger): The logger to configure.
+        logging_config (dict, optional): The 'logging' section of the YAML config, see DEFAULT_LOGGING_CONFIG.
+
+    Returns:
+        str or None: Path of the log file, or None if the logger was already configured.
+    """
+    config = {**DEFAULT_LOGGING_CONFIG, **(logging_config or {})}
+
+    with _listeners_lock:
+        # Check if the logger already has handlers to avoid duplicates
+        if logger.handlers:
+            return None
+
+        log_dir = config['log_dir']
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, config['file_name'])
+
+        file_handler = RotatingFileHandler(log_path, mode='a', maxBytes=int(config['max_bytes']),
+                                           backupCount=int(config['backup_count']), encoding='utf-8', delay=True)
+        if str(config['format']).lower() == 'json':
+            file_handler.setFormatter(JsonLinesFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+        # Unbounded queue: putting a record never blocks the caller
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _listeners[logger.name] = listener
+
+        logger.addHandler(QueueHandler(log_queue))
+        return log_path
+
+
+def flush_logs():
+    """
+    Blocks until every log record queued so far has been written to disk.
+    """
+    with _listeners_lock:
+        for listener in _listeners.values():
+            # Stopping drains the queue; the listener then resumes with a new thread
+            listener.stop()
+            listener.start()
+
+
+def _stop_listeners():
+    # Drain the queues and close the log files at interpreter exit
+    with _listeners_lock:
+        for listener in _listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+
+atexit.register(_stop_listeners)
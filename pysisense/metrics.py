@@ -0,0 +1,246 @@
+import math
+import os
+import random
+import re
+import threading
+from collections import defaultdict
+
+
+# Path segments replaced by a placeholder so requests to the same endpoint share one metrics series
+ENDPOINT_TEMPLATE_PATTERNS = [
+    (re.compile(r'^(/api/datasources)/[^/]+'), r'\1/{datasource}'),
+    (re.compile(r'^(/api/elasticubes/localhost)/[^/]+'), r'\1/{datamodel}'),
+    (re.compile(r'^(/api/v1/elasticubes/live)/[^/]+'), r'\1/{datamodel}'),
+    (re.compile(r'/[0-9a-fA-F]{24}(?=/|$)'), '/{id}'),
+    (re.compile(r'/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)'), '/{id}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{id}')
+]
+
+# Latency samples kept per endpoint for the percentiles; older samples are replaced at random beyond this
+MAX_LATENCY_SAMPLES = 10000
+
+# Quantiles reported by summary() and the Prometheus exporter
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def endpoint_template(endpoint):
+    """
+    Reduces an endpoint to its template by dropping the query string and replacing IDs and names with placeholders.
+
+    Parameters:
+        endpoint (str): The API endpoint, e.g. '/api/dashboards/5f1b.../export?adminAccess=true'.
+
+    Returns:
+        str: The endpoint template, e.g. '/api/dashboards/{id}/export'.
+    """
+    template = endpoint.split('?', 1)[0]
+    for pattern, replacement in ENDPOINT_TEMPLATE_PATTERNS:
+        template = pattern.sub(replacement, template)
+    return template
+
+
+class RequestInfo:
+
+    def __init__(self, method, endpoint):
+        """
+        Initializes the record of one API request, as passed to the instrumentation hooks of an APIClient.
+
+        Pre-request hooks see the request fields only; post-request hooks also see the outcome.
+        Retries of the same request are part of one record.
+
+        Parameters:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint (relative to the base URL).
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.template = endpoint_template(endpoint)
+        self.status = None              # Final status code, or None if no response was received
+        self.latency = None             # Seconds from the first attempt to the final outcome, including retries
+        self.request_bytes = 0          # Size of the request body, before compression
+        self.response_bytes = 0         # Size of the final response body, after decompression (0 if unknown)
+        self.request_wire_bytes = 0     # Size of the request body as sent, after compression
+        self.response_wire_bytes = 0    # Size of the final response body as received, before decompression
+        self.request_encoding = None    # Content-Encoding of the request body, e.g. 'gzip'
+        self.response_encoding = None   # Content-Encoding of the final response, e.g. 'gzip'
+        self.retries = 0                # Number of retries before the final outcome
+        self.error = None               # Exception of the final attempt, if it failed without a response
+        self.cached = False             # True if the server answered 304 and the body was served from the HTTP cache
+
+
+    def __repr__(self):
+        return (f"RequestInfo({self.method} {self.template} status={self.status} latency={self.latency} "
+                f"retries={self.retries})")
+
+
+class RequestMetrics:
+
+    def __init__(self):
+        """
+        Initializes an in-memory aggregator of request metrics per method and endpoint template.
+
+        Register it as a post-request hook of an APIClient (the 'metrics' config section does this
+        automatically), then read summary() or export it with to_prometheus().
+        """
+        self._lock = threading.Lock()
+        self._series = {}
+        self._rng = random.Random()
+
+
+    def __call__(self, info):
+        """
+        Records a finished request. This is the post-request hook signature.
+
+        Parameters:
+            info (RequestInfo): The finished request.
+        """
+        key = (info.method, info.template)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    'count': 0, 'errors': 0, 'retries': 0, 'latency_sum': 0.0,
+                    'request_bytes': 0, 'response_bytes': 0, 'request_wire_bytes': 0, 'response_wire_bytes': 0,
+                    'statuses': defaultdict(int), 'samples': []
+                }
+
+            series['count'] += 1
+            series['statuses'][info.status or 'error'] += 1
+            if info.status is None or info.status >= 400:
+                series['errors'] += 1
+            series['retries'] += info.retries
+            series['request_bytes'] += info.request_bytes
+            series['response_bytes'] += info.response_bytes
+            series['request_wire_bytes'] += info.request_wire_bytes
+            series['response_wire_bytes'] += info.response_wire_bytes
+
+            latency = info.latency or 0.0
+            series['latency_sum'] += latency
+            samples = series['samples']
+            if len(samples) < MAX_LATENCY_SAMPLES:
+                samples.append(latency)
+            else:
+                # Reservoir sampling keeps the percentiles representative of the whole run
+                index = self._rng.randrange(series['count'])
+                if index < MAX_LATENCY_SAMPLES:
+                    samples[index] = latency
+
+
+    def reset(self):
+        """
+        Drops all recorded metrics.
+        """
+        with self._lock:
+            self._series.clear()
+
+
+    def summary(self):
+        """
+        Returns the aggregated metrics of every endpoint, slowest total time first.
+
+        Returns:
+            list: A list of dictionaries with method, endpoint, count, errors, retries, total/p50/p95/p99
+                  latency in seconds, request/response bytes (uncompressed) and request/response wire bytes
+                  (as transferred, after compression).
+        """
+        with self._lock:
+            snapshot = [(key, dict(series, samples=sorted(series['samples']))) for key, series in self._series.items()]
+
+        rows = []
+        for (method, template), series in snapshot:
+            row = {
+                'method': method,
+                'endpoint': template,
+                'count': series['count'],
+                'errors': series['errors'],
+                'retries': series['retries'],
+                'total_s': round(series['latency_sum'], 6)
+            }
+            for quantile in QUANTILES:
+                row[f"p{int(quantile * 100)}_s"] = round(_percentile(series['samples'], quantile), 6)
+            row['request_bytes'] = series['request_bytes']
+            row['response_bytes'] = series['response_bytes']
+            row['request_wire_bytes'] = series['request_wire_bytes']
+            row['response_wire_bytes'] = series['response_wire_bytes']
+            rows.append(row)
+
+        rows.sort(key=lambda row: row['total_s'], reverse=True)
+        return rows
+
+
+    def to_prometheus(self, prefix="pysisense"):
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        The output can be served by any HTTP endpoint or written to a file for the
+        node_exporter textfile collector, see write_prometheus().
+
+        Parameters:
+            prefix (str, optional): Prefix of the metric names. Default: "pysisense".
+
+        Returns:
+            str: The metrics in Prometheus text format.
+        """
+        with self._lock:
+            snapshot = [(key, dict(series, statuses=dict(series['statuses']), samples=sorted(series['samples'])))
+                        for key, series in sorted(self._series.items(), key=lambda item: item[0])]
+
+        lines = [
+            f"# HELP {prefix}_requests_total API requests by final status.",
+            f"# TYPE {prefix}_requests_total counter"
+        ]
+        for (method, template), series in snapshot:
+            for status, count in sorted(series['statuses'].items(), key=lambda item: str(item[0])):
+                lines.append(f'{prefix}_requests_total{{{_labels(method, template)},status="{status}"}} {count}')
+
+        counters = [
+            ('retries', "Retries of API requests."),
+            ('request_bytes', "Bytes of API request bodies, before compression."),
+            ('response_bytes', "Bytes of API response bodies, after decompression."),
+            ('request_wire_bytes', "Bytes of API request bodies as sent, after compression."),
+            ('response_wire_bytes', "Bytes of API response bodies as received, before decompression.")
+        ]
+        for name, help_text in counters:
+            lines.append(f"# HELP {prefix}_{name}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for (method, template), series in snapshot:
+                lines.append(f"{prefix}_{name}_total{{{_labels(method, template)}}} {series[name]}")
+
+        lines.append(f"# HELP {prefix}_request_duration_seconds Duration of API requests, including retries.")
+        lines.append(f"# TYPE {prefix}_request_duration_seconds summary")
+        for (method, template), series in snapshot:
+            labels = _labels(method, template)
+            for quantile in QUANTILES:
+                value = _percentile(series['samples'], quantile)
+                lines.append(f'{prefix}_request_duration_seconds{{{labels},quantile="{quantile}"}} {value:.6f}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {series['latency_sum']:.6f}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {series['count']}")
+
+        return "\n".join(lines) + "\n"
+
+
+    def write_prometheus(self, path, prefix="pysisense"):
+        """
+        Writes the metrics in Prometheus text format to a file, replacing it atomically.
+
+        Parameters:
+            path (str): Output path, e.g. a *.prom file in the node_exporter textfile directory.
+            prefix (str, optional): Prefix of the metric names. Default: "pysisense".
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temp_path, path)
+
+
+def _percentile(sorted_samples, quantile):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(quantile * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def _labels(method, template):
+    escaped = template.replace('\\', '\\\\').replace('"', '\\"')
+    return f'method="{method}",endpoint="{escaped}"'
@@ -1,8 +1,15 @@
 from .api_client import APIClient
+from .directory import PrincipalIndex
 from .access_management import AccessManagement
+from .checkpoint import CheckpointJournal, dashboard_content_hash
+from .batching import AdaptiveBatcher
+from .profiling import profile_public_methods, run_in_context
+from .utils import LogPayload
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
 
+@profile_public_methods
 class Migration:
 
     def __init__(self, source_yaml, target_yaml, debug=False):
@@ -25,6 +32,23 @@ class Migration:
         self.logger = self.source_client.logger
 
 
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def close(self):
+        """
+        Closes the HTTP sessions of both the source and target API clients.
+        """
+        self.source_client.close()
+        self.target_client.close()
+
+
     def migrate_groups(self, group_name_list):
         """
         Migrates specific groups from the source environment to the target environment using the bulk endpoint.
@@ -39,14 +63,12 @@ class Migration:
 
         # Step 1: Get all groups from the source environment
         self.logger.debug("Fetching groups from the source environment.")
-        source_response = self.source_client.get("/api/v1/groups")
-        if not source_response or source_response.status_code != 200:
+        source_groups = self.source_client.directory.get_groups()
+        if source_groups is None:
             self.logger.error("Failed to retrieve groups from the source environment.")
             return []
-        self.logger.debug(f"Source environment response status code: {source_response.status_code}")
-        self.logger.debug(f"Source environment response body: {source_response.text}")
+        self.logger.debug("Source environment groups: %s", LogPayload(source_groups))
 
-        source_groups = source_response.json()
         self.logger.info(f"Retrieved {len(source_groups)} groups from the source environment.")
 
         # Step 2: Filter the groups to migrate
@@ -59,7 +81,7 @@ class Migration:
                     if key not in ["created", "lastUpdated", "tenantId", "_id"]
                 }
                 bulk_group_data.append(group_data)
-                self.logger.debug(f"Prepared data for group: {group['name']}")
+                self.logger.debug("Prepared data for group: %s", group['name'])
 
         # If no groups match, log an info message and exit early
         if not bulk_group_data:
@@ -69,12 +91,13 @@ class Migration:
 
         # Step 3: Make the bulk POST request with the group data
         self.logger.info(f"Sending bulk migration request for {len(bulk_group_data)} groups")
-        self.logger.debug(f"Payload for bulk migration: {bulk_group_data}")
+        self.logger.debug("Payload for bulk migration: %s", LogPayload(bulk_group_data))
         response = self.target_client.post("/api/v1/groups/bulk", data=bulk_group_data)
+        self.target_client.directory.invalidate('groups')
 
         # Log the full response at debug level
-        self.logger.debug(f"Target environment response status code: {response.status_code if response else 'No response'}")
-        self.logger.debug(f"Target environment response body: {response.text if response else 'No response body'}")
+        self.logger.debug("Target environment response status code: %s", response.status_code if response else 'No response')
+        self.logger.debug("Target environment response body: %s", LogPayload(response))
 
         # If response is missing or empty
         if response is None:
@@ -97,7 +120,7 @@ class Migration:
         if response and response.status_code == 201:
             try:
                 response_data = response.json()
-                self.logger.info(f"Bulk migration succeeded. Response: {response_data}")
+                self.logger.info(f"Bulk migration succeeded. Response: {LogPayload(response_data)}")
 
                 # Process the response (list of migrated groups)
                 for group in response_data:
@@ -142,16 +165,14 @@ class Migration:
 
         # Step 1: Get all groups from the source environment
         self.logger.debug("Fetching groups from the source environment.")
-        source_response = self.source_client.get("/api/v1/groups")
-        if not source_response or source_response.status_code != 200:
+        source_groups = self.source_client.directory.get_groups()
+        if source_groups is None:
             self.logger.error("Failed to retrieve groups from the source environment.")
             return [{"message": "Failed to retrieve groups from the source environment. Please check the logs for more details."}]
 
-        # Log the full response at debug level
-        self.logger.debug(f"Source environment response status code: {source_response.status_code}")
-        self.logger.debug(f"Source environment response body: {source_response.text}")
+        # Log the full list at debug level
+        self.logger.debug("Source environment groups: %s", LogPayload(source_groups))
 
-        source_groups = source_response.json()
         if not source_groups:
             self.logger.info("No groups found in the source environment. Ending process.")
             return [{"message": "No groups found in the source environment. Nothing to migrate."}]
@@ -168,7 +189,7 @@ class Migration:
                     if key not in ["created", "lastUpdated", "tenantId", "_id"]
                 }
                 bulk_group_data.append(group_data)
-                self.logger.debug(f"Prepared data for group: {group['name']}")
+                self.logger.debug("Prepared data for group: %s", group['name'])
 
         # If no groups to migrate, log and exit early
         if not bulk_group_data:
@@ -177,12 +198,13 @@ class Migration:
 
         # Step 3: Make the bulk POST request with the group data
         self.logger.info(f"Sending bulk migration request for {len(bulk_group_data)} groups")
-        self.logger.debug(f"Payload for bulk migration: {bulk_group_data}")
+        self.logger.debug("Payload for bulk migration: %s", LogPayload(bulk_group_data))
         response = self.target_client.post("/api/v1/groups/bulk", data=bulk_group_data)
+        self.target_client.directory.invalidate('groups')
 
         # Log the full response at debug level
-        self.logger.debug(f"Target environment response status code: {response.status_code if response else 'No response'}")
-        self.logger.debug(f"Target environment response body: {response.text if response else 'No response body'}")
+        self.logger.debug("Target environment response status code: %s", response.status_code if response else 'No response')
+        self.logger.debug("Target environment response body: %s", LogPayload(response))
 
         # Step 4: Handle the response from the bulk API call
         migration_results = []
@@ -191,7 +213,7 @@ class Migration:
         if response and response.status_code == 201:
             try:
                 response_data = response.json()
-                self.logger.info(f"Bulk migration succeeded. Response: {response_data}")
+                self.logger.info(f"Bulk migration succeeded. Response: {LogPayload(response_data)}")
 
                 # Process the response (list of migrated groups)
                 for group in response_data:
@@ -237,19 +259,13 @@ class Migration:
         """
         self.logger.info("Starting user migration from source to target.")
 
-        # Query parameters to expand the response with group and role information
-        params = {'expand': 'groups,role'}
-
-        # Step 1: Get all users from the source environment
+        # Step 1: Get all users from the source environment, expanded with group and role information
         self.logger.debug("Fetching users from the source environment.")
-        source_response = self.source_client.get("/api/v1/users", params=params)
-        if not source_response or source_response.status_code != 200:
+        source_users = self.source_client.directory.get_users(expand='groups,role')
+        if source_users is None:
             self.logger.error("Failed to retrieve users from the source environment.")
             return [{"message": "Failed to retrieve users from the source environment. Please check the logs for more details."}]
-        self.logger.debug(f"Source environment response status code: {source_response.status_code}")
-        self.logger.debug(f"Source environment response body: {source_response.text}")
-
-        source_users = source_response.json()
+        self.logger.debug("Source environment users: %s", LogPayload(source_users))
         if not source_users:
             self.logger.info("No users found in the source environment. Ending process.")
             return [{"message": "No users found in the source environment. Nothing to migrate."}]
@@ -258,20 +274,19 @@ class Migration:
 
         # Step 2: Get roles and groups information from the target environment to match and get IDs
         self.logger.debug("Fetching roles and groups from the target environment.")
-        target_roles_response = self.target_client.get("/api/roles")
-        target_groups_response = self.target_client.get("/api/v1/groups")
+        target_roles = self.target_client.directory.get_roles()
+        target_groups = self.target_client.directory.get_groups()
 
-        if not target_roles_response or target_roles_response.status_code != 200:
+        if target_roles is None:
             self.logger.error("Failed to retrieve roles from the target environment.")
             return [{"message": "Failed to retrieve roles from the target environment. Please check the logs for details."}]
 
-        if not target_groups_response or target_groups_response.status_code != 200:
+        if target_groups is None:
             self.logger.error("Failed to retrieve groups from the target environment.")
             return [{"message": "Failed to retrieve groups from the target environment. Please check the logs for details."}]
 
-        target_roles = target_roles_response.json()
-        target_groups = target_groups_response.json()
-        self.logger.debug(f"Retrieved {len(target_roles)} roles and {len(target_groups)} groups from the target environment.")
+        self.logger.debug("Retrieved %s roles and %s groups from the target environment.", len(target_roles), len(target_groups))
+        target_index = self.target_client.directory.get_index(users=False, roles=True)
 
         EXCLUDED_GROUPS = {"Everyone", "All users in system"}
         single_user_data = []  # List to hold a single user data for migration
@@ -285,17 +300,17 @@ class Migration:
                     "email": user["email"],
                     "firstName": user["firstName"],
                     "lastName": user.get("lastName", ""),  # Optional field
-                    "roleId": next((role["_id"] for role in target_roles if role["name"] == user["role"]["name"]), None),
+                    "roleId": target_index.role_id(user["role"]["name"]),
                     "groups": [
-                        group["_id"] for group in target_groups
-                        if group["name"] in [g["name"] for g in user["groups"]] and group["name"] not in EXCLUDED_GROUPS
+                        target_index.group_id_by_name[g["name"]] for g in user["groups"]
+                        if g["name"] in target_index.group_id_by_name and g["name"] not in EXCLUDED_GROUPS
                     ],
                     "preferences": user.get("preferences", {"localeId": "en-US"})  # Default to English language preference
                 }
 
                 # Append user data to the bulk list
                 bulk_user_data.append(user_data)
-                self.logger.debug(f"Prepared data for user: {user['email']}")
+                self.logger.debug("Prepared data for user: %s", user['email'])
 
         # If no matching users, log and exit
         if not bulk_user_data:
@@ -304,12 +319,13 @@ class Migration:
 
         # Step 4: Make the POST request with the bulk user data
         self.logger.info(f"Sending bulk migration request for {len(bulk_user_data)} users")
-        self.logger.debug(f"Payload for bulk user migration: {bulk_user_data}")
+        self.logger.debug("Payload for bulk user migration: %s", LogPayload(bulk_user_data))
         response = self.target_client.post("/api/v1/users/bulk", data=bulk_user_data)
+        self.target_client.directory.invalidate('users')
 
         # Log the full response for debugging
-        self.logger.debug(f"Target environment response status code: {response.status_code if response else 'No response'}")
-        self.logger.debug(f"Target environment response body: {response.text if response else 'No response body'}")
+        self.logger.debug("Target environment response status code: %s", response.status_code if response else 'No response')
+        self.logger.debug("Target environment response body: %s", LogPayload(response))
 
         # Step 5: Early exit if response is missing or empty
         if response is None:
@@ -332,7 +348,7 @@ class Migration:
         if response.status_code == 201:
             try:
                 response_data = response.json()
-                self.logger.info(f"Bulk user migration succeeded. Response: {response_data}")
+                self.logger.info(f"Bulk user migration succeeded. Response: {LogPayload(response_data)}")
                 for user in response_data:
                     user_name = user.get("email", "Unknown User")
                     self.logger.info(f"Successfully migrated user: {user_name}")
@@ -371,21 +387,13 @@ class Migration:
         """
         self.logger.info("Starting full user migration from source to target.")
 
-        # Query parameters to expand the response with group and role information
-        params = {'expand': 'groups,role'}
-
-        # Step 1: Get all users from the source environment
+        # Step 1: Get all users from the source environment, expanded with group and role information
         self.logger.debug("Fetching users from the source environment.")
-        source_response = self.source_client.get("/api/v1/users", params=params)
-        if not source_response or source_response.status_code != 200:
+        source_users = self.source_client.directory.get_users(expand='groups,role')
+        if source_users is None:
             self.logger.error("Failed to retrieve users from the source environment.")
             return [{"message": "Failed to retrieve users from the source environment. Please check the logs for details."}]
-
-        # Log the full response at debug level
-        self.logger.debug(f"Source environment response status code: {source_response.status_code}")
-        self.logger.debug(f"Source environment response body: {source_response.text}")
-
-        source_users = source_response.json()
+        self.logger.debug("Source environment users: %s", LogPayload(source_users))
         if not source_users:
             self.logger.info("No users found in the source environment. Ending process.")
             return [{"message": "No users found in the source environment. Nothing to migrate."}]
@@ -394,20 +402,19 @@ class Migration:
 
         # Step 2: Get roles and groups information from the target environment to match and get IDs
         self.logger.debug("Fetching roles and groups from the target environment.")
-        target_roles_response = self.target_client.get("/api/roles")
-        target_groups_response = self.target_client.get("/api/v1/groups")
+        target_roles = self.target_client.directory.get_roles()
+        target_groups = self.target_client.directory.get_groups()
 
-        if not target_roles_response or target_roles_response.status_code != 200:
+        if target_roles is None:
             self.logger.error("Failed to retrieve roles from the target environment.")
             return [{"message": "Failed to retrieve roles from the target environment. Please check the logs for details."}]
 
-        if not target_groups_response or target_groups_response.status_code != 200:
+        if target_groups is None:
             self.logger.error("Failed to retrieve groups from the target environment.")
             return [{"message": "Failed to retrieve groups from the target environment. Please check the logs for details."}]
 
-        target_roles = target_roles_response.json()
-        target_groups = target_groups_response.json()
-        self.logger.debug(f"Retrieved {len(target_roles)} roles and {len(target_groups)} groups from the target environment.")
+        self.logger.debug("Retrieved %s roles and %s groups from the target environment.", len(target_roles), len(target_groups))
+        target_index = self.target_client.directory.get_index(users=False, roles=True)
 
         EXCLUDED_GROUPS = {"Everyone", "All users in system"}
         bulk_user_data = []  # List to hold the user data for bulk upload
@@ -420,16 +427,16 @@ class Migration:
                 "email": user["email"],
                 "firstName": user["firstName"],
                 "lastName": user.get("lastName", ""),  # Optional field
-                "roleId": next((role["_id"] for role in target_roles if role["name"] == user["role"]["name"]), None),
+                "roleId": target_index.role_id(user["role"]["name"]),
                 "groups": [
-                    group["_id"] for group in target_groups
-                    if group["name"] in [g["name"] for g in user["groups"]] and group["name"] not in EXCLUDED_GROUPS
+                    target_index.group_id_by_name[g["name"]] for g in user["groups"]
+                    if g["name"] in target_index.group_id_by_name and g["name"] not in EXCLUDED_GROUPS
                 ],
                 "preferences": user.get("preferences", {"localeId": "en-US"})  # Default to English language preference
             }
 
             bulk_user_data.append(user_data)
-            self.logger.debug(f"Prepared data for user: {user['email']}")
+            self.logger.debug("Prepared data for user: %s", user['email'])
 
         # Step 4: Make the bulk POST request with the user data
         if not bulk_user_data:
@@ -440,12 +447,13 @@ class Migration:
             }
 
         self.logger.info(f"Sending bulk migration request for {len(bulk_user_data)} users")
-        self.logger.debug(f"Payload for bulk user migration: {bulk_user_data}")
+        self.logger.debug("Payload for bulk user migration: %s", LogPayload(bulk_user_data))
         response = self.target_client.post("/api/v1/users/bulk", data=bulk_user_data)
+        self.target_client.directory.invalidate('users')
 
         # Log the full response for debugging
-        self.logger.debug(f"Target environment response status code: {response.status_code if response else 'No response'}")
-        self.logger.debug(f"Target environment response body: {response.text if response else 'No response body'}")
+        self.logger.debug("Target environment response status code: %s", response.status_code if response else 'No response')
+        self.logger.debug("Target environment response body: %s", LogPayload(response))
 
         # Step 5: Handle missing or empty response
         if response is None:
@@ -468,7 +476,7 @@ class Migration:
         if response.status_code == 201:
             try:
                 response_data = response.json()
-                self.logger.info(f"Bulk migration succeeded. Response: {response_data}")
+                self.logger.info(f"Bulk migration succeeded. Response: {LogPayload(response_data)}")
 
                 for user in response_data:
                     user_email = user.get("email", "Unknown User")
@@ -499,7 +507,7 @@ class Migration:
         }
 
 
-    def migrate_dashboard_shares(self, source_dashboard_ids, target_dashboard_ids, change_ownership=False):
+    def migrate_dashboard_shares(self, source_dashboard_ids, target_dashboard_ids, change_ownership=False, checkpoint=None):
         """
         Migrates shares for specific dashboards from the source to the target environment.
 
@@ -507,6 +515,8 @@ class Migration:
             source_dashboard_ids (list): A list of dashboard IDs from the source environment to fetch shares from.
             target_dashboard_ids (list): A list of dashboard IDs from the target environment to apply shares to.
             change_ownership (bool, optional): Whether to change ownership of the target dashboard. Defaults to False.
+            checkpoint (CheckpointJournal, optional): Journal in which the share and ownership status of each
+                                                      source dashboard is recorded. Default: None.
 
         Returns:
             dict: A summary of the share migration process with counts of succeeded and failed shares,
@@ -524,31 +534,28 @@ class Migration:
             raise ValueError("The lengths of 'source_dashboard_ids' and 'target_dashboard_ids' must match.")
 
         self.logger.info("Starting share migration for specified dashboards.")
-        self.logger.debug(f"Source Dashboard IDs: {source_dashboard_ids}")
-        self.logger.debug(f"Target Dashboard IDs: {target_dashboard_ids}")
+        self.logger.debug("Source Dashboard IDs: %s", LogPayload(source_dashboard_ids))
+        self.logger.debug("Target Dashboard IDs: %s", LogPayload(target_dashboard_ids))
 
         share_migration_summary = {'new_share_success_count': 0, 'share_fail_count': 0, 'failed_dashboards': []}
+        # Ownership outcome per source dashboard, recorded in the checkpoint journal: (status, error)
+        ownership_results = {}
 
         # Step 1: Fetch users and groups once
         self.logger.info("Fetching users and groups from source and target environments.")
         try:
-            # Fetch source users and groups
-            source_users = self.source_client.get("/api/v1/users").json()
-            source_user_map = {user["_id"]: user["email"] for user in source_users}
-            source_groups = self.source_client.get("/api/v1/groups").json()
-            source_group_map = {group["_id"]: group["name"] for group in source_groups}
-
-            # Fetch target users and groups
-            target_users = self.target_client.get("/api/v1/users").json()
-            target_user_map = {user["email"]: user["_id"] for user in target_users}
-            target_groups = self.target_client.get("/api/v1/groups").json()
-            target_group_map = {group["name"]: group["_id"] for group in target_groups}
-
-            user_mapping = {source_id: target_user_map.get(email) for source_id, email in source_user_map.items()}
-            group_mapping = {source_id: target_group_map.get(name) for source_id, name in source_group_map.items()}
+            source_index = self.source_client.directory.get_index()
+            target_index = self.target_client.directory.get_index()
+            if source_index is None or target_index is None:
+                raise RuntimeError("users or groups could not be retrieved")
+
+            # Map source IDs to target IDs by email (users) and name (groups)
+            user_mapping, group_mapping = source_index.map_to(target_index)
             self.logger.info("User and group mapping created successfully.")
         except Exception as e:
             self.logger.error(f"Failed to fetch users or groups: {e}")
+            if checkpoint:
+                checkpoint.mark(source_dashboard_ids, 'shares', 'failed', error=f"Failed to fetch users or groups: {e}")
             return share_migration_summary
 
         # Step 2: Process each dashboard pair
@@ -557,7 +564,7 @@ class Migration:
 
             # Fetch shares from the source environment
             dashboard_shares_response = self.source_client.get(f"/api/shares/dashboard/{source_id}?adminAccess=true")
-            self.logger.debug(f"Response for shares of source dashboard ID {source_id}: {dashboard_shares_response.text if dashboard_shares_response else 'No response'}")
+            self.logger.debug("Response for shares of source dashboard ID %s: %s", source_id, LogPayload(dashboard_shares_response))
             if not dashboard_shares_response or dashboard_shares_response.status_code != 200:
                 self.logger.error(f"Failed to fetch shares for source dashboard ID: {source_id}.")
                 share_migration_summary['failed_dashboards'].append({"source_id": source_id, "target_id": target_id})
@@ -587,7 +594,7 @@ class Migration:
             for share in dashboard_shares:
                 if share["type"] == "user":
                     new_share_user_id = user_mapping.get(share["shareId"])
-                    user_email = source_user_map.get(share["shareId"], "Unknown User")
+                    user_email = source_index.email_by_user_id.get(share["shareId"], "Unknown User")
                     if new_share_user_id:
                         rule = share.get("rule", "edit")
                         new_shares.append({
@@ -597,10 +604,10 @@ class Migration:
                             "subscribe": share.get("subscribe", False),
                             "userName": user_email  # Add email for later duplicate check
                         })
-                        self.logger.debug(f"Prepared user share for migration: {user_email} (Rule: {rule})")
+                        self.logger.debug("Prepared user share for migration: %s (Rule: %s)", user_email, rule)
                 elif share["type"] == "group":
                     new_share_group_id = group_mapping.get(share["shareId"])
-                    group_name = source_group_map.get(share["shareId"], "Unknown Group")
+                    group_name = source_index.group_name_by_id.get(share["shareId"], "Unknown Group")
                     if new_share_group_id:
                         new_shares.append({
                             "shareId": new_share_group_id,
@@ -609,10 +616,10 @@ class Migration:
                             "subscribe": share.get("subscribe", False),
                             "name": group_name  # Add group name for later duplicate check
                         })
-                        self.logger.debug(f"Prepared group share for migration: {group_name} (Rule: {share.get('rule', 'viewer')})")
+                        self.logger.debug("Prepared group share for migration: %s (Rule: %s)", group_name, share.get('rule', 'viewer'))
 
             # Combine new shares with existing ones
-            self.logger.debug(f"Fetching shares for target dashboard ID {target_id} with adminAccess=true.")
+            self.logger.debug("Fetching shares for target dashboard ID %s with adminAccess=true.", target_id)
             target_dashboard_shares_response = self.target_client.get(f"/api/shares/dashboard/{target_id}?adminAccess=true")
 
             if target_dashboard_shares_response is not None:
@@ -620,7 +627,7 @@ class Migration:
                     self.logger.warning(f"Access denied for target dashboard ID {target_id} with adminAccess. Retrying without adminAccess.")
                     target_dashboard_shares_response = self.target_client.get(f"/api/shares/dashboard/{target_id}")
                     if target_dashboard_shares_response and target_dashboard_shares_response.status_code == 200:
-                        self.logger.debug(f"Successfully fetched shares for target dashboard ID {target_id} without adminAccess.")
+                        self.logger.debug("Successfully fetched shares for target dashboard ID %s without adminAccess.", target_id)
                     else:
                         self.logger.error(f"Retry without adminAccess also failed for target dashboard ID {target_id}. Ending processing for this dashboard.")
                         share_migration_summary['failed_dashboards'].append({"source_id": source_id, "target_id": target_id})
@@ -634,7 +641,7 @@ class Migration:
                         })
                         continue
                 elif target_dashboard_shares_response.status_code == 200:
-                    self.logger.debug(f"Shares fetched with adminAccess for target dashboard ID {target_id}.")
+                    self.logger.debug("Shares fetched with adminAccess for target dashboard ID %s.", target_id)
                 else:
                     self.logger.error(f"Unexpected status code when accessing target dashboard ID {target_id}: {target_dashboard_shares_response.status_code}")
                     share_migration_summary['failed_dashboards'].append({"source_id": source_id, "target_id": target_id})
@@ -661,7 +668,7 @@ class Migration:
                         "name": share.get("name", "Unknown Group")
                     })
 
-            self.logger.debug(f"Existing shares for target dashboard ID {target_id}: {simplified_existing}")
+            self.logger.debug("Existing shares for target dashboard ID %s: %s", target_id, simplified_existing)
 
             # Build a set of existing share identifiers
             existing_share_keys = set()
@@ -696,7 +703,7 @@ class Migration:
                 }
                 for share in filtered_new_shares
             ]
-            self.logger.debug(f"Filtered new shares to be added: {simplified_filtered}")
+            self.logger.debug("Filtered new shares to be added: %s", simplified_filtered)
 
             # Prepare filtered_new_shares for API by removing comparison-only keys
             final_new_shares = []
@@ -710,8 +717,8 @@ class Migration:
 
             # Combine with existing shares
             all_shares = existing_shares + final_new_shares
-            self.logger.debug(f"Total shares to be posted: {len(all_shares)}")
-            self.logger.debug(f"Final shares payload: {all_shares}") 
+            self.logger.debug("Total shares to be posted: %s", len(all_shares))
+            self.logger.debug("Final shares payload: %s", LogPayload(all_shares)) 
 
             if not all_shares:
                 self.logger.warning(f"No valid shares found for source dashboard ID {source_id}. Ensure users and groups exist in the target environment.")
@@ -720,7 +727,7 @@ class Migration:
             # Post the shares to the target environment
             self.logger.info(f"Migrating shares to target dashboard ID {target_id}.")
             post_url = f"/api/shares/dashboard/{target_id}?adminAccess=true"
-            self.logger.debug(f"Making POST request to {post_url}.")
+            self.logger.debug("Making POST request to %s.", post_url)
 
             response = self.target_client.post(post_url, data={"sharesTo": all_shares})
 
@@ -729,10 +736,10 @@ class Migration:
                 if response.status_code == 403:
                     self.logger.warning(f"Access denied for POST request to {post_url}. Retrying without adminAccess.")
                     post_url_without_admin = f"/api/shares/dashboard/{target_id}"
-                    self.logger.debug(f"Retrying POST request to {post_url_without_admin}.")
+                    self.logger.debug("Retrying POST request to %s.", post_url_without_admin)
                     response = self.target_client.post(post_url_without_admin, data={"sharesTo": all_shares})
                     if response and response.status_code in [200, 201]:
-                        self.logger.debug(f"POST request successful without adminAccess for dashboard ID {target_id}.")
+                        self.logger.debug("POST request successful without adminAccess for dashboard ID %s.", target_id)
                     else:
                         self.logger.error(f"Retry without adminAccess also failed for POST request to dashboard ID {target_id}. "
                                         f"Status Code: {response.status_code if response else 'No response'}")
@@ -775,11 +782,12 @@ class Migration:
                 # Proceed only if the owner is different
                 if current_target_owner_id and current_target_owner_id == potential_owner_id:
                     self.logger.info(f"Target dashboard ID {target_id} already owned by user ID {potential_owner_id}. Skipping ownership change.")
+                    ownership_results[source_id] = ('done', None)
                 else:
                     self.logger.info(f"Changing ownership of target dashboard ID {target_id} to user: {potential_owner_name} (ID: {potential_owner_id}).")
 
                     ownership_url = f"/api/v1/dashboards/{target_id}/change_owner?adminAccess=true"
-                    self.logger.debug(f"Making POST request to {ownership_url} for ownership change.")
+                    self.logger.debug("Making POST request to %s for ownership change.", ownership_url)
 
                     owner_change_response = self.target_client.post(
                         ownership_url,
@@ -790,7 +798,7 @@ class Migration:
                     if owner_change_response is None or owner_change_response.status_code == 403:
                         self.logger.warning(f"Access denied for ownership change at {ownership_url}. Retrying without adminAccess.")
                         ownership_url_without_admin = f"/api/v1/dashboards/{target_id}/change_owner"
-                        self.logger.debug(f"Retrying ownership change POST request to {ownership_url_without_admin}.")
+                        self.logger.debug("Retrying ownership change POST request to %s.", ownership_url_without_admin)
                         owner_change_response = self.target_client.post(
                             ownership_url_without_admin,
                             data={"ownerId": potential_owner_id, "originalOwnerRule": "edit"}
@@ -799,11 +807,27 @@ class Migration:
                     # Handle the response after retry logic
                     if owner_change_response and owner_change_response.status_code in [200, 201]:
                         self.logger.info(f"Ownership changed successfully for dashboard ID {target_id}.")
+                        ownership_results[source_id] = ('done', None)
                     else:
                         self.logger.error(f"Failed to change ownership for dashboard ID {target_id}. "
                                         f"Status Code: {owner_change_response.status_code if owner_change_response else 'No response'}.")
+                        ownership_results[source_id] = (
+                            'failed',
+                            f"Ownership change failed with status code {owner_change_response.status_code if owner_change_response else 'No response'}"
+                        )
                     
 
+        if checkpoint:
+            failed_source_ids = {dashboard['source_id'] for dashboard in share_migration_summary['failed_dashboards']}
+            for source_id, target_id in zip(source_dashboard_ids, target_dashboard_ids):
+                if source_id in failed_source_ids:
+                    # Ownership is changed after the shares, so it stays pending until the shares succeed
+                    checkpoint.mark(source_id, 'shares', 'failed', error="Share migration failed", target_oid=target_id)
+                    continue
+                checkpoint.mark(source_id, 'shares', 'done', target_oid=target_id)
+                status, error = ownership_results.get(source_id, ('skipped', None))
+                checkpoint.mark(source_id, 'ownership', status, error=error)
+
         self.logger.info("Finished share migration.")
         self.logger.info(share_migration_summary)
         return {
@@ -816,7 +840,7 @@ class Migration:
         }
 
 
-    def migrate_dashboards(self, dashboard_ids=None, dashboard_names=None, action=None, republish=False, migrate_share=False, change_ownership=False):
+    def migrate_dashboards(self, dashboard_ids=None, dashboard_names=None, action=None, republish=False, migrate_share=False, change_ownership=False, checkpoint=None):
         """
         Migrates specific dashboards from the source to the target environment using the bulk endpoint.
 
@@ -834,6 +858,8 @@ class Migration:
             migrate_share (bool, optional): Whether to migrate shares for the dashboards. If `True`, shares will be migrated, and ownership migration will be controlled by the `change_ownership` parameter. 
                                             If `False`, both shares and ownership migration will be skipped. Default: False.
             change_ownership (bool, optional): Whether to change ownership of the target dashboards. Effective only if `migrate_share` is True. Default: False.
+            checkpoint (CheckpointJournal, optional): Journal in which the export, import, share and ownership status of each
+                                                      source dashboard is recorded, keyed by source OID. Default: None.
 
         Returns:
             dict: A summary of the migration results with lists of succeeded, skipped, and failed dashboards.
@@ -865,114 +891,294 @@ class Migration:
         bulk_dashboard_data = []
         if dashboard_ids:
             self.logger.info(f"Processing dashboard migration by IDs: {dashboard_ids}")
-            for dashboard_id in dashboard_ids:
-                source_dashboard_response = self.source_client.get(f"/api/dashboards/{dashboard_id}/export?adminAccess=true")
-                self.logger.debug(f"Response for source dashboard ID {dashboard_id}: {source_dashboard_response.text if source_dashboard_response else 'No response'}")
-                if source_dashboard_response and source_dashboard_response.status_code == 200:
-                    self.logger.debug(f"Dashboard with ID: {dashboard_id} retrieved successfully.")
-                    bulk_dashboard_data.append(source_dashboard_response.json())
-                else:
-                    self.logger.error(f"Failed to export dashboard with ID: {dashboard_id}. Status Code: {source_dashboard_response.status_code if source_dashboard_response else 'No response'}")
-                    migration_summary["failed"].append({
-                    "id": dashboard_id,
-                    "reason": f"Export failed with status code {source_dashboard_response.status_code}" if source_dashboard_response else "No response from server"
-                    })  
+            # Export all dashboards concurrently; responses come back in the order of dashboard_ids
+            export_responses = self.source_client.map_concurrent(
+                ('GET', f"/api/dashboards/{dashboard_id}/export?adminAccess=true") for dashboard_id in dashboard_ids
+            )
+            for dashboard_id, source_dashboard_response in zip(dashboard_ids, export_responses):
+                dashboard_data = self._read_dashboard_export(dashboard_id, source_dashboard_response, migration_summary, checkpoint)
+                if dashboard_data is not None:
+                    bulk_dashboard_data.append(dashboard_data)
         elif dashboard_names:
             self.logger.info(f"Processing dashboard migration by names: {dashboard_names}")
-            limit = 50
-            skip = 0
-            dashboards = []
-            # Fetch dashboards from the source environment
-            while True:
-                self.logger.debug(f"Fetching dashboards (limit={limit}, skip={skip})")
-                dashboard_response = self.source_client.post('/api/v1/dashboards/searches', data={
-                    "queryParams": {"ownershipType": "allRoot", "search": "", "ownerInfo": True, "asObject": True},
-                    "queryOptions": {"sort": {"title": 1}, "limit": limit, "skip": skip}
-                })
+            bulk_dashboard_data = []
+            matching_dashboards = []
+            seen_oids = set()
+            total_dashboards = 0
+            # Stream dashboards from the source environment, keeping only unique matches by name
+            for dashboard in self.source_client.iter_dashboard_searches(fields=["oid", "title"]):
+                if dashboard["oid"] in seen_oids:
+                    continue
+                seen_oids.add(dashboard["oid"])
+                total_dashboards += 1
 
-                if not dashboard_response or dashboard_response.status_code != 200:
-                    self.logger.debug("No more dashboards found or failed to retrieve.")
-                    break
+                if dashboard["title"] in dashboard_names:
+                    self.logger.debug("Matching dashboard: %s", dashboard['title'])
+                    matching_dashboards.append(dashboard)
+                else:
+                    self.logger.debug("Dashboard %s not in the provided names; skipping.", dashboard['title'])
+            self.logger.info(f"Total unique dashboards retrieved: {total_dashboards}.")
+
+            export_responses = self.source_client.map_concurrent(
+                ('GET', f"/api/dashboards/{dashboard['oid']}/export?adminAccess=true") for dashboard in matching_dashboards
+            )
+            for dashboard, source_dashboard_response in zip(matching_dashboards, export_responses):
+                dashboard_data = self._read_dashboard_export(dashboard['oid'], source_dashboard_response,
+                                                             migration_summary, checkpoint, title=dashboard['title'])
+                if dashboard_data is not None:
+                    bulk_dashboard_data.append(dashboard_data)
+                    self.logger.debug("Dashboard %s added to migration list.", dashboard['title'])
+
+        # Steps 2 and 3: Import the exported dashboards, then migrate their shares and ownership
+        self._import_dashboard_batch(bulk_dashboard_data, migration_summary, action, republish, migrate_share,
+                                     change_ownership, checkpoint)
 
-                items = dashboard_response.json().get("items", [])
-                if not items:
-                    self.logger.debug("No more items in response; breaking pagination loop.")
-                    break
+        self.logger.info("Finished dashboard migration.")
+        self.logger.info(f"Total Dashboards Migrated: {len(migration_summary['succeeded'])}")
+        self.logger.info(f"Total Dashboards Skipped: {len(migration_summary['skipped'])}")
+        self.logger.info(f"Total Dashboards Failed: {len(migration_summary['failed'])}")
+        self.logger.info(migration_summary)
+        
+        return migration_summary
 
-                self.logger.debug(f"Fetched {len(items)} dashboards in this batch.")
-                dashboards.extend(items)
-                skip += limit
 
-            # Filter dashboards by name and avoid duplicates
-            unique_dashboards = {dash["oid"]: dash for dash in dashboards}
-            dashboards = list(unique_dashboards.values())
-            self.logger.info(f"Total unique dashboards retrieved: {len(dashboards)}.")
-            bulk_dashboard_data = []
-            for dashboard in dashboards:
-                if dashboard["title"] in dashboard_names:
-                    self.logger.debug(f"Matching dashboard: {dashboard['title']}")
-                    source_dashboard_response = self.source_client.get(f"/api/dashboards/{dashboard['oid']}/export?adminAccess=true")
-                    if source_dashboard_response and source_dashboard_response.status_code == 200:
-                        bulk_dashboard_data.append(source_dashboard_response.json())
-                        self.logger.debug(f"Dashboard {dashboard['title']} added to migration list.")
-                    else:
-                        self.logger.error(f"Failed to export dashboard: {dashboard['title']} (ID: {dashboard['oid']}).")
-                        migration_summary["failed"].append({
-                        "id": dashboard["oid"],
-                        "title": dashboard["title"],
-                        "reason": f"Export failed with status code {source_dashboard_response.status_code}" if source_dashboard_response else "No response from server"
-                        })
+    def _read_dashboard_export(self, dashboard_id, source_dashboard_response, migration_summary, checkpoint=None,
+                               title=None):
+        """
+        Checks the export response of a dashboard, recording a failed export in the summary and the checkpoint.
+
+        Parameters:
+            dashboard_id (str): The source dashboard ID.
+            source_dashboard_response (requests.Response, Exception or None): The result of /api/dashboards/{id}/export
+                                                                              as returned by map_concurrent().
+            migration_summary (dict): The summary to which a failed export is added.
+            checkpoint (CheckpointJournal, optional): Journal recording the export status.
+            title (str, optional): The dashboard title, if known, added to the failure entry and the journal.
+
+        Returns:
+            dict or None: The exported dashboard, or None if the export failed.
+        """
+        self.logger.debug("Response for source dashboard ID %s: %s", dashboard_id, LogPayload(source_dashboard_response))
+
+        def export_failed(reason):
+            self.logger.error(f"Failed to export dashboard with ID: {dashboard_id}. {reason}")
+            failure = {"id": dashboard_id, "reason": reason}
+            if title is not None:
+                failure["title"] = title
+            migration_summary["failed"].append(failure)
+            if checkpoint:
+                checkpoint.mark(dashboard_id, 'export', 'failed', title=title, error=reason)
+            return None
+
+        if isinstance(source_dashboard_response, Exception):
+            return export_failed(f"Export raised an exception: {source_dashboard_response}")
+
+        if source_dashboard_response is None:
+            return export_failed("No response from server")
+
+        if source_dashboard_response.status_code != 200:
+            return export_failed(f"Export failed with status code {source_dashboard_response.status_code}")
+
+        self.logger.debug("Dashboard with ID: %s retrieved successfully.", dashboard_id)
+        try:
+            dashboard_data = source_dashboard_response.json()
+            if not isinstance(dashboard_data, dict) or 'oid' not in dashboard_data:
+                raise ValueError("the response is not a dashboard object")
+        except ValueError as e:
+            # A truncated or malformed export fails this dashboard only, not the rest of the migration
+            return export_failed(f"Export returned an invalid dashboard: {e}")
+        if checkpoint:
+            checkpoint.mark(dashboard_id, 'export', 'done', title=dashboard_data.get('title', title))
+        return dashboard_data
+
+
+    def _post_dashboard_bulk(self, url, dashboards, batcher=None, payload_sizes=None):
+        """
+        Posts dashboards to the bulk import endpoint. If the target rejects the request as a whole (400, 413 or 429),
+        the dashboards are split in halves that are posted separately, down to single dashboards, so one dashboard
+        the target cannot import does not fail the rest of its batch.
+
+        The bulk import is not idempotent: after a timeout or a server error the target may already have imported part
+        of the batch, so such a batch is reported as failed and never resent.
+
+        Parameters:
+            url (str): The bulk import endpoint with its query string.
+            dashboards (list): The exported dashboards.
+            batcher (AdaptiveBatcher, optional): Batcher adapting its budgets to the latency and outcome of each request.
+            payload_sizes (dict, optional): Source OID to the exported size in bytes of each dashboard, reported to the batcher.
+
+        Returns:
+            tuple: (response_data, rejected). response_data holds the 'succeded', 'skipped' and 'failed' results of the
+                   successful requests; rejected lists (dashboard, status code) for dashboards whose request failed.
+        """
+        start = time.perf_counter()
+        response = self.target_client.post(url, data=dashboards)
+        latency = time.perf_counter() - start
+        self.logger.debug("Response for bulk migration: %s", LogPayload(response))
+
+        status = response.status_code if response is not None else None
+        # Timeouts, 413, 429 and server errors mean the batch was too much for the target; other errors point at its content
+        overloaded = status is None or status in (413, 429) or status >= 500
+        if batcher and (status == 201 or overloaded):
+            batcher.record(
+                sum((payload_sizes or {}).get(dash.get('oid'), 0) for dash in dashboards),
+                sum(len(dash.get('widgets') or []) for dash in dashboards),
+                latency,
+                status == 201
+            )
+
+        if status == 201:
+            response_data = response.json()
+            return {
+                'succeded': response_data.get('succeded', []),
+                'skipped': response_data.get('skipped', []),
+                'failed': response_data.get('failed', {})
+            }, []
+
+        if status is None or status >= 500:
+            self.logger.error(f"Bulk migration of {len(dashboards)} dashboards failed. "
+                              f"Status Code: {status if status is not None else 'No response'}. The target may have imported "
+                              f"part of the batch, so it is not resent; check these dashboards in the target before retrying.")
+            return {'succeded': [], 'skipped': [], 'failed': {}}, [(dash, status if status is not None else 'No response')
+                                                                   for dash in dashboards]
+
+        # Only these statuses guarantee that nothing of the batch was applied
+        if len(dashboards) == 1 or status not in (400, 413, 429):
+            return {'succeded': [], 'skipped': [], 'failed': {}}, [(dash, status) for dash in dashboards]
+
+        self.logger.warning(f"Bulk migration of {len(dashboards)} dashboards failed. Status Code: {status}. "
+                            f"Splitting the batch to isolate the failing dashboards.")
+        middle = len(dashboards) // 2
+        merged, rejected = {'succeded': [], 'skipped': [], 'failed': {}}, []
+        for half in (dashboards[:middle], dashboards[middle:]):
+            response_data, half_rejected = self._post_dashboard_bulk(url, half, batcher, payload_sizes)
+            merged['succeded'].extend(response_data['succeded'])
+            merged['skipped'].extend(response_data['skipped'])
+            for category, errors in response_data['failed'].items():
+                merged['failed'].setdefault(category, []).extend(errors)
+            rejected.extend(half_rejected)
+        return merged, rejected
+
+
+    def _import_dashboard_batch(self, bulk_dashboard_data, migration_summary, action, republish, migrate_share, change_ownership,
+                                checkpoint=None, batcher=None, payload_sizes=None):
+        """
+        Imports exported dashboards into the target with one bulk request, then migrates their shares and ownership.
+
+        Parameters:
+            bulk_dashboard_data (list): The exported dashboards.
+            migration_summary (dict): The summary to which the succeeded, skipped and failed dashboards are added.
+            action, republish, migrate_share, change_ownership: See migrate_dashboards().
+            checkpoint (CheckpointJournal, optional): Journal recording the status of each dashboard.
+            batcher, payload_sizes: See _post_dashboard_bulk().
+        """
+        # Dashboards whose exported content matches their last import recorded in the checkpoint are not imported again
+        content_hashes = {}
+        # Source OIDs of dashboards imported by an earlier run that changed since (reopened by incremental sync)
+        previously_imported = set()
+        if checkpoint:
+            changed_dashboard_data = []
+            for dashboard_data in bulk_dashboard_data:
+                content_hash = dashboard_content_hash(dashboard_data)
+                entry = checkpoint.get(dashboard_data['oid'])
+                if entry and entry['target_oid'] and entry['content_hash'] == content_hash:
+                    self.logger.info(f"Dashboard '{dashboard_data['title']}' is unchanged since its last import. Skipping.")
+                    migration_summary['skipped'].append(dashboard_data['title'])
+                    for phase in ('import', 'shares', 'ownership'):
+                        checkpoint.mark(dashboard_data['oid'], phase, 'skipped')
                 else:
-                    self.logger.debug(f"Dashboard {dashboard['title']} not in the provided names; skipping.")
+                    content_hashes[dashboard_data['oid']] = content_hash
+                    changed_dashboard_data.append(dashboard_data)
+                    if entry and entry['target_oid']:
+                        previously_imported.add(dashboard_data['oid'])
+            bulk_dashboard_data = changed_dashboard_data
 
         # Step 2: Perform bulk migration
         source_dash_dict = {dash['oid']: dash['title'] for dash in bulk_dashboard_data}  # Create a map of source OIDs to titles
         migrated_target_dash_dict = {}  # Placeholder for target OIDs and titles after migration
+        # The bulk import reports dashboards by title; map them back to source OIDs for the checkpoint journal
+        source_oids_by_title = {}
+        for source_oid, source_title in source_dash_dict.items():
+            source_oids_by_title.setdefault(source_title, []).append(source_oid)
+
+        def checkpoint_import(title, status, error=None, target_oid=None):
+            # Records the import status and returns it, turned into 'failed' for a reopened dashboard the target skipped
+            oids = source_oids_by_title.get(title)
+            if not checkpoint or not oids:
+                return status
+            # Prefer the source dashboard whose OID was preserved by the import
+            source_oid = target_oid if target_oid in oids else oids[0]
+            oids.remove(source_oid)
+            if status == 'skipped' and source_oid in previously_imported:
+                # The target kept its older copy of a dashboard that changed in the source; retry it on the next run
+                status, error = 'failed', "Skipped by the target although the dashboard changed in the source"
+            checkpoint.mark(source_oid, 'import', status, error=error, target_oid=target_oid,
+                            content_hash=content_hashes.get(source_oid) if status == 'done' else None)
+            return status
+
         if bulk_dashboard_data:
             url = f"/api/v1/dashboards/import/bulk?republish={str(republish).lower()}"
-            if action:
-                url += f"&action={action}"
-
-            self.logger.info(f"Sending bulk migration request for {len(bulk_dashboard_data)} dashboards.")
-            response = self.target_client.post(url, data=bulk_dashboard_data)
-            self.logger.debug(f"Response for bulk migration: {response.text if response else 'No response'}")
-
-            # Handle the migration results
-            if response and response.status_code == 201:
-                response_data = response.json()
+            # Without an explicit action the target skips dashboards it already has, so dashboards that changed
+            # since an earlier run imported them are sent in their own request that overwrites the target copy
+            requests_by_action = {action: bulk_dashboard_data}
+            if previously_imported and action in (None, 'skip'):
+                requests_by_action = {
+                    action: [dash for dash in bulk_dashboard_data if dash['oid'] not in previously_imported],
+                    'overwrite': [dash for dash in bulk_dashboard_data if dash['oid'] in previously_imported]
+                }
 
-                # Process succeeded dashboards
-                if "succeded" in response_data:  
-                    for response_dash in response_data['succeded']:
-                        target_oid = response_dash['oid']
-                        title = response_dash['title']
-
-                        # Populate the target map dictionary
-                        migrated_target_dash_dict[target_oid] = title
-                        migration_summary['succeeded'].append(title)
-
-                        self.logger.debug(f"Captured Target OID '{target_oid}' with title '{title}' in migrated_target_map_dict.")
-
-                # Process skipped dashboards
-                if "skipped" in response_data:
-                    migration_summary['skipped'] = [dash['title'] for dash in response_data['skipped']]
-                    for dash_title in migration_summary['skipped']:
-                        self.logger.info(f"Skipped dashboard: {dash_title}")
-
-                # Process failed dashboards
-                if "failed" in response_data:
-                    failed_items = response_data['failed']
-                    for category, errors in failed_items.items():
-                        for error in errors:
-                            migration_summary['failed'].append(error['title'])
-                            self.logger.warning(f"Failed to migrate dashboard: {error['title']} - {error['error']['message']}")
-            else:
-                self.logger.error(f"Bulk migration failed. Status Code: {response.status_code if response else 'No response'}")
-                migration_summary['failed'].extend([dash['title'] for dash in bulk_dashboard_data])
+            response_data, rejected = {'succeded': [], 'skipped': [], 'failed': {}}, []
+            for request_action, dashboards in requests_by_action.items():
+                if not dashboards:
+                    continue
+                request_url = f"{url}&action={request_action}" if request_action else url
+                self.logger.info(f"Sending bulk migration request for {len(dashboards)} dashboards"
+                                 f"{f' with action={request_action}' if request_action else ''}.")
+                request_data, request_rejected = self._post_dashboard_bulk(request_url, dashboards, batcher, payload_sizes)
+                response_data['succeded'].extend(request_data['succeded'])
+                response_data['skipped'].extend(request_data['skipped'])
+                for category, errors in request_data['failed'].items():
+                    response_data['failed'].setdefault(category, []).extend(errors)
+                rejected.extend(request_rejected)
+
+            # Process succeeded dashboards
+            for response_dash in response_data['succeded']:
+                target_oid = response_dash['oid']
+                title = response_dash['title']
+
+                # Populate the target map dictionary
+                migrated_target_dash_dict[target_oid] = title
+                migration_summary['succeeded'].append(title)
+                checkpoint_import(title, 'done', target_oid=target_oid)
+
+                self.logger.debug("Captured Target OID '%s' with title '%s' in migrated_target_map_dict.", target_oid, title)
+
+            # Process skipped dashboards
+            for dash in response_data['skipped']:
+                if checkpoint_import(dash['title'], 'skipped') == 'failed':
+                    migration_summary['failed'].append(dash['title'])
+                    self.logger.error(f"Dashboard '{dash['title']}' changed in the source but was skipped by the target.")
+                    continue
+                migration_summary['skipped'].append(dash['title'])
+                self.logger.info(f"Skipped dashboard: {dash['title']}")
+
+            # Process failed dashboards
+            for category, errors in response_data['failed'].items():
+                for error in errors:
+                    migration_summary['failed'].append(error['title'])
+                    self.logger.warning(f"Failed to migrate dashboard: {error['title']} - {error['error']['message']}")
+                    checkpoint_import(error['title'], 'failed', error=error['error']['message'])
+
+            # Process dashboards whose bulk request failed, even when sent on their own
+            for dash, status in rejected:
+                self.logger.error(f"Bulk migration failed for dashboard: {dash['title']}. Status Code: {status}")
+                migration_summary['failed'].append(dash['title'])
+                if checkpoint:
+                    checkpoint.mark(dash['oid'], 'import', 'failed', error=f"Bulk import failed with status code {status}")
 
         self.logger.info("Dashboard migration completed.")
-        self.logger.debug(f"Source Map Dictionary: {source_dash_dict}")
-        self.logger.debug(f"Migrated Target Map Dictionary: {migrated_target_dash_dict}")
+        self.logger.debug("Source Map Dictionary: %s", LogPayload(source_dash_dict))
+        self.logger.debug("Migrated Target Map Dictionary: %s", LogPayload(migrated_target_dash_dict))
 
         # Step 3: Handle shares and ownership migration
         if not migrate_share:
@@ -1011,6 +1217,10 @@ class Migration:
                     self.logger.warning(
                         f"Source dashboard '{source_title}' with ID '{source_oid}' was not found in the target environment."
                     )
+                    # Dashboards skipped by the import keep the shares and owner they have in the target
+                    if checkpoint and source_title in migration_summary['skipped']:
+                        checkpoint.mark(source_oid, 'shares', 'skipped')
+                        checkpoint.mark(source_oid, 'ownership', 'skipped')
 
             self.logger.info(f"Dashboards to process: {dash_to_process}")
             self.logger.info(f"Problematic dashboards: {problem_dash}")
@@ -1027,24 +1237,20 @@ class Migration:
                 self.migrate_dashboard_shares(
                     source_dashboard_ids=list(dash_to_process.keys()),      # Original source OIDs
                     target_dashboard_ids=list(dash_to_process.values()),    # Corresponding target OIDs
-                    change_ownership=change_ownership
+                    change_ownership=change_ownership,
+                    checkpoint=checkpoint
                 )
                 self.logger.info("Share and ownership migration completed.")
 
 
-        self.logger.info("Finished dashboard migration.")
-        self.logger.info(f"Total Dashboards Migrated: {len(migration_summary['succeeded'])}")
-        self.logger.info(f"Total Dashboards Skipped: {len(migration_summary['skipped'])}")
-        self.logger.info(f"Total Dashboards Failed: {len(migration_summary['failed'])}")
-        self.logger.info(migration_summary)
-        
-        return migration_summary
-
-
-    def migrate_all_dashboards(self, action=None, republish=False, migrate_share=False, change_ownership=False, batch_size=10, sleep_time=10):
+    def migrate_all_dashboards(self, action=None, republish=False, migrate_share=False, change_ownership=False, batch_size=None, sleep_time=0,
+                               checkpoint_path=None, resume=False, incremental=False, queue_size=None):
         """
         Migrates all dashboards from the source to the target environment in batches.
 
+        Exports and imports are pipelined: dashboards are exported concurrently from the source while the previous
+        batch is imported into the target, so both environments work in parallel.
+
         Parameters:
             action (str, optional): Determines how to handle existing dashboards in the target environment.
                                     Options:
@@ -1057,77 +1263,104 @@ class Migration:
             migrate_share (bool, optional): Whether to migrate shares for the dashboards. If `True`, shares will be migrated, and ownership migration will be controlled by the `change_ownership` parameter. 
                                             If `False`, both shares and ownership migration will be skipped. Default: False.
             change_ownership (bool, optional): Whether to change ownership of the target dashboards. Effective only if `migrate_share` is True. Default: False.
-            batch_size (int, optional): Number of dashboards to process in each batch. Default: 10.
-            sleep_time (int, optional): Time (in seconds) to sleep between batches. Default: 10 seconds.
+            batch_size (int, optional): Fixed number of dashboards to process in each batch. Default: None, meaning batches are
+                                        sized adaptively by payload bytes and widget count, see the 'bulk_import' section of the target config.
+            sleep_time (int, optional): Time (in seconds) to sleep between batches. Default: 0.
+                                        Throttling and transient errors are retried with backoff by the APIClient, and exports are
+                                        throttled by `queue_size`, so no pause is needed by default.
+            checkpoint_path (str, optional): Path of a SQLite checkpoint journal recording the export, import, share and ownership
+                                             status of every dashboard, keyed by source OID. Default: None (progress is kept in memory only).
+            resume (bool, optional): Whether to resume from the checkpoint journal: dashboards whose phases all completed are skipped,
+                                     and only failed or pending phases run again. If False, the journal is cleared first. Default: False.
+            incremental (bool, optional): Whether to migrate only dashboards that are new or changed since the previous run recorded in the
+                                          checkpoint journal, judged by their 'lastUpdated' in the source listing. Implies `resume`.
+                                          With `action` None or 'skip', changed dashboards that an earlier run imported are sent with
+                                          action 'overwrite' so the target copy is updated. Default: False.
+            queue_size (int, optional): Maximum number of exported dashboards waiting to be imported. Exports pause while the queue
+                                        is full. Default: `batch_size`, or the 'max_items' bulk import setting.
 
         Returns:
             dict: A summary of the migration results for all batches, containing lists of succeeded, skipped, and failed dashboards.
+                  When resuming, it covers only the dashboards processed in this run.
+
+        Raises:
+            ValueError: If `resume` or `incremental` is True without a `checkpoint_path`.
 
         Notes:
-            - **Batch Processing**: Dashboards are processed in batches to avoid overloading the system.
+            - **Batch Processing**: Dashboards are processed in batches to avoid overloading the system. Concurrent exports are bounded by the
+              'max_workers' setting of the source 'concurrency' config section and by `queue_size`.
+            - **Adaptive Batching**: Unless `batch_size` is given, each bulk import holds as many dashboards as fit in a budget of payload
+              bytes and widgets. The budget grows while imports finish within the target latency and shrinks when they are slower, time out
+              or are rejected as too large. A batch whose import fails as a whole is split in halves and retried until the failing dashboards
+              are isolated, so one bad dashboard does not fail the others.
+            - **Checkpointing**: Every phase is committed to the journal as soon as it finishes, so a crashed or interrupted run
+              can be continued with `resume=True` and the same parameters. Dashboards whose export or import did not complete are
+              exported and imported again; dashboards that were imported but whose shares or ownership did not complete only
+              have their shares and ownership migrated again, using the target OID recorded in the journal.
+            - **Incremental Sync**: With `incremental=True`, the 'lastUpdated' of every dashboard in the source listing is compared with
+              the watermark stored in the journal by the previous run. Only new or changed dashboards (and those left incomplete) are
+              migrated. A changed dashboard whose exported content still matches its last import is not imported again.
             - **Best Use Case**: This method is suitable when migrating all dashboards from a source to a target environment.
             - **Overwrite Action**: When using `overwrite`, shares and ownership will not be migrated. If a dashboard already exists, the target dashboard will be overwritten, retaining its existing shares but setting the API user as the new owner. Subsequent adjustments to shares and ownership will not be supported in this mode.
             - **Duplicate Action**: Creates duplicate dashboards without shares and ownership migration.
             - **Skip Action**: Skips migration for existing dashboards, but new ones are processed normally.
         """
 
+        if resume and not checkpoint_path:
+            raise ValueError("The `resume` parameter requires a `checkpoint_path`.")
+        if incremental and not checkpoint_path:
+            raise ValueError("The `incremental` parameter requires a `checkpoint_path`.")
+
         self.logger.info("Fetching all dashboards from the source environment.")
-        all_dashboard_ids = set()
+        watermarks = {}
         
-        # Step 1: Fetch all dashboards
-        limit = 50
-        skip = 0
-        while True:
-            dashboard_response = self.source_client.post('/api/v1/dashboards/searches', data={
-                "queryParams": {"ownershipType": "allRoot", "search": "", "ownerInfo": True, "asObject": True},
-                "queryOptions": {"sort": {"title": 1}, "limit": limit, "skip": skip}
-            })
-            
-            if not dashboard_response or dashboard_response.status_code != 200:
-                self.logger.debug("No more dashboards found or failed to retrieve.")
-                break
-            
-            items = dashboard_response.json().get("items", [])
-            if not items:
-                self.logger.debug("No more items in response; breaking pagination loop.")
-                break
-            
-            self.logger.debug(f"Fetched {len(items)} dashboards in this batch.")
-            all_dashboard_ids.update([dash["oid"] for dash in items])
-            skip += limit
+        # Step 1: Fetch all dashboards, with the last update time of each for incremental runs
+        for dashboard in self.source_client.iter_dashboard_searches(fields=["oid", "lastUpdated"] if incremental else ["oid"]):
+            watermarks[dashboard["oid"]] = dashboard.get("lastUpdated")
 
-        self.logger.info(f"Total unique dashboards retrieved: {len(all_dashboard_ids)}.")
+        self.logger.info(f"Total unique dashboards retrieved: {len(watermarks)}.")
 
-        # Step 2: Migrate dashboards in batches
-        all_dashboard_ids = list(all_dashboard_ids)
+        # Sorted, so a resumed run processes the remaining dashboards in the same order
+        all_dashboard_ids = sorted(watermarks)
         migration_summary = {'succeeded': [], 'skipped': [], 'failed': []}
 
-        for i in range(0, len(all_dashboard_ids), batch_size):
-            batch_ids = all_dashboard_ids[i:i + batch_size]
-            batch_number = (i // batch_size) + 1
-            self.logger.info(f"Processing batch {batch_number} with {len(batch_ids)} dashboards: {batch_ids}")
-            
-            try:
-                batch_summary = self.migrate_dashboards(
-                    dashboard_ids=batch_ids,
-                    action=action,
-                    republish=republish,
-                    migrate_share=migrate_share,
-                    change_ownership=change_ownership
+        checkpoint = None
+        if checkpoint_path:
+            checkpoint = CheckpointJournal(checkpoint_path)
+            if not resume and not incremental:
+                checkpoint.reset()
+            checkpoint.add(all_dashboard_ids)
+
+        try:
+            if incremental:
+                # A dashboard without a 'lastUpdated' is always treated as changed
+                entries = checkpoint.entries()
+                changed = {
+                    oid: watermark for oid, watermark in watermarks.items()
+                    if watermark is None or entries[oid]['source_updated'] != watermark
+                }
+                checkpoint.reopen(changed)
+                self.logger.info(f"Incremental migration: {len(changed)} dashboards are new or changed since the previous run, "
+                                 f"{len(watermarks) - len(changed)} are unchanged.")
+
+            if checkpoint:
+                all_dashboard_ids = self._resume_dashboard_checkpoint(
+                    checkpoint, all_dashboard_ids, action, migrate_share, change_ownership
                 )
-                self.logger.info(f"Batch {batch_number} migration summary: {batch_summary}")
-                
-                # Aggregate batch results into the overall summary
-                migration_summary['succeeded'].extend(batch_summary['succeeded'])
-                migration_summary['skipped'].extend(batch_summary['skipped'])
-                migration_summary['failed'].extend(batch_summary['failed'])
-            except Exception as e:
-                self.logger.error(f"Error occurred in batch {batch_number}: {e}")
-                continue  # Continue with the next batch even if an error occurs
 
-            if i + batch_size < len(all_dashboard_ids):  # Avoid sleeping after the last batch
-                self.logger.info(f"Sleeping for {sleep_time} seconds before processing the next batch.")
-                time.sleep(sleep_time)
+            # Step 2: Export and import the dashboards in a pipeline. An explicit batch_size means fixed-size batches.
+            bulk_import_config = dict(self.target_client.config.get('bulk_import') or {})
+            if batch_size:
+                bulk_import_config['adaptive'] = False
+            batcher = AdaptiveBatcher(bulk_import_config, max_items=batch_size)
+            self._migrate_dashboard_pipeline(
+                all_dashboard_ids, migration_summary, action, republish, migrate_share, change_ownership,
+                batcher, sleep_time, queue_size or batcher.max_items, checkpoint
+            )
+        finally:
+            if checkpoint:
+                self.logger.info(f"Checkpoint journal {checkpoint_path}: {checkpoint.summary()}")
+                checkpoint.close()
 
         self.logger.info("Finished migrating all dashboards.")
         self.logger.info(f"Total Dashboards Migrated: {len(migration_summary['succeeded'])}")
@@ -1137,7 +1370,116 @@ class Migration:
         return migration_summary
 
 
-    def migrate_datamodels(self, datamodel_ids=None, datamodel_names=None, provider_connection_map=None, dependencies=None, shares=False, action=None, new_title=None):
+    def _resume_dashboard_checkpoint(self, checkpoint, dashboard_ids, action, migrate_share, change_ownership):
+        """
+        Applies a checkpoint journal to a dashboard migration: completed dashboards are left out, dashboards that
+        only miss their shares or ownership have those migrated again, and the rest is returned for migration.
+
+        Parameters:
+            checkpoint (CheckpointJournal): The journal of the previous runs.
+            dashboard_ids (list): The source dashboard OIDs to migrate.
+            action (str): The `action` of the migration; 'duplicate' and 'overwrite' skip shares and ownership.
+            migrate_share (bool): Whether shares are migrated.
+            change_ownership (bool): Whether ownership is changed.
+
+        Returns:
+            list: The source OIDs that still have to be exported and imported.
+        """
+        phases = ['export', 'import']
+        if migrate_share and action not in ["duplicate", "overwrite"]:
+            phases.append('shares')
+            if change_ownership:
+                phases.append('ownership')
+
+        entries = checkpoint.entries()
+        to_migrate = []
+        to_share = {}
+        completed = 0
+        for dashboard_id in dashboard_ids:
+            entry = entries.get(dashboard_id)
+            remaining = checkpoint.remaining_phases(entry, phases)
+            if not remaining:
+                completed += 1
+            elif 'export' in remaining or 'import' in remaining or not entry['target_oid']:
+                to_migrate.append(dashboard_id)
+            else:
+                to_share[dashboard_id] = entry['target_oid']
+
+        self.logger.info(
+            f"Checkpoint: {completed} dashboards already migrated, {len(to_share)} awaiting shares or ownership, "
+            f"{len(to_migrate)} to export and import."
+        )
+
+        if to_share:
+            self.logger.info(f"Resuming shares and ownership for dashboards: {to_share}")
+            self.migrate_dashboard_shares(
+                source_dashboard_ids=list(to_share.keys()),
+                target_dashboard_ids=list(to_share.values()),
+                change_ownership=change_ownership,
+                checkpoint=checkpoint
+            )
+        return to_migrate
+
+
+    def _migrate_dashboard_pipeline(self, dashboard_ids, migration_summary, action, republish, migrate_share, change_ownership,
+                                    batcher, sleep_time, queue_size, checkpoint=None):
+        """
+        Migrates dashboards as a two-stage pipeline: exports from the source run concurrently and feed a bounded
+        queue, which this thread drains into bulk imports followed by their shares.
+
+        The source keeps exporting while the target imports. When `queue_size` exported dashboards are waiting,
+        exports pause until the importer catches up, so memory stays bounded and neither server is flooded.
+
+        Parameters:
+            dashboard_ids (list): The source dashboard OIDs to migrate.
+            migration_summary (dict): The summary to which the batch results are added.
+            action, republish, migrate_share, change_ownership: See migrate_dashboards().
+            batcher (AdaptiveBatcher): Groups the exported dashboards into bulk imports.
+            sleep_time (int): Seconds to pause between bulk imports.
+            queue_size (int): Maximum number of exported dashboards waiting to be imported.
+            checkpoint (CheckpointJournal, optional): Journal recording the status of each dashboard.
+        """
+        exports = self.source_client.iter_concurrent(
+            (('GET', f"/api/dashboards/{dashboard_id}/export?adminAccess=true") for dashboard_id in dashboard_ids),
+            max_pending=queue_size
+        )
+        payload_sizes = {}
+        batch_number = 0
+        remaining = len(dashboard_ids)
+
+        def import_batch(batch):
+            nonlocal batch_number
+            batch_number += 1
+            self.logger.info(f"Importing batch {batch_number} with {len(batch)} dashboards "
+                             f"({sum(payload_sizes[dash['oid']] for dash in batch)} bytes): {[dash['oid'] for dash in batch]}")
+            try:
+                self._import_dashboard_batch(batch, migration_summary, action, republish, migrate_share, change_ownership,
+                                             checkpoint, batcher, payload_sizes)
+            except Exception as e:
+                self.logger.error(f"Error occurred in batch {batch_number}: {e}")
+            for dash in batch:
+                payload_sizes.pop(dash['oid'], None)
+
+            if sleep_time and remaining:  # Avoid sleeping after the last batch
+                self.logger.info(f"Sleeping for {sleep_time} seconds before processing the next batch.")
+                time.sleep(sleep_time)
+
+        for index, source_dashboard_response in exports:
+            remaining -= 1
+            dashboard_data = self._read_dashboard_export(dashboard_ids[index], source_dashboard_response, migration_summary, checkpoint)
+            if dashboard_data is None:
+                continue
+            payload_sizes[dashboard_data['oid']] = len(source_dashboard_response.content)
+            for batch in batcher.add(dashboard_data, payload_sizes[dashboard_data['oid']], len(dashboard_data.get('widgets') or [])):
+                import_batch(batch)
+
+        last_batch = batcher.flush()
+        if last_batch:
+            import_batch(last_batch)
+
+
+    def migrate_datamodels(self, datamodel_ids=None, datamodel_names=None, provider_connection_map=None, dependencies=None, shares=False, action=None, new_title=None,
+                           max_workers=1):
         """
         Migrates specific data models from the source environment to the target environment.
 
@@ -1162,6 +1504,9 @@ class Migration:
                 - "overwrite": Attempts to overwrite an existing model using its original ID via the datamodelId parameter. If the model is not found in the target environment, it will automatically fall back and create the model.
                 - "duplicate": Creates a new model by passing a `new_title` to the `newTitle` parameter of the import API endpoint. If `new_title` is not provided, the original title will be used with " (Duplicate)" appended.
             new_title (str, optional): New name for the duplicated data model. Used only when `action='duplicate'`.
+            max_workers (int, optional): Number of data models migrated at the same time. Each worker imports a data model,
+                                         publishes it if needed and applies its shares. Default is 1 (one by one).
+                                         Results are reported in the requested order regardless of the worker count.
 
         Returns:
             dict: A summary of the migration results with lists of succeeded, skipped, and failed data models.
@@ -1188,7 +1533,8 @@ class Migration:
 
 
         self.logger.info("Starting data model migration from source to target.")
-        self.logger.debug(f"Input Parameters: datamodel_ids={datamodel_ids}, datamodel_names={datamodel_names}, dependencies={dependencies}, shares={shares}")
+        self.logger.debug("Input Parameters: datamodel_ids=%s, datamodel_names=%s, dependencies=%s, shares=%s, max_workers=%s",
+                          datamodel_ids, datamodel_names, dependencies, LogPayload(shares), max_workers)
 
         # Initialize migration summary
         migration_summary = {
@@ -1205,20 +1551,27 @@ class Migration:
         # Fetch data models based on provided parameters (IDs or names)
         all_datamodel_data = []
         if datamodel_ids:
-            self.logger.debug(f"Processing data model migration by IDs: {datamodel_ids}")
-            for datamodel_id in datamodel_ids:
-                response = self.source_client.get(f"/api/v2/datamodel-exports/schema", params={
+            self.logger.debug("Processing data model migration by IDs: %s", datamodel_ids)
+            # Fetch all schema exports concurrently; responses come back in the order of datamodel_ids
+            export_responses = self.source_client.map_concurrent({
+                "method": "GET",
+                "endpoint": "/api/v2/datamodel-exports/schema",
+                "params": {
                     "datamodelId": datamodel_id,
                     "type": "schema-latest",
                     "dependenciesIdsToInclude": ",".join(api_dependencies),
-                })
-                if response.status_code == 200:
+                }
+            } for datamodel_id in datamodel_ids)
+            for datamodel_id, response in zip(datamodel_ids, export_responses):
+                if isinstance(response, Exception):
+                    self.logger.error(f"Failed to fetch data model ID {datamodel_id}. Exception: {response}")
+                elif response is not None and response.status_code == 200:
                     data_model_json = response.json()
                     self.logger.info(f"Successfully fetched data model name {data_model_json.get('title', 'Unknown Title')}.")
-                    self.logger.debug(f"Successfully fetched data model ID {datamodel_id}: {response.json()}")
-                    all_datamodel_data.append(response.json())
+                    self.logger.debug("Successfully fetched data model ID %s: %s", datamodel_id, data_model_json)
+                    all_datamodel_data.append(data_model_json)
                 else:
-                    self.logger.error(f"Failed to fetch data model ID {datamodel_id}. Response: {response.text}")
+                    self.logger.error(f"Failed to fetch data model ID {datamodel_id}. Response: {response.text if response is not None else 'No response'}")
 
         elif datamodel_names:
             self.logger.debug("Fetching all data models to filter by names.")
@@ -1229,109 +1582,93 @@ class Migration:
             self.logger.info(f"Retrieved {len(response.json())} data models from the source environment.")
 
             source_datamodels = response.json()
-            self.logger.debug(f"Source data models fetched: {source_datamodels}")
-
-            # Filter the data models to migrate
-            for datamodel in source_datamodels:
-                if datamodel["title"] in datamodel_names:
-                    response = self.source_client.get(f"/api/v2/datamodel-exports/schema", params={
-                        "datamodelId": datamodel["oid"],
-                        "type": "schema-latest",
-                        "dependenciesIdsToInclude": ",".join(api_dependencies),
-                    })
-                    if response.status_code == 200:
-                        self.logger.debug(f"Successfully fetched data model '{datamodel['title']}' with ID {datamodel['oid']}.")
-                        all_datamodel_data.append(response.json())
-                    else:
-                        self.logger.error(f"Failed to fetch data model '{datamodel['title']}' (ID: {datamodel['oid']}). Response: {response.text}")
+            self.logger.debug("Source data models fetched: %s", LogPayload(source_datamodels))
+
+            # Filter the data models to migrate and fetch their schema exports concurrently
+            matching_datamodels = [datamodel for datamodel in source_datamodels if datamodel["title"] in datamodel_names]
+            export_responses = self.source_client.map_concurrent({
+                "method": "GET",
+                "endpoint": "/api/v2/datamodel-exports/schema",
+                "params": {
+                    "datamodelId": datamodel["oid"],
+                    "type": "schema-latest",
+                    "dependenciesIdsToInclude": ",".join(api_dependencies),
+                }
+            } for datamodel in matching_datamodels)
+            for datamodel, response in zip(matching_datamodels, export_responses):
+                if isinstance(response, Exception):
+                    self.logger.error(f"Failed to fetch data model '{datamodel['title']}' (ID: {datamodel['oid']}). Exception: {response}")
+                elif response is not None and response.status_code == 200:
+                    self.logger.debug("Successfully fetched data model '%s' with ID %s.", datamodel['title'], datamodel['oid'])
+                    all_datamodel_data.append(response.json())
+                else:
+                    self.logger.error(f"Failed to fetch data model '{datamodel['title']}' (ID: {datamodel['oid']}). Response: {response.text if response is not None else 'No response'}")
 
-        # Migrate each data model one by one
+        # Migrate the data models, each one through import, publish and shares, on up to max_workers threads
         if all_datamodel_data:
-            self.logger.info(f"Migrating '{len(all_datamodel_data)}' datamodels one by one to the target environment.")
-            successfully_migrated_datamodels = []
+            max_workers = max(1, min(int(max_workers or 1), len(all_datamodel_data)))
+            self.logger.info(f"Migrating '{len(all_datamodel_data)}' datamodels to the target environment with {max_workers} worker(s).")
             migration_summary['failure_reasons'] = {}
 
-            for data_model in all_datamodel_data:
-                for dataset in data_model.get("datasets", []):
-                    connection = dataset.get("connection")
-
-                    if connection and isinstance(connection, dict):
-                        provider = connection.get("provider")
-
-                        if provider_connection_map and provider in provider_connection_map:
-                            dataset["connection"] = {
-                                "oid": provider_connection_map[provider],
-                                "provider": provider
-                            }
-                        else:
-                            # fallback to cleaning parameters if no override
-                            if "parameters" in connection:
-                                connection["parameters"] = ""
-
-                self.logger.debug(f"Data model after processing connections: {data_model}")
-                datasets_log = data_model.get("datasets", [])
-                if datasets_log:
-                    self.logger.debug(f"Connection object: {datasets_log[0].get('connection', {})}")
-                else:
-                    self.logger.warning(f"No datasets found in data model: {data_model.get('title', 'Unknown Title')}")
-
-                # Prepare request URL based on action (overwrite or duplicate)
-                import_url = "/api/v2/datamodel-imports/schema"
-                query_string = ""
-                if action == "overwrite":
-                    query_string = f"?datamodelId={data_model.get('oid')}"
-                elif action == "duplicate":
-                    new_model_title = new_title or f"{data_model.get('title', 'Untitled')} (Duplicate)"
-                    query_string = f"?newTitle={new_model_title}"
-
-                try:
-                    response = self.target_client.post(f"{import_url}{query_string}", data=data_model)
-                    if response.status_code == 201:
-                        self.logger.info(f"Successfully migrated data model: {data_model['title']}")
-                        migration_summary['succeeded'].append(data_model['title'])
-                        successfully_migrated_datamodels.append(data_model)
-                        success_count += 1
-                    elif response.status_code == 404 and action == "overwrite":
-                        fallback_reason = (
-                            f"Data model '{data_model['title']}' not found in target for overwrite. "
-                            f"Retrying without overwrite option."
-                        )
-                        self.logger.warning(fallback_reason)
-
-                        # Retry without query param
-                        fallback_response = self.target_client.post(import_url, data=data_model)
-                        if fallback_response.status_code == 201:
-                            self.logger.info(f"Successfully migrated data model without overwrite: {data_model['title']}")
-                            migration_summary['succeeded'].append(data_model['title'])
-                            successfully_migrated_datamodels.append(data_model)
-                            success_count += 1
-                        elif fallback_response.status_code == 400 and fallback_response.json().get("title") == "ElasticubeAlreadyExists":
-                            final_reason = (
-                                f"Datamodel '{data_model['title']}' already exists on the target with a different ID. "
-                                f"Consider using action='duplicate' with a new title, or delete the existing model manually."
-                            )
-                            self.logger.error(final_reason)
-                            migration_summary['failed'].append(data_model['title'])
-                            migration_summary['failure_reasons'][data_model['title']] = final_reason
-                            fail_count += 1
-                        else:
-                            error_message = fallback_response.json().get("detail", "Unknown error")
-                            self.logger.error(f"Fallback failed to migrate data model: {data_model['title']}. Error: {error_message}")
-                            migration_summary['failed'].append(data_model['title'])
-                            migration_summary['failure_reasons'][data_model['title']] = error_message
-                            fail_count += 1
-                    else:
-                        error_message = response.json().get("detail", "Unknown error")
-                        self.logger.error(f"Failed to migrate data model: {data_model['title']}. Error: {error_message}")
-                        migration_summary['failed'].append(data_model['title'])
-                        migration_summary['failure_reasons'][data_model['title']] = error_message
-                        fail_count += 1
-                except Exception as e:
-                    reason = f"Exception occurred: {str(e)}"
-                    self.logger.error(f"Exception while migrating data model '{data_model['title']}': {reason}")
-                    migration_summary['failed'].append(data_model['title'])
-                    migration_summary['failure_reasons'][data_model['title']] = reason
+            user_mapping, group_mapping = {}, {}
+            if shares:
+                # Index source and target users/groups once, before any data model needs them
+                self.logger.debug("Fetching users and groups from source system")
+                source_index = self.source_client.directory.get_index()
+                if source_index is None:
+                    self.logger.error("Failed to retrieve user or group IDs from the source environment.")
+                    source_index = PrincipalIndex()
+
+                self.logger.debug("Fetching users and groups from target system")
+                target_index = self.target_client.directory.get_index()
+                if target_index is None:
+                    self.logger.error("Failed to retrieve user or group IDs from the target environment.")
+                    target_index = PrincipalIndex()
+
+                # Map source IDs to target IDs by email (users) and name (groups)
+                user_mapping, group_mapping = source_index.map_to(target_index, excluded_groups={"Everyone", "All users in system"})
+
+            def migrate_one(data_model):
+                error_message = self._import_datamodel(data_model, provider_connection_map, action, new_title)
+                share_result = None
+                if error_message is None and shares:
+                    share_result = self._migrate_datamodel_shares(data_model, user_mapping, group_mapping)
+                return error_message, share_result
+
+            if max_workers == 1:
+                results = [migrate_one(data_model) for data_model in all_datamodel_data]
+            else:
+                results = [None] * len(all_datamodel_data)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {run_in_context(executor, migrate_one, data_model): index
+                               for index, data_model in enumerate(all_datamodel_data)}
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        try:
+                            results[index] = future.result()
+                        except Exception as e:
+                            reason = f"Exception occurred: {str(e)}"
+                            self.logger.error(f"Exception while migrating data model '{all_datamodel_data[index].get('title')}': {reason}")
+                            results[index] = (reason, None)
+
+            # Record the results in the order the data models were requested, whatever order they completed in
+            for data_model, (error_message, share_result) in zip(all_datamodel_data, results):
+                title = data_model.get('title')
+                if error_message is not None:
+                    migration_summary['failed'].append(title)
+                    migration_summary['failure_reasons'][title] = error_message
                     fail_count += 1
+                    continue
+
+                migration_summary['succeeded'].append(title)
+                success_count += 1
+                if share_result == 'fetch_failed':
+                    migration_summary['failed'].append(title)
+                elif share_result == 'failed':
+                    migration_summary['share_fail_count'] += 1
+                elif share_result:
+                    migration_summary['share_success_count'] += share_result
+                    migration_summary['share_details'][title] = share_result
         else:
             self.logger.warning("No data models were successfully retrieved for migration.")
             return migration_summary
@@ -1340,130 +1677,6 @@ class Migration:
         # Final logging for data model migration success and failure counts
         self.logger.info(f"Data model migration completed. Success: {success_count}, Failed: {fail_count}")
 
-        # Handle shares if the flag is set
-        if shares:
-            self.logger.info("Processing shares for the migrated datamodels.")
-
-            # Fetch source and target users/groups
-            self.logger.debug("Fetching userIds from source system")
-            source_user_ids = self.source_client.get("/api/v1/users")
-            if source_user_ids.status_code == 200:
-                source_user_ids = {user["email"]: user["_id"] for user in source_user_ids.json()}
-            else:
-                self.logger.error("Failed to retrieve user IDs from the source environment.")
-                source_user_ids = {}
-
-            self.logger.debug("Fetching userIds from target system")
-            target_user_ids = self.target_client.get("/api/v1/users")
-            if target_user_ids.status_code == 200:
-                target_user_ids = {user["email"]: user["_id"] for user in target_user_ids.json()}
-            else:
-                self.logger.error("Failed to retrieve user IDs from the target environment.")
-                target_user_ids = {}
-
-            user_mapping = {source_user_ids[key]: target_user_ids.get(key, None) for key in source_user_ids}
-
-            self.logger.debug("Fetching groups from source system")
-            source_group_ids = self.source_client.get("/api/v1/groups")
-            if source_group_ids.status_code == 200:
-                source_group_ids = {group["name"]: group["_id"] for group in source_group_ids.json() if group["name"] not in ["Everyone", "All users in system"]}
-            else:
-                self.logger.error("Failed to retrieve group IDs from the source environment.")
-                source_group_ids = {}
-
-            self.logger.debug("Fetching groups from target system")
-            target_group_ids = self.target_client.get("/api/v1/groups")
-            if target_group_ids.status_code == 200:
-                target_group_ids = {group["name"]: group["_id"] for group in target_group_ids.json() if group["name"] not in ["Everyone", "All users in system"]}
-            else:
-                self.logger.error("Failed to retrieve group IDs from the target environment.")
-                target_group_ids = {}
-
-            group_mapping = {source_group_ids[key]: target_group_ids.get(key, None) for key in source_group_ids}
-
-            # Proceed with share logic for successfully migrated datamodels
-            share_success_count = 0
-            share_fail_count = 0
-            if successfully_migrated_datamodels:
-                for datamodel in successfully_migrated_datamodels:
-                    datamodel_id = datamodel['oid']
-                    if datamodel["type"] == "extract":
-                        datamodel_shares_response = self.source_client.get(f"/api/elasticubes/localhost/{datamodel['title']}/permissions")
-                        datamodel_shares = datamodel_shares_response.json().get("shares", []) if datamodel_shares_response.status_code == 200 else []
-                    elif datamodel["type"] == "live":
-                        datamodel_shares_response = self.source_client.get(f"/api/v1/elasticubes/live/{datamodel_id}/permissions")
-                        datamodel_shares = datamodel_shares_response.json() if datamodel_shares_response.status_code == 200 else []
-                    else:
-                        self.logger.warning(f"Unknown datamodel type for: {datamodel['title']}")
-                        continue
-                    # Handle failed response
-                    if datamodel_shares_response.status_code != 200:
-                        self.logger.error(f"Failed to fetch shares for datamodel: '{datamodel['title']}' (ID: {datamodel['oid']}). "
-                                        f"Error: {datamodel_shares_response.json()}")
-                        share_fail_count += 1
-                        migration_summary['failed'].append(datamodel['title'])
-                        continue
-
-                    # Process the shares if they exist
-                    if datamodel_shares:
-                        new_shares = []
-                        for share in datamodel_shares:
-                            if share["type"] == "user":
-                                new_share_user_id = user_mapping.get(share["partyId"], None)
-                                if new_share_user_id:
-                                    new_shares.append({
-                                        "partyId": new_share_user_id,
-                                        "type": "user",
-                                        "permission": share.get("permission", "a"),
-                                    })
-                            elif share["type"] == "group":
-                                new_share_group_id = group_mapping.get(share["partyId"], None)
-                                if new_share_group_id:
-                                    new_shares.append({
-                                        "partyId": new_share_group_id,
-                                        "type": "group",
-                                        "permission": share.get("permission", "a"),
-                                    })
-                        # Post the new shares to the target datamodel
-                        share_count = len(new_shares)
-                        if share_count > 0:
-                            if datamodel["type"] == "extract":
-                                response = self.target_client.put(
-                                    f"/api/elasticubes/localhost/{datamodel['title']}/permissions",
-                                    data=new_shares
-                                )
-                            elif datamodel["type"] == "live":
-                                self.logger.info(f"Publishing datamodel '{datamodel['title']}' to update shares.")
-                                publish_response = self.target_client.post(
-                                    f"/api/v2/builds",
-                                    data={"datamodelId": datamodel_id, "buildType": "publish"}
-                                )
-                                if publish_response.status_code == 201:
-                                    self.logger.info(f"Datamodel '{datamodel['title']}' published successfully. Now updating shares.")
-                                    response = self.target_client.patch(
-                                        f"/api/v1/elasticubes/live/{datamodel_id}/permissions",
-                                        data=new_shares
-                                    )
-                                else:
-                                    self.logger.error(
-                                        f"Failed to publish datamodel '{datamodel['title']}'. "
-                                        f"Error: {publish_response.json() if publish_response else 'No response received.'}"
-                                    )
-                                    response = None
-
-                            if response and response.status_code in [200, 201]:
-                                self.logger.info(f"Datamodel '{datamodel['title']}' shares migrated successfully.")
-                                migration_summary['share_success_count'] += share_count
-                                migration_summary['share_details'][datamodel['title']] = share_count
-                            else:
-                                self.logger.error(
-                                    f"Failed to migrate shares for datamodel: {datamodel['title']}. "
-                                    f"Error: {response.json() if response else 'No response received.'}"
-                                )
-                                migration_summary['share_fail_count'] += 1
-                        else:
-                            self.logger.warning(f"No valid shares found for datamodel: {datamodel['title']}.")
-
         # Final log for the entire migration process
         self.logger.info("Finished data model migration.")
         self.logger.info(migration_summary)
@@ -1479,7 +1692,183 @@ class Migration:
             "details": migration_summary
         }
 
-    def migrate_all_datamodels(self, dependencies=None, shares=False, batch_size=10, sleep_time=5, action=None):
+
+    def _import_datamodel(self, data_model, provider_connection_map=None, action=None, new_title=None):
+        """
+        Imports one exported data model into the target environment.
+
+        Parameters:
+            data_model (dict): The data model as returned by /api/v2/datamodel-exports/schema. Its connections are
+                               rewritten in place.
+            provider_connection_map (dict, optional): Provider name to target connection ID.
+            action (str, optional): "overwrite" or "duplicate", as in migrate_datamodels().
+            new_title (str, optional): Title of the duplicated data model.
+
+        Returns:
+            str or None: None if the data model was imported, otherwise the reason of the failure.
+        """
+        for dataset in data_model.get("datasets", []):
+            connection = dataset.get("connection")
+
+            if connection and isinstance(connection, dict):
+                provider = connection.get("provider")
+
+                if provider_connection_map and provider in provider_connection_map:
+                    dataset["connection"] = {
+                        "oid": provider_connection_map[provider],
+                        "provider": provider
+                    }
+                else:
+                    # fallback to cleaning parameters if no override
+                    if "parameters" in connection:
+                        connection["parameters"] = ""
+
+        self.logger.debug("Data model after processing connections: %s", LogPayload(data_model))
+        datasets_log = data_model.get("datasets", [])
+        if datasets_log:
+            self.logger.debug("Connection object: %s", datasets_log[0].get('connection', {}))
+        else:
+            self.logger.warning(f"No datasets found in data model: {data_model.get('title', 'Unknown Title')}")
+
+        # Prepare request URL based on action (overwrite or duplicate)
+        import_url = "/api/v2/datamodel-imports/schema"
+        query_string = ""
+        if action == "overwrite":
+            query_string = f"?datamodelId={data_model.get('oid')}"
+        elif action == "duplicate":
+            new_model_title = new_title or f"{data_model.get('title', 'Untitled')} (Duplicate)"
+            query_string = f"?newTitle={new_model_title}"
+
+        try:
+            response = self.target_client.post(f"{import_url}{query_string}", data=data_model)
+            if response.status_code == 201:
+                self.logger.info(f"Successfully migrated data model: {data_model['title']}")
+                return None
+            if response.status_code == 404 and action == "overwrite":
+                fallback_reason = (
+                    f"Data model '{data_model['title']}' not found in target for overwrite. "
+                    f"Retrying without overwrite option."
+                )
+                self.logger.warning(fallback_reason)
+
+                # Retry without query param
+                fallback_response = self.target_client.post(import_url, data=data_model)
+                if fallback_response.status_code == 201:
+                    self.logger.info(f"Successfully migrated data model without overwrite: {data_model['title']}")
+                    return None
+                if fallback_response.status_code == 400 and fallback_response.json().get("title") == "ElasticubeAlreadyExists":
+                    final_reason = (
+                        f"Datamodel '{data_model['title']}' already exists on the target with a different ID. "
+                        f"Consider using action='duplicate' with a new title, or delete the existing model manually."
+                    )
+                    self.logger.error(final_reason)
+                    return final_reason
+                error_message = fallback_response.json().get("detail", "Unknown error")
+                self.logger.error(f"Fallback failed to migrate data model: {data_model['title']}. Error: {error_message}")
+                return error_message
+
+            error_message = response.json().get("detail", "Unknown error")
+            self.logger.error(f"Failed to migrate data model: {data_model['title']}. Error: {error_message}")
+            return error_message
+        except Exception as e:
+            reason = f"Exception occurred: {str(e)}"
+            self.logger.error(f"Exception while migrating data model '{data_model['title']}': {reason}")
+            return reason
+
+
+    def _migrate_datamodel_shares(self, datamodel, user_mapping, group_mapping):
+        """
+        Copies the shares of one migrated data model from the source to the target environment.
+        Live data models are published first, as their permissions can only be set once published.
+
+        Parameters:
+            datamodel (dict): The exported data model.
+            user_mapping (dict): Source user ID to target user ID.
+            group_mapping (dict): Source group ID to target group ID.
+
+        Returns:
+            int, str or None: The number of shares migrated, 'failed' if they could not be applied,
+                              'fetch_failed' if the source shares could not be read, or None if there was nothing to migrate.
+        """
+        datamodel_id = datamodel['oid']
+        if datamodel["type"] == "extract":
+            datamodel_shares_response = self.source_client.get(f"/api/elasticubes/localhost/{datamodel['title']}/permissions")
+            datamodel_shares = datamodel_shares_response.json().get("shares", []) if datamodel_shares_response.status_code == 200 else []
+        elif datamodel["type"] == "live":
+            datamodel_shares_response = self.source_client.get(f"/api/v1/elasticubes/live/{datamodel_id}/permissions")
+            datamodel_shares = datamodel_shares_response.json() if datamodel_shares_response.status_code == 200 else []
+        else:
+            self.logger.warning(f"Unknown datamodel type for: {datamodel['title']}")
+            return None
+        # Handle failed response
+        if datamodel_shares_response.status_code != 200:
+            self.logger.error(f"Failed to fetch shares for datamodel: '{datamodel['title']}' (ID: {datamodel['oid']}). "
+                              f"Error: {datamodel_shares_response.json()}")
+            return 'fetch_failed'
+
+        if not datamodel_shares:
+            return None
+
+        new_shares = []
+        for share in datamodel_shares:
+            if share["type"] == "user":
+                new_share_user_id = user_mapping.get(share["partyId"], None)
+                if new_share_user_id:
+                    new_shares.append({
+                        "partyId": new_share_user_id,
+                        "type": "user",
+                        "permission": share.get("permission", "a"),
+                    })
+            elif share["type"] == "group":
+                new_share_group_id = group_mapping.get(share["partyId"], None)
+                if new_share_group_id:
+                    new_shares.append({
+                        "partyId": new_share_group_id,
+                        "type": "group",
+                        "permission": share.get("permission", "a"),
+                    })
+
+        # Post the new shares to the target datamodel
+        share_count = len(new_shares)
+        if share_count == 0:
+            self.logger.warning(f"No valid shares found for datamodel: {datamodel['title']}.")
+            return None
+
+        if datamodel["type"] == "extract":
+            response = self.target_client.put(
+                f"/api/elasticubes/localhost/{datamodel['title']}/permissions",
+                data=new_shares
+            )
+        else:
+            self.logger.info(f"Publishing datamodel '{datamodel['title']}' to update shares.")
+            publish_response = self.target_client.post(
+                f"/api/v2/builds",
+                data={"datamodelId": datamodel_id, "buildType": "publish"}
+            )
+            if publish_response.status_code == 201:
+                self.logger.info(f"Datamodel '{datamodel['title']}' published successfully. Now updating shares.")
+                response = self.target_client.patch(
+                    f"/api/v1/elasticubes/live/{datamodel_id}/permissions",
+                    data=new_shares
+                )
+            else:
+                self.logger.error(
+                    f"Failed to publish datamodel '{datamodel['title']}'. "
+                    f"Error: {publish_response.json() if publish_response else 'No response received.'}"
+                )
+                response = None
+
+        if response and response.status_code in [200, 201]:
+            self.logger.info(f"Datamodel '{datamodel['title']}' shares migrated successfully.")
+            return share_count
+        self.logger.error(
+            f"Failed to migrate shares for datamodel: {datamodel['title']}. "
+            f"Error: {response.json() if response else 'No response received.'}"
+        )
+        return 'failed'
+
+
+    def migrate_all_datamodels(self, dependencies=None, shares=False, batch_size=10, sleep_time=0, action=None, max_workers=1):
         """
         Migrates all data models from the source environment to the target environment in batches.
 
@@ -1493,16 +1882,20 @@ class Migration:
                                         If left blank or set to "all", all dependencies are included by default.
             shares (bool, optional): Whether to also migrate the data model's shares. Default is False.
             batch_size (int, optional): Number of data models to migrate in each batch. Default is 10.
-            sleep_time (int, optional): Time in seconds to wait between processing batches. Default is 5 seconds.
+            sleep_time (int, optional): Time in seconds to wait between processing batches. Default is 0.
+                                        Throttling and transient errors are retried with backoff by the APIClient, so no pause is needed by default.
             action (str, optional): Strategy to handle existing data models in the target environment.
                 - "overwrite": Attempts to overwrite an existing model using its original ID via the datamodelId parameter. If the model is not found in the target environment, it will automatically fall back and create the model.
                 - "duplicate": Creates a new model by appending " (Duplicate)" to the original name.
+            max_workers (int, optional): Number of data models of a batch migrated at the same time. Default is 1.
+                                         With several workers, a batch_size of at least max_workers keeps every worker busy.
 
         Returns:
             dict: A summary of the migration results with lists of succeeded, skipped, and failed data models.
         """
         self.logger.info("Starting migration of all data models from source to target.")
-        self.logger.debug(f"Input Parameters: dependencies={dependencies}, shares={shares}, batch_size={batch_size}, sleep_time={sleep_time}")
+        self.logger.debug("Input Parameters: dependencies=%s, shares=%s, batch_size=%s, sleep_time=%s, max_workers=%s",
+                          dependencies, LogPayload(shares), batch_size, sleep_time, max_workers)
 
         # Fetch all data models
         response = self.source_client.get("/api/v2/datamodels/schema", params={"fields": "oid,title"})
@@ -1526,7 +1919,8 @@ class Migration:
                     datamodel_ids=batch_ids,
                     dependencies=dependencies,
                     shares=shares,
-                    action=action
+                    action=action,
+                    max_workers=max_workers
                 )
                 self.logger.info(f"Batch {batch_number} migration summary: {batch_result}")
 
@@ -1539,7 +1933,7 @@ class Migration:
                 self.logger.error(f"Error occurred in batch {batch_number}: {e}")
                 continue  # Continue with the next batch even if an error occurs
 
-            if i + batch_size < len(all_datamodel_ids):  # Avoid sleeping after the last batch
+            if sleep_time and i + batch_size < len(all_datamodel_ids):  # Avoid sleeping after the last batch
                 self.logger.info(f"Sleeping for {sleep_time} seconds before processing the next batch.")
                 time.sleep(sleep_time)
 
@@ -0,0 +1,305 @@
+import contextvars
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from .metrics import endpoint_template
+
+
+# Profiler collecting spans in the current context, or None when profiling is off
+_active_profiler = contextvars.ContextVar('pysisense_profiler', default=None)
+
+# Names of the spans enclosing the current point of execution, outermost first
+_span_stack = contextvars.ContextVar('pysisense_span_stack', default=())
+
+
+class Profiler:
+
+    def __init__(self):
+        """
+        Initializes a profiler that records nested timing spans of SDK methods and the API requests they make.
+
+        Use it as a context manager around the code to profile. Every public method of AccessManagement,
+        Dashboard, DataModel and Migration, and every API request, becomes a span nested under its caller.
+        Requests sent concurrently (map_concurrent, page prefetching) are attributed to the calling method,
+        so the children of a span can add up to more than its wall time.
+        """
+        self._lock = threading.Lock()
+        self._totals = {}
+        self._counts = {}
+        self._token = None
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+    def start(self):
+        """
+        Starts recording spans in the current context (and in worker threads started from it by the SDK).
+
+        Returns:
+            Profiler: This profiler.
+        """
+        self._token = _active_profiler.set(self)
+        return self
+
+
+    def stop(self):
+        """
+        Stops recording spans.
+        """
+        if self._token is not None:
+            _active_profiler.reset(self._token)
+            self._token = None
+
+
+    def reset(self):
+        """
+        Drops all recorded spans.
+        """
+        with self._lock:
+            self._totals.clear()
+            self._counts.clear()
+
+
+    def _record(self, stack, duration):
+        with self._lock:
+            self._totals[stack] = self._totals.get(stack, 0.0) + duration
+            self._counts[stack] = self._counts.get(stack, 0) + 1
+
+
+    def _snapshot(self):
+        """
+        Returns the recorded spans with their self time.
+
+        Returns:
+            list: Tuples (stack, calls, total seconds, self seconds), in stack order.
+        """
+        with self._lock:
+            totals = dict(self._totals)
+            counts = dict(self._counts)
+
+        children_totals = {}
+        for stack, total in totals.items():
+            if len(stack) > 1:
+                children_totals[stack[:-1]] = children_totals.get(stack[:-1], 0.0) + total
+
+        # Concurrent children can exceed the parent's wall time; self time never goes negative
+        return [(stack, counts[stack], totals[stack], max(0.0, totals[stack] - children_totals.get(stack, 0.0)))
+                for stack in sorted(totals)]
+
+
+    def summary(self):
+        """
+        Returns one row per distinct call path, with its share of the time of its root span.
+
+        Returns:
+            list: A list of dictionaries with the keys 'span' (call path joined by ' > '), 'depth',
+                  'calls', 'total_s', 'self_s' and 'pct_of_root'.
+        """
+        snapshot = self._snapshot()
+        root_totals = {stack[0]: total for stack, _, total, _ in snapshot if len(stack) == 1}
+        return [{
+            'span': ' > '.join(stack),
+            'depth': len(stack) - 1,
+            'calls': calls,
+            'total_s': round(total, 6),
+            'self_s': round(self_time, 6),
+            'pct_of_root': round(100 * total / root_totals[stack[0]], 1) if root_totals.get(stack[0]) else None
+        } for stack, calls, total, self_time in snapshot]
+
+
+    def tree(self):
+        """
+        Renders the call tree as indented text, e.g.
+
+            100.0%   4.210s      1x  AccessManagement.get_unused_columns
+             92.3%   3.886s    340x    GET /api/dashboards/{id}/export
+
+        Returns:
+            str: The call tree, one span per line.
+        """
+        lines = []
+        for row in self.summary():
+            pct = f"{row['pct_of_root']:5.1f}%" if row['pct_of_root'] is not None else "     -"
+            name = row['span'].rsplit(' > ', 1)[-1]
+            lines.append(f"{pct} {row['total_s']:8.3f}s {row['calls']:6d}x  {'  ' * row['depth']}{name}")
+        return "\n".join(lines)
+
+
+    def folded(self):
+        """
+        Renders the spans as folded stacks ("a;b;c <self microseconds>"), the input format of
+        flamegraph.pl, inferno and speedscope.
+
+        Returns:
+            str: One line per call path.
+        """
+        return "\n".join(f"{';'.join(stack)} {int(self_time * 1e6)}"
+                         for stack, _, _, self_time in self._snapshot() if self_time > 0) + "\n"
+
+
+    def speedscope(self, name="pysisense"):
+        """
+        Renders the spans as a speedscope profile (https://www.speedscope.app), weighted by self time.
+
+        Parameters:
+            name (str, optional): Name of the profile. Default: "pysisense".
+
+        Returns:
+            dict: The speedscope JSON document.
+        """
+        frames = []
+        frame_index = {}
+        samples = []
+        weights = []
+        for stack, _, _, self_time in self._snapshot():
+            if self_time <= 0:
+                continue
+            sample = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({'name': frame})
+                sample.append(frame_index[frame])
+            samples.append(sample)
+            weights.append(self_time)
+
+        return {
+            '$schema': "https://www.speedscope.app/file-format-schema.json",
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': "sampled",
+                'name': name,
+                'unit': "seconds",
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights
+            }],
+            'name': name,
+            'exporter': "pysisense"
+        }
+
+
+    def write_folded(self, path):
+        """
+        Writes folded stacks to a file, see folded().
+
+        Parameters:
+            path (str): Output path.
+        """
+        with open(path, 'w') as file:
+            file.write(self.folded())
+
+
+    def write_speedscope(self, path, name="pysisense"):
+        """
+        Writes a speedscope profile to a file, see speedscope().
+
+        Parameters:
+            path (str): Output path, e.g. 'migration.speedscope.json'.
+            name (str, optional): Name of the profile. Default: "pysisense".
+        """
+        with open(path, 'w') as file:
+            json.dump(self.speedscope(name), file)
+
+
+@contextmanager
+def span(name):
+    """
+    Times a block as a span nested under the enclosing span. Does nothing unless a Profiler is active.
+
+    Parameters:
+        name (str): Name of the span, e.g. 'DataModel.get_row_count'.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield
+        return
+
+    stack = _span_stack.get() + (name,)
+    token = _span_stack.set(stack)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler._record(stack, time.perf_counter() - start)
+        _span_stack.reset(token)
+
+
+def request_span(method, endpoint):
+    """
+    Returns a span for an API request, named after its endpoint template.
+
+    Parameters:
+        method (str): The HTTP method.
+        endpoint (str): The API endpoint.
+
+    Returns:
+        contextmanager: The span, or a no-op if no Profiler is active.
+    """
+    if _active_profiler.get() is None:
+        return span(None)
+    return span(f"{method} {endpoint_template(endpoint)}")
+
+
+def profiled(name):
+    """
+    Decorator that runs a function inside a span.
+
+    Parameters:
+        name (str): Name of the span.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_profiler.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profile_public_methods(cls):
+    """
+    Class decorator that wraps every public method of a class in a span named 'Class.method'.
+
+    Parameters:
+        cls (type): The class to instrument.
+
+    Returns:
+        type: The same class.
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if not attr_name.startswith('_') and callable(attr):
+            setattr(cls, attr_name, profiled(f"{cls.__name__}.{attr_name}")(attr))
+    return cls
+
+
+def run_in_context(executor, func, *args):
+    """
+    Submits a function to an executor so it runs in a copy of the caller's context,
+    keeping the active profiler and span nesting in worker threads.
+
+    Parameters:
+        executor (concurrent.futures.Executor): The executor.
+        func (callable): The function to run.
+        *args: Arguments of the function.
+
+    Returns:
+        concurrent.futures.Future: The submitted task.
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args)
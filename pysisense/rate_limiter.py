@@ -0,0 +1,227 @@
+import threading
+import time
+from fnmatch import fnmatch
+
+
+# Default rate limiter settings, overridable through the 'rate_limit' section of the YAML config
+DEFAULT_RATE_LIMIT_CONFIG = {
+    'enabled': False,           # Opt-in: without a rate_limit section requests are not throttled
+    'default_rate': 20,         # Starting rate (requests/second) for endpoints without an explicit budget
+    'min_rate': 0.5,            # Lowest rate the limiter can back off to
+    'max_rate': 100,            # Highest rate the limiter can grow to
+    'increase_step': 1.0,       # Additive increase (requests/second) per second of error-free traffic
+    'decrease_factor': 0.5,     # Multiplicative decrease applied when the server signals overload
+    'throttle_statuses': [429, 502, 503, 504],  # Statuses that signal overload; other errors leave the rate unchanged
+    'decrease_interval': 1.0,   # Seconds after a decrease during which further overload signals are ignored
+    'endpoints': {}             # Per-endpoint-class starting rates, e.g. {"/api/v1/dashboards/export": 5}
+}
+
+# Limiters shared by every APIClient talking to the same Sisense base URL
+_shared_limiters = {}
+_shared_limiters_lock = threading.Lock()
+
+
+class TokenBucket:
+
+    def __init__(self, rate):
+        """
+        Initializes a token bucket that refills at the given rate.
+
+        Parameters:
+            rate (float): Number of tokens (requests) added per second. The bucket holds at most one second of tokens.
+        """
+        self.rate = float(rate)
+        self._tokens = max(1.0, self.rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def _refill(self, now):
+        capacity = max(1.0, self.rate)
+        self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+
+    def reserve(self):
+        """
+        Takes one token from the bucket without blocking.
+
+        The token is reserved immediately so concurrent callers queue up behind each other;
+        the caller is responsible for waiting the returned delay before sending its request.
+
+        Returns:
+            float: Time in seconds the caller must wait before the token becomes valid.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+    def acquire(self):
+        """
+        Takes one token from the bucket, blocking until it is available.
+
+        Returns:
+            float: Time in seconds the caller waited.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+    def set_rate(self, rate):
+        """
+        Changes the refill rate of the bucket.
+
+        Parameters:
+            rate (float): New number of tokens added per second.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+
+class AdaptiveRateLimiter:
+
+    def __init__(self, config=None):
+        """
+        Initializes a client-side rate limiter with one token bucket per endpoint class.
+
+        Each bucket adapts its rate AIMD-style: it grows additively while requests succeed and is
+        cut multiplicatively when the server signals overload (429, 502, 503 or 504 by default).
+        The cut is applied at most once per decrease_interval, so a burst of concurrent requests
+        rejected together counts as one congestion event rather than one per request.
+
+        Parameters:
+            config (dict, optional): Rate limit settings. Missing keys fall back to DEFAULT_RATE_LIMIT_CONFIG.
+        """
+        self.config = {**DEFAULT_RATE_LIMIT_CONFIG, **(config or {})}
+        self.endpoint_rates = dict(self.config.get('endpoints') or {})
+        self.throttle_statuses = frozenset(self.config['throttle_statuses'])
+        self._buckets = {}
+        self._last_decrease = {}
+        self._lock = threading.Lock()
+
+
+    def endpoint_class(self, endpoint):
+        """
+        Resolves the endpoint class (budget) a request belongs to.
+
+        Configured endpoint keys match either as a path prefix or as a glob pattern
+        (e.g. "/api/dashboards/*/export"). The longest matching key wins.
+
+        Parameters:
+            endpoint (str): The API endpoint (relative to the base URL), optionally with a query string.
+
+        Returns:
+            str: The matching endpoint key, or 'default' if none matches.
+        """
+        path = endpoint.split('?')[0]
+        matches = [
+            key for key in self.endpoint_rates
+            if (fnmatch(path, key) if '*' in key else path.startswith(key))
+        ]
+        return max(matches, key=len) if matches else 'default'
+
+
+    def _get_bucket(self, endpoint_class):
+        with self._lock:
+            bucket = self._buckets.get(endpoint_class)
+            if bucket is None:
+                rate = self.endpoint_rates.get(endpoint_class, self.config['default_rate'])
+                bucket = TokenBucket(rate)
+                self._buckets[endpoint_class] = bucket
+            return bucket
+
+
+    def reserve(self, endpoint):
+        """
+        Reserves a request slot in the budget of the endpoint's class without blocking.
+        Used by asynchronous clients, which wait the returned delay on the event loop.
+
+        Parameters:
+            endpoint (str): The API endpoint (relative to the base URL).
+
+        Returns:
+            float: Time in seconds to wait before sending the request.
+        """
+        return self._get_bucket(self.endpoint_class(endpoint)).reserve()
+
+
+    def acquire(self, endpoint):
+        """
+        Blocks until the budget of the endpoint's class allows another request.
+
+        Parameters:
+            endpoint (str): The API endpoint (relative to the base URL).
+
+        Returns:
+            float: Time in seconds the caller waited.
+        """
+        return self._get_bucket(self.endpoint_class(endpoint)).acquire()
+
+
+    def record(self, endpoint, status_code=None):
+        """
+        Feeds the outcome of a request back into the limiter.
+
+        Parameters:
+            endpoint (str): The API endpoint (relative to the base URL).
+            status_code (int, optional): Status code of the response, or None if the request failed without a response.
+                                         Failures without a response and application errors leave the rate unchanged.
+        """
+        endpoint_class = self.endpoint_class(endpoint)
+        bucket = self._get_bucket(endpoint_class)
+
+        if status_code in self.throttle_statuses:
+            now = time.monotonic()
+            with self._lock:
+                # Requests sent before the last decrease report the same congestion again: count it once
+                if now - self._last_decrease.get(endpoint_class, float('-inf')) < self.config['decrease_interval']:
+                    return
+                self._last_decrease[endpoint_class] = now
+            new_rate = max(self.config['min_rate'], bucket.rate * self.config['decrease_factor'])
+        elif status_code is None or status_code >= 400:
+            return
+        else:
+            # Dividing by the current rate grows the budget by roughly 'increase_step' per second of traffic
+            new_rate = min(self.config['max_rate'], bucket.rate + self.config['increase_step'] / bucket.rate)
+
+        if new_rate != bucket.rate:
+            bucket.set_rate(new_rate)
+
+
+    def get_rates(self):
+        """
+        Returns the current rate of every endpoint class that has seen traffic.
+
+        Returns:
+            dict: Mapping of endpoint class to its current rate in requests per second.
+        """
+        with self._lock:
+            return {endpoint_class: round(bucket.rate, 3) for endpoint_class, bucket in self._buckets.items()}
+
+
+def get_shared_rate_limiter(key, config=None):
+    """
+    Returns the rate limiter shared by all API clients for the given key, creating it on first use.
+
+    Parameters:
+        key (str): Identifier of the target server, typically the client's base URL.
+        config (dict, optional): Rate limit settings used when the limiter is created.
+
+    Returns:
+        AdaptiveRateLimiter or None: The shared limiter, or None if rate limiting is disabled.
+    """
+    config = {**DEFAULT_RATE_LIMIT_CONFIG, **(config or {})}
+    if not config['enabled']:
+        return None
+
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(config)
+            _shared_limiters[key] = limiter
+        return limiter
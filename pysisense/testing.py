@@ -0,0 +1,625 @@
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import yaml
+
+
+# Smallest response body the mock compresses when the client accepts gzip
+MIN_COMPRESSED_RESPONSE_BYTES = 1024
+
+# Role names as returned by /api/roles
+MOCK_ROLES = ['super', 'admin', 'contributor', 'consumer', 'dataDesigner']
+
+
+class MockSisense:
+
+    def __init__(self, users=1000, groups=50, dashboards=500, datamodels=10, tables_per_datamodel=5,
+                 columns_per_table=10, rows_per_table=1000, latency=0.0, error_rate=0.0, error_status=503,
+                 seed=0, host="127.0.0.1", port=0, compression=True, etags=True, max_import_bytes=None):
+        """
+        Initializes a local stand-in for a Sisense server, serving synthetic data over HTTP.
+
+        The server implements the endpoints used by the SDK (users, groups, roles, folders,
+        dashboards, shares, datamodels, exports/imports, builds and SQL queries) so the SDK can be
+        benchmarked and load-tested offline. Data is generated once from the seed, so runs are reproducible.
+        Write requests are acknowledged with a realistic response but do not modify the data.
+
+        Parameters:
+            users (int): Number of users. Default: 1000.
+            groups (int): Number of groups. Default: 50.
+            dashboards (int): Number of dashboards. Default: 500.
+            datamodels (int): Number of datamodels. Default: 10.
+            tables_per_datamodel (int): Number of tables in each datamodel. Default: 5.
+            columns_per_table (int): Number of columns in each table. Default: 10.
+            rows_per_table (int): Number of rows reported by SQL queries on each table. Default: 1000.
+            latency (float or tuple): Seconds added to every response, or a (min, max) range to draw from. Default: 0.
+            error_rate (float): Fraction of requests (0-1) answered with error_status instead. Default: 0.
+            error_status (int): Status code of injected errors. Default: 503.
+            seed (int): Seed of the data and error generators. Default: 0.
+            host (str): Interface to listen on. Default: "127.0.0.1".
+            port (int): Port to listen on. Default: 0 (any free port).
+            compression (bool): Gzip responses for clients that accept it, and accept gzip request bodies.
+                If False, responses are sent uncompressed and gzip request bodies are rejected with 415. Default: True.
+            etags (bool): Send an ETag with GET responses and answer matching If-None-Match requests with 304. Default: True.
+            max_import_bytes (int, optional): Reject dashboard bulk imports whose JSON payload is larger with 413. Default: no limit.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.rows_per_table = rows_per_table
+        self.compression = compression
+        self.etags = etags
+        self.max_import_bytes = max_import_bytes
+
+        self.request_counts = Counter()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._response_cache = {}
+        # OIDs of the dashboards imported through the bulk import endpoint
+        self.imported_dashboards = set()
+        self._server = None
+        self._thread = None
+
+        self._generate_data(random.Random(seed), users, groups, dashboards, datamodels,
+                            tables_per_datamodel, columns_per_table)
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+
+    def start(self):
+        """
+        Starts serving in a background thread.
+
+        Returns:
+            MockSisense: The running server, so it can be used as `server = MockSisense().start()`.
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _MockRequestHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MockSisense", daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self):
+        """
+        Stops the server and waits for the serving thread to exit.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+
+    def write_config(self, path, **overrides):
+        """
+        Writes a YAML config file that points an APIClient at this server.
+
+        Parameters:
+            path (str): Path of the config file to write.
+            **overrides: Additional top-level config sections, e.g. rate_limit={'enabled': False}.
+
+        Returns:
+            str: The path of the written file.
+        """
+        config = {'domain': self.host, 'is_ssl': False, 'port': self.port, 'token': 'mock-token', **overrides}
+        with open(path, 'w') as file:
+            yaml.safe_dump(config, file, sort_keys=False)
+        return path
+
+
+    def reset_stats(self):
+        """
+        Clears the request counters and the number of bytes sent and received.
+        """
+        with self._stats_lock:
+            self.request_counts.clear()
+            self.bytes_sent = 0
+            self.bytes_received = 0
+
+
+    def touch_dashboards(self, oids):
+        """
+        Simulates edits of dashboards: their description and 'lastUpdated' are set to the current time.
+
+        Parameters:
+            oids (iterable): OIDs of the dashboards to change.
+        """
+        now = time.time()
+        updated = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now * 1000) % 1000:03d}Z"
+        for oid in oids:
+            dashboard = self._dashboards_by_id[oid]
+            dashboard['desc'] = f"Edited at {updated}"
+            dashboard['lastUpdated'] = updated
+        # Serialized responses may contain the old versions
+        self._response_cache.clear()
+
+
+    def _generate_data(self, rng, n_users, n_groups, n_dashboards, n_datamodels, n_tables, n_columns):
+        self.roles = [{'_id': _object_id(3, index), 'name': name} for index, name in enumerate(MOCK_ROLES)]
+        self.groups = [{'_id': _object_id(2, index), 'name': f"Group {index}"} for index in range(n_groups)]
+        self.groups.append({'_id': _object_id(2, n_groups), 'name': "Everyone"})
+
+        self.users = []
+        for index in range(n_users):
+            member_of = rng.sample(self.groups[:-1], min(len(self.groups) - 1, rng.randint(0, 3)))
+            self.users.append({
+                '_id': _object_id(1, index),
+                'userName': f"user{index}@example.com",
+                'email': f"user{index}@example.com",
+                'firstName': f"First{index}",
+                'lastName': f"Last{index}",
+                'active': True,
+                'roleId': rng.choice(self.roles)['_id'],
+                'groups': [group['_id'] for group in member_of] + [self.groups[-1]['_id']],
+                'tenantId': "tenant0000"
+            })
+
+        self.folders = [{'oid': _object_id(4, index), 'name': f"Folder {index}", 'owner': self.users[0]['_id'] if self.users else None,
+                         'parentId': None} for index in range(max(1, n_dashboards // 20))]
+
+        self.datamodels = []
+        for index in range(n_datamodels):
+            tables = [{
+                'oid': _uuid(3, index * n_tables + table_index),
+                'name': f"table_{table_index}",
+                'columns': [{'oid': _uuid(4, column_index), 'name': f"column_{column_index}", 'type': 18}
+                            for column_index in range(n_columns)]
+            } for table_index in range(n_tables)]
+            self.datamodels.append({
+                'oid': _uuid(1, index),
+                'title': f"Datamodel {index}",
+                'type': "extract",
+                'lastBuildTime': "2024-01-01T00:00:00.000Z",
+                'lastPublishTime': None,
+                'shares': [],
+                'datasets': [{
+                    'oid': _uuid(2, index),
+                    'name': "main",
+                    'type': "extract",
+                    'connection': {'oid': _uuid(5, 0), 'provider': "PostgreSQL", 'parameters': {}},
+                    'schema': {'tables': tables}
+                }]
+            })
+
+        self.dashboards = []
+        for index in range(n_dashboards):
+            shares = [{'shareId': user['_id'], 'type': "user", 'rule': "view"}
+                      for user in rng.sample(self.users, min(len(self.users), 3))]
+            shares += [{'shareId': group['_id'], 'type': "group", 'rule': "view"}
+                       for group in rng.sample(self.groups, min(len(self.groups), 1))]
+            datamodel = self.datamodels[index % len(self.datamodels)] if self.datamodels else None
+            self.dashboards.append({
+                'oid': _object_id(5, index),
+                'title': f"Dashboard {index}",
+                'owner': shares[0]['shareId'] if shares else None,
+                'parentFolder': self.folders[index % len(self.folders)]['oid'] if index % 2 else None,
+                'datasource': {'title': datamodel['title'], 'live': False} if datamodel else None,
+                'shares': shares,
+                'lastUpdated': f"2024-01-{1 + index % 28:02d}T00:00:00.000Z",
+                'lastOpened': f"2024-02-{1 + index % 28:02d}T00:00:00.000Z",
+                'widgets': [{'oid': _object_id(6, index * 5 + widget), 'type': "indicator", 'title': f"Widget {widget}"}
+                            for widget in range(5)]
+            })
+
+        self._users_by_id = {user['_id']: user for user in self.users}
+        self._groups_by_id = {group['_id']: group for group in self.groups}
+        self._roles_by_id = {role['_id']: role for role in self.roles}
+        self._dashboards_by_id = {dashboard['oid']: dashboard for dashboard in self.dashboards}
+        self._datamodels_by_id = {datamodel['oid']: datamodel for datamodel in self.datamodels}
+        self._datamodels_by_title = {datamodel['title']: datamodel for datamodel in self.datamodels}
+
+
+    def _handle(self, method, url, body):
+        """
+        Routes one request to its endpoint handler.
+
+        Parameters:
+            method (str): The HTTP method.
+            url (str): The request path including the query string.
+            body (bytes): The raw request body.
+
+        Returns:
+            tuple: (status code, JSON-serializable payload or None, cacheable flag).
+        """
+        parts = urlsplit(url)
+        path = unquote(parts.path).rstrip('/') or '/'
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        data = json.loads(body) if body else None
+
+        for route_method, pattern, handler in _ROUTES:
+            if route_method == method:
+                match = pattern.fullmatch(path)
+                if match:
+                    return handler(self, query, data, *match.groups())
+
+        # Unknown writes are acknowledged so SDK workflows can run end to end
+        if method in ('POST', 'PUT', 'PATCH'):
+            return 200, {}, False
+        if method == 'DELETE':
+            return 204, None, False
+        return 404, {'error': {'message': f"Mock endpoint not implemented: {method} {path}"}}, False
+
+
+    def _record(self, method, url, sent, received):
+        # Sizes as transferred, i.e. after compression
+        with self._stats_lock:
+            self.request_counts[f"{method} {unquote(urlsplit(url).path)}"] += 1
+            self.bytes_sent += sent
+            self.bytes_received += received
+
+
+    def _next_fault(self):
+        """
+        Draws the latency and the injected error of the next request.
+
+        Returns:
+            tuple: (delay in seconds, error status code or None).
+        """
+        with self._stats_lock:
+            if isinstance(self.latency, (tuple, list)):
+                delay = self._rng.uniform(*self.latency)
+            else:
+                delay = self.latency
+            failed = self.error_rate and self._rng.random() < self.error_rate
+        return delay, self.error_status if failed else None
+
+
+    # Endpoint handlers: (self, query, data, *path groups) -> (status, payload, cacheable)
+
+    def _get_users(self, query, data):
+        users = self.users
+        if 'email' in query:
+            users = [user for user in users if user['email'] == query['email']]
+        if 'userName' in query:
+            users = [user for user in users if user['userName'] == query['userName']]
+        if 'groupId' in query:
+            users = [user for user in users if query['groupId'] in user['groups']]
+        expand = set(query.get('expand', '').split(','))
+        return 200, _project([self._expand_user(user, expand) for user in users], query.get('fields')), True
+
+
+    def _get_user(self, query, data, user_id):
+        user = self._users_by_id.get(user_id)
+        if user is None:
+            return 404, {'error': {'message': "User not found"}}, False
+        return 200, _project(self._expand_user(user, set(query.get('expand', '').split(','))), query.get('fields')), True
+
+
+    def _expand_user(self, user, expand):
+        if not expand & {'groups', 'role'}:
+            return user
+        user = dict(user)
+        if 'groups' in expand:
+            user['groups'] = [self._groups_by_id[group_id] for group_id in user['groups']]
+        if 'role' in expand:
+            user['role'] = self._roles_by_id[user['roleId']]
+        return user
+
+
+    def _post_users(self, query, data):
+        return 201, {**(data or {}), '_id': _token()}, False
+
+
+    def _post_bulk(self, query, data):
+        return 201, [{**item, '_id': _token()} for item in data or []], False
+
+
+    def _get_groups(self, query, data):
+        groups = self.groups
+        if 'name' in query:
+            groups = [group for group in groups if group['name'] == query['name']]
+        return 200, _project(groups, query.get('fields')), True
+
+
+    def _get_roles(self, query, data):
+        return 200, self.roles, True
+
+
+    def _get_folders(self, query, data):
+        return 200, self.folders, True
+
+
+    def _search_dashboards(self, query, data):
+        options = (data or {}).get('queryOptions', {})
+        skip = int(options.get('skip', 0))
+        limit = int(options.get('limit', 50))
+        items = self.dashboards[skip:skip + limit]
+        return 200, {'items': _project(items, query.get('fields')), 'totalCount': len(self.dashboards)}, False
+
+
+    def _get_dashboards_admin(self, query, data):
+        dashboards = self.dashboards
+        if 'id' in query:
+            dashboards = [d for d in dashboards if d['oid'] == query['id']]
+        if 'name' in query:
+            dashboards = [d for d in dashboards if d['title'] == query['name']]
+        if 'datasourceTitle' in query:
+            dashboards = [d for d in dashboards if d['datasource'] and d['datasource']['title'] == query['datasourceTitle']]
+        return 200, _project(dashboards, query.get('fields')), True
+
+
+    def _export_dashboard(self, query, data, dashboard_id):
+        dashboard = self._dashboards_by_id.get(dashboard_id)
+        if dashboard is None:
+            return 404, {'error': {'message': "Dashboard not found"}}, False
+        return 200, dashboard, True
+
+
+    def _export_dashboards(self, query, data):
+        ids = query.get('dashboardIds', '').split(',')
+        return 200, [self._dashboards_by_id[oid] for oid in ids if oid in self._dashboards_by_id], True
+
+
+    def _import_dashboards(self, query, data):
+        if self.max_import_bytes and len(json.dumps(data)) > self.max_import_bytes:
+            return 413, {'error': {'message': "Payload too large"}}, False
+        # Like the server, a dashboard imported earlier is skipped unless action is overwrite or duplicate
+        action = query.get('action')
+        succeeded, skipped = [], []
+        with self._stats_lock:
+            for dashboard in data or []:
+                oid = dashboard.get('oid') or _token()
+                if action == 'duplicate' and oid in self.imported_dashboards:
+                    oid = _token()
+                elif action != 'overwrite' and oid in self.imported_dashboards:
+                    skipped.append({'oid': oid, 'title': dashboard.get('title')})
+                    continue
+                self.imported_dashboards.add(oid)
+                succeeded.append({'oid': oid, 'title': dashboard.get('title')})
+        return 201, {'succeded': succeeded, 'skipped': skipped, 'failed': {}}, False
+
+
+    def _get_dashboard_shares(self, query, data, dashboard_id):
+        dashboard = self._dashboards_by_id.get(dashboard_id)
+        if dashboard is None:
+            return 404, {'error': {'message': "Dashboard not found"}}, False
+        return 200, {'sharesTo': dashboard['shares']}, True
+
+
+    def _get_datamodels(self, query, data):
+        if 'title' in query:
+            datamodel = self._datamodels_by_title.get(query['title'])
+            return 200, _project(datamodel, query.get('fields')) if datamodel else [], True
+        return 200, _project(self.datamodels, query.get('fields')), True
+
+
+    def _get_datasets(self, query, data, datamodel_id):
+        datamodel = self._datamodels_by_id.get(datamodel_id)
+        if datamodel is None:
+            return 404, {'error': {'message': "Datamodel not found"}}, False
+        return 200, datamodel['datasets'], True
+
+
+    def _get_tables(self, query, data, datamodel_id, dataset_id):
+        datamodel = self._datamodels_by_id.get(datamodel_id)
+        dataset = next((d for d in datamodel['datasets'] if d['oid'] == dataset_id), None) if datamodel else None
+        if dataset is None:
+            return 404, {'error': {'message': "Dataset not found"}}, False
+        return 200, dataset['schema']['tables'], True
+
+
+    def _export_datamodel(self, query, data):
+        datamodel = self._datamodels_by_id.get(query.get('datamodelId'))
+        if datamodel is None:
+            return 404, {'error': {'message': "Datamodel not found"}}, False
+        return 200, datamodel, True
+
+
+    def _import_datamodel(self, query, data):
+        return 201, {'oid': query.get('datamodelId') or _token(),
+                     'title': query.get('newTitle') or (data or {}).get('title')}, False
+
+
+    def _post_build(self, query, data):
+        return 201, {'oid': _token(), 'datamodelId': (data or {}).get('datamodelId'), 'status': "waiting"}, False
+
+
+    def _get_builds(self, query, data):
+        return 200, [], False
+
+
+    def _get_ecm(self, query, data):
+        metadata = [{'oid': dm['oid'], 'title': dm['title'], 'type': dm['type'], 'status': ["ok"], 'sizeInMb': 12.345}
+                    for dm in self.datamodels]
+        return 200, {'data': {'elasticubesMetadata': metadata}}, False
+
+
+    def _run_sql(self, query, data, datamodel_title):
+        sql = query.get('query', '')
+        table_match = re.search(r'FROM\s+"?(\w+)"?', sql, re.IGNORECASE)
+        datamodel = self._datamodels_by_title.get(datamodel_title)
+        table = None
+        if datamodel and table_match:
+            table = next((t for dataset in datamodel['datasets'] for t in dataset['schema']['tables']
+                          if t['name'] == table_match.group(1)), None)
+        if table is None:
+            return 400, {'error': {'message': "Table not found"}}, False
+
+        if re.search(r'COUNT\s*\(', sql, re.IGNORECASE):
+            return 200, {'headers': ["Column"], 'values': [[self.rows_per_table]]}, True
+
+        limit_match = re.search(r'LIMIT\s+(\d+)', sql, re.IGNORECASE)
+        row_count = min(self.rows_per_table, int(limit_match.group(1))) if limit_match else self.rows_per_table
+        headers = [column['name'] for column in table['columns']]
+        values = [[f"{header}_{row}" for header in headers] for row in range(row_count)]
+        return 200, {'headers': headers, 'values': values}, True
+
+
+def _project(items, fields):
+    """
+    Applies a 'fields' projection to one object or a list of objects.
+
+    Parameters:
+        items (dict or list): The objects to project.
+        fields (str or None): Comma-separated field names, or None to keep all fields.
+
+    Returns:
+        dict or list: The projected objects.
+    """
+    if not fields:
+        return items
+    keep = fields.split(',')
+    if isinstance(items, dict):
+        return {key: items[key] for key in keep if key in items}
+    return [{key: item[key] for key in keep if key in item} for item in items]
+
+
+def _object_id(kind, index):
+    # Deterministic 24-hex-digit ID in the format of Sisense (MongoDB) object IDs
+    return f"{kind:08x}{index:016x}"
+
+
+def _uuid(kind, index):
+    # Deterministic ID in the UUID format used for datamodel objects
+    return f"{kind:08x}-0000-4000-8000-{index:012x}"
+
+
+def _token():
+    # Random object ID for objects "created" by write requests
+    return f"{random.getrandbits(96):024x}"
+
+
+_ROUTES = [(method, re.compile(pattern), handler) for method, pattern, handler in [
+    ('GET', r'/api/v1/users', MockSisense._get_users),
+    ('POST', r'/api/v1/users', MockSisense._post_users),
+    ('POST', r'/api/v1/users/bulk', MockSisense._post_bulk),
+    ('GET', r'/api/v1/users/([^/]+)', MockSisense._get_user),
+    ('GET', r'/api/v1/groups', MockSisense._get_groups),
+    ('POST', r'/api/v1/groups/bulk', MockSisense._post_bulk),
+    ('GET', r'/api/roles', MockSisense._get_roles),
+    ('GET', r'/api/v1/folders', MockSisense._get_folders),
+    ('POST', r'/api/v1/dashboards/searches', MockSisense._search_dashboards),
+    ('GET', r'/api/v1/dashboards/admin', MockSisense._get_dashboards_admin),
+    ('GET', r'/api/v1/dashboards/export', MockSisense._export_dashboards),
+    ('POST', r'/api/v1/dashboards/import/bulk', MockSisense._import_dashboards),
+    ('GET', r'/api/dashboards/([^/]+)/export', MockSisense._export_dashboard),
+    ('GET', r'/api/shares/dashboard/([^/]+)', MockSisense._get_dashboard_shares),
+    ('GET', r'/api/v2/datamodels/schema', MockSisense._get_datamodels),
+    ('GET', r'/api/v2/datamodels/([^/]+)/schema/datasets', MockSisense._get_datasets),
+    ('GET', r'/api/v2/datamodels/([^/]+)/schema/datasets/([^/]+)/tables', MockSisense._get_tables),
+    ('GET', r'/api/v2/datamodel-exports/schema', MockSisense._export_datamodel),
+    ('POST', r'/api/v2/datamodel-imports/schema', MockSisense._import_datamodel),
+    ('POST', r'/api/v2/builds', MockSisense._post_build),
+    ('GET', r'/api/v2/builds', MockSisense._get_builds),
+    ('POST', r'/api/v2/ecm', MockSisense._get_ecm),
+    ('GET', r'/api/datasources/([^/]+)/sql', MockSisense._run_sql),
+]]
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+
+    # Keep-alive, so connection pooling on the client side behaves as against a real server
+    protocol_version = "HTTP/1.1"
+
+    # Send headers and body as soon as they are written, avoiding delayed-ACK stalls on small responses
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._serve('GET')
+
+
+    def do_POST(self):
+        self._serve('POST')
+
+
+    def do_PUT(self):
+        self._serve('PUT')
+
+
+    def do_PATCH(self):
+        self._serve('PATCH')
+
+
+    def do_DELETE(self):
+        self._serve('DELETE')
+
+
+    def log_message(self, format, *args):
+        # Silence the default per-request stderr logging
+        pass
+
+
+    def _serve(self, method):
+        mock = self.server.mock
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        received = len(body)
+        body_encoding = self.headers.get('Content-Encoding')
+        accepts_gzip = mock.compression and 'gzip' in (self.headers.get('Accept-Encoding') or '')
+
+        delay, error_status = mock._next_fault()
+        if delay:
+            time.sleep(delay)
+
+        encoding = None
+        etag = None
+        if error_status:
+            status, content = error_status, json.dumps({'error': {'message': "Injected error"}}).encode()
+        elif body_encoding and (body_encoding != 'gzip' or not mock.compression):
+            status, content = 415, json.dumps({'error': {'message': f"Unsupported Content-Encoding: {body_encoding}"}}).encode()
+        else:
+            if body_encoding:
+                body = gzip.decompress(body)
+
+            # Data never changes, so serialized (and compressed) GET responses are reused across requests
+            cache_key = (self.path, accepts_gzip) if method == 'GET' else None
+            cached = mock._response_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                status, (content, encoding, etag) = 200, cached
+            else:
+                status, payload, cacheable = mock._handle(method, self.path, body)
+                content = json.dumps(payload).encode() if payload is not None else b''
+                if method == 'GET' and status == 200 and mock.etags:
+                    # Strong validator of the representation, the same for every content encoding
+                    etag = f'"{hashlib.sha1(content).hexdigest()[:20]}"'
+                if accepts_gzip and len(content) >= MIN_COMPRESSED_RESPONSE_BYTES:
+                    content, encoding = gzip.compress(content, compresslevel=6), 'gzip'
+                if cache_key and cacheable and status == 200:
+                    mock._response_cache[cache_key] = (content, encoding, etag)
+
+            if etag and self.headers.get('If-None-Match') == etag:
+                status, content, encoding = 304, b'', None
+
+        # Count before responding, so the stats are complete once the client has the response
+        mock._record(method, self.path, len(content), received)
+
+        self.send_response(status)
+        if content:
+            self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
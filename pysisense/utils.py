@@ -1,6 +1,26 @@
-import pandas as pd
-from pandas import json_normalize
 from datetime import datetime
+import importlib
+import logging
+import reprlib
+
+
+# pandas takes most of the SDK's import time, so it is loaded on first use (see __getattr__)
+_LAZY_ATTRIBUTES = {
+    'pd': ('pandas', None),
+    'json_normalize': ('pandas', 'json_normalize')
+}
+
+
+def __getattr__(name):
+    # Module-level attributes resolved on first access, so importing pysisense does not import pandas
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
 
 
 def convert_to_dataframe(data, logger=None):
@@ -16,6 +36,9 @@ def convert_to_dataframe(data, logger=None):
         DataFrame: A pandas DataFrame with the data flattened as much as possible,
                    or None if conversion fails.
     """
+    import pandas as pd
+    from pandas import json_normalize
+
     try:
         if isinstance(data, dict):
             df = json_normalize(data)
@@ -90,3 +113,73 @@ def convert_utc_to_local(utc_str):
         return local_time.strftime("%Y-%m-%d %H:%M:%S %Z")
     except Exception as e:
         return f"Invalid timestamp: {utc_str} - {str(e)}"
+
+
+class LogPayload:
+
+    # Default longest rendering of a payload in a log message; each client's logger applies
+    # its own 'logging.max_payload_chars' setting instead, see PayloadLoggerAdapter
+    max_chars = 2000
+
+    def __init__(self, payload, max_chars=None):
+        """
+        Wraps a request/response payload for logging. Pass it as a lazy logging argument,
+        e.g. logger.debug("Payload: %s", LogPayload(data)), so nothing is rendered when
+        the level is disabled, and at most max_chars characters are rendered when it is enabled.
+
+        Parameters:
+            payload: Any object, or a response object whose body is logged.
+            max_chars (int, optional): Maximum rendered length. Defaults to the cap of the logger the payload is
+                                       logged through, or to LogPayload.max_chars.
+        """
+        self.payload = payload
+        self.max_chars = max_chars
+
+
+    def __str__(self):
+        payload = self.payload
+        max_chars = self.max_chars or LogPayload.max_chars
+        content = getattr(payload, 'content', None)
+        if isinstance(content, bytes):
+            # Decode only the part of the body that will be shown
+            text = content[:max_chars + 1].decode('utf-8', errors='replace')
+            total = len(content)
+        else:
+            # reprlib bounds the work on large containers instead of building the full string first
+            limiter = reprlib.Repr()
+            limiter.maxlevel = 6
+            limiter.maxdict = limiter.maxlist = limiter.maxtuple = limiter.maxset = 100
+            limiter.maxstring = limiter.maxother = max_chars
+            text = payload if isinstance(payload, str) else limiter.repr(payload)
+            total = None
+
+        if len(text) > max_chars:
+            return f"{text[:max_chars]}... ({total} bytes total)" if total else f"{text[:max_chars]}... (truncated)"
+        return text
+
+
+class PayloadLoggerAdapter(logging.LoggerAdapter):
+
+    def __init__(self, logger, max_payload_chars=None):
+        """
+        Wraps a logger so the LogPayload arguments of its messages are capped at this client's limit.
+
+        Clients share the underlying logger (and its file), but each keeps its own 'logging.max_payload_chars',
+        so e.g. the source and target clients of a Migration can use different caps.
+
+        Parameters:
+            logger (logging.Logger): The logger to write to.
+            max_payload_chars (int, optional): Cap of LogPayload arguments without an explicit max_chars.
+                                               Defaults to LogPayload.max_chars.
+        """
+        super().__init__(logger, {})
+        self.max_payload_chars = int(max_payload_chars or LogPayload.max_chars)
+
+
+    def log(self, level, msg, *args, **kwargs):
+        # Payloads are only touched when the record is emitted, so disabled levels stay free
+        if self.isEnabledFor(level):
+            for arg in args:
+                if isinstance(arg, LogPayload) and arg.max_chars is None:
+                    arg.max_chars = self.max_payload_chars
+            self.logger.log(level, msg, *args, **kwargs)
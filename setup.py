@@ -19,6 +19,9 @@ setup(
         'pyyaml',
         'pandas'
     ],
+    extras_require={
+        'async': ['aiohttp>=3.8']
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',